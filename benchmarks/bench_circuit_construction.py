@@ -0,0 +1,67 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+
+
+class EarliestAppend:
+    """Benchmark appending operations one at a time with the EARLIEST strategy."""
+
+    params = [[2, 20], [1000, 10000]]
+    param_names = ['num_qubits', 'num_moments']
+
+    def setup(self, num_qubits, num_moments):
+        qubits = cirq.LineQubit.range(num_qubits)
+        # A deep chain on the first qubit followed by operations on the others,
+        # which each have to find their earliest moment behind the chain.
+        self.operations = [cirq.X(qubits[0])] * num_moments + [
+            cirq.Y(q) for q in qubits[1:] for _ in range(num_moments // 10)
+        ]
+        self.circuit = cirq.Circuit(self.operations)
+
+    def time_append_one_at_a_time(self, num_qubits, num_moments):
+        circuit = cirq.Circuit()
+        for op in self.operations:
+            circuit.append(op)
+
+    def time_next_moment_operating_on(self, num_qubits, num_moments):
+        qubit = cirq.LineQubit(num_qubits - 1)
+        for i in range(0, num_moments, 10):
+            self.circuit.next_moment_operating_on([qubit], i)
+
+
+class BulkConstruction:
+    """Benchmark building a circuit from a flat list of random operations."""
+
+    params = [[10, 100], [10_000, 1_000_000]]
+    param_names = ['num_qubits', 'num_operations']
+    timeout = 600
+
+    def setup(self, num_qubits, num_operations):
+        prng = np.random.RandomState(0)
+        qubits = cirq.LineQubit.range(num_qubits)
+        pairs = prng.randint(num_qubits - 1, size=num_operations)
+        self.operations = [
+            cirq.CZ(qubits[i], qubits[i + 1]) if prng.rand() < 0.3 else cirq.X(qubits[i])
+            for i in pairs
+        ]
+
+    def time_constructor(self, num_qubits, num_operations):
+        cirq.Circuit(self.operations)
+
+    def time_append(self, num_qubits, num_operations):
+        circuit = cirq.Circuit()
+        circuit.append(self.operations)
@@ -0,0 +1,92 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+
+import cirq
+import cirq_google
+
+
+class OptimizationPipeline:
+    """Benchmark compiling a random circuit to CZ and PhasedXZ gates."""
+
+    params = [100, 1000]
+    param_names = ['num_moments']
+
+    def setup(self, num_moments):
+        qubits = cirq.GridQubit.rect(3, 4)
+        self.circuit = cirq.testing.random_circuit(
+            qubits,
+            n_moments=num_moments,
+            op_density=0.8,
+            gate_domain={cirq.CZ: 2, cirq.ISWAP: 2, cirq.X: 1, cirq.H: 1, cirq.T: 1},
+            random_state=1,
+        )
+        self.pipeline = cirq.OptimizationPipeline(
+            [
+                cirq.ConvertToCzAndSingleGates(),
+                cirq.MergeInteractions(allow_partial_czs=False),
+                lambda circuit: cirq.merge_single_qubit_gates_into_phxz(circuit, 1e-5),
+                cirq.EjectPhasedPaulis().optimize_circuit,
+                cirq.EjectZ().optimize_circuit,
+                cirq.DropNegligible().optimize_circuit,
+            ]
+        )
+
+    def time_optimize(self, num_moments):
+        self.pipeline(self.circuit)
+
+
+class OptimizedForSycamore:
+    """Benchmark compiling a random circuit with `cirq_google.optimized_for_sycamore`."""
+
+    params = [['sqrt_iswap', 'sycamore', 'xmon']]
+    param_names = ['optimizer_type']
+    timeout = 300
+
+    def setup(self, optimizer_type):
+        qubits = cirq.GridQubit.rect(3, 4)
+        self.circuit = cirq.testing.random_circuit(
+            qubits,
+            n_moments=500,
+            op_density=0.8,
+            gate_domain={cirq.CZ: 2, cirq.ISWAP: 2, cirq.X: 1, cirq.H: 1, cirq.T: 1},
+            random_state=1,
+        )
+
+    def time_optimized_for_sycamore(self, optimizer_type):
+        cirq_google.optimized_for_sycamore(self.circuit, optimizer_type=optimizer_type)
+
+
+class LayeredTwoQubitCompilation:
+    """Benchmark merging the interactions of a circuit of repeated layers."""
+
+    params = [[False, True]]
+    param_names = ['cached']
+
+    def setup(self, cached):
+        qubits = cirq.LineQubit.range(8)
+        phxz = cirq.PhasedXZGate(x_exponent=0.2, z_exponent=0.1, axis_phase_exponent=0)
+        layer = cirq.Circuit(
+            [cirq.ISWAP(a, b) ** 0.3 for a, b in zip(qubits[::2], qubits[1::2])],
+            [cirq.CZ(a, b) ** 0.4 for a, b in zip(qubits[1::2], qubits[2::2])],
+            phxz.on_each(qubits),
+        )
+        self.circuit = layer * 20
+        self.cached = cached
+
+    def time_merge_interactions(self, cached):
+        circuit = self.circuit.copy()
+        with cirq.TwoQubitCompileCache() if self.cached else contextlib.nullcontext():
+            cirq.MergeInteractions(allow_partial_czs=True).optimize_circuit(circuit)
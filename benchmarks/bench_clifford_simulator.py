@@ -0,0 +1,40 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cirq
+
+
+class CliffordSimulation:
+    """Benchmark running a large GHZ-style Clifford circuit with measurements.
+
+    Compares the CH-form state of `cirq.CliffordSimulator` with the packed
+    uint64 tableau selected by `packed_tableau=True`.
+    """
+
+    params = [[100, 1000], [False, True]]
+    param_names = ['num_qubits', 'packed_tableau']
+    timeout = 300
+
+    def setup(self, num_qubits, packed_tableau):
+        qubits = cirq.LineQubit.range(num_qubits)
+        self.circuit = cirq.Circuit(
+            cirq.H(qubits[0]),
+            [cirq.CNOT(a, b) for a, b in zip(qubits, qubits[1:])],
+            cirq.H.on_each(*qubits[::2]),
+            cirq.measure_each(*qubits),
+        )
+        self.simulator = cirq.CliffordSimulator(seed=1234, packed_tableau=packed_tableau)
+
+    def time_run(self, num_qubits, packed_tableau):
+        self.simulator.run(self.circuit)
@@ -42,3 +42,22 @@ time_kak_decomposition.params = [  # type: ignore
     + [cirq.testing.random_unitary(4) for _ in range(10)]
 ]
 time_kak_decomposition.param_names = ["gate"]  # type: ignore
+
+
+class BatchedKakDecomposition:
+    """Benchmark decomposing many random two-qubit unitaries."""
+
+    params = [[10, 1000]]
+    param_names = ['num_unitaries']
+
+    def setup(self, num_unitaries):
+        self.unitaries = np.array(
+            [cirq.testing.random_unitary(4, random_state=i) for i in range(num_unitaries)]
+        )
+
+    def time_kak_decomposition(self, num_unitaries):
+        for unitary in self.unitaries:
+            cirq.kak_decomposition(unitary)
+
+    def time_batched_kak_decomposition(self, num_unitaries):
+        cirq.batched_kak_decomposition(self.unitaries)
@@ -0,0 +1,46 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cirq
+
+
+class NoisySimulation:
+    """Benchmark simulating a circuit with depolarizing noise on every qubit.
+
+    The parallel noise model applies the noise of each moment as a single
+    operation, which the simulators apply to all of its qubits at once.
+    """
+
+    params = [['state_vector', 'density_matrix'], [False, True]]
+    param_names = ['simulator', 'parallel']
+    timeout = 300
+
+    def setup(self, simulator, parallel):
+        qubits = cirq.LineQubit.range(10)
+        self.circuit = cirq.testing.random_circuit(
+            qubits, n_moments=20, op_density=0.8, random_state=1234
+        )
+        self.circuit.append(cirq.measure(*qubits, key='m'))
+        noise = cirq.ConstantQubitNoiseModel(cirq.depolarize(1e-2), parallel=parallel)
+        if simulator == 'state_vector':
+            self.simulator = cirq.Simulator(noise=noise, split_untangled_states=False, seed=1234)
+            self.repetitions = 100
+        else:
+            self.simulator = cirq.DensityMatrixSimulator(
+                noise=noise, split_untangled_states=False, seed=1234
+            )
+            self.repetitions = 1
+
+    def time_run(self, simulator, parallel):
+        self.simulator.run(self.circuit, repetitions=self.repetitions)
@@ -0,0 +1,47 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sympy
+
+import cirq
+
+
+class ParameterResolution:
+    """Benchmark resolving a parameterized ansatz over a sweep."""
+
+    params = [[100, 500], [100, 1000]]
+    param_names = ['num_gates', 'sweep_length']
+
+    def setup(self, num_gates, sweep_length):
+        qubits = cirq.LineQubit.range(10)
+        symbols = sympy.symbols('t:20')
+        self.circuit = cirq.Circuit(
+            cirq.rx(2 * symbols[i % 20] + 0.1).on(qubits[i % 10]) for i in range(num_gates)
+        )
+        self.sweep = cirq.Zip(
+            *(cirq.Linspace(symbol, start=0, stop=1, length=sweep_length) for symbol in symbols)
+        )
+
+    def time_transform_sweep(self, num_gates, sweep_length):
+        _, expr_map = cirq.flatten(self.circuit)
+        expr_map.transform_sweep(self.sweep)
+
+    def time_resolve_flattened(self, num_gates, sweep_length):
+        circuit, sweep = cirq.flatten_with_sweep(self.circuit, self.sweep)
+        for resolver in sweep:
+            cirq.resolve_parameters(circuit, resolver)
+
+    def time_resolve_unflattened(self, num_gates, sweep_length):
+        for resolver in self.sweep:
+            cirq.resolve_parameters(self.circuit, resolver)
@@ -0,0 +1,73 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+
+
+class PauliSumExpectation:
+    """Benchmark expectation values of a many-term PauliSum."""
+
+    params = [[10, 14], [100, 1000]]
+    param_names = ['num_qubits', 'num_terms']
+
+    def setup(self, num_qubits, num_terms):
+        prng = np.random.RandomState(0)
+        qubits = cirq.LineQubit.range(num_qubits)
+        paulis = [cirq.X, cirq.Y, cirq.Z]
+        self.pauli_sum = cirq.PauliSum.from_pauli_strings(
+            [
+                cirq.PauliString(
+                    {q: paulis[prng.randint(3)] for q in qubits if prng.rand() < 0.3},
+                    prng.randn(),
+                )
+                for _ in range(num_terms)
+            ]
+        )
+        self.qubit_map = {q: i for i, q in enumerate(qubits)}
+        self.compiled = self.pauli_sum.compile(self.qubit_map)
+        self.states = np.array(
+            [
+                cirq.testing.random_superposition(2 ** num_qubits, random_state=prng)
+                for _ in range(16)
+            ]
+        )
+
+    def time_expectation_from_state_vector(self, num_qubits, num_terms):
+        self.pauli_sum.expectation_from_state_vector(self.states[0], self.qubit_map)
+
+    def time_compiled_expectation_from_state_vectors(self, num_qubits, num_terms):
+        self.compiled.expectation_from_state_vectors(self.states)
+
+
+class PauliSumSparseMatrix:
+    """Benchmark sparse and matrix-free forms of a transverse-field Ising Hamiltonian."""
+
+    params = [14, 18]
+    param_names = ['num_qubits']
+
+    def setup(self, num_qubits):
+        qubits = cirq.LineQubit.range(num_qubits)
+        self.pauli_sum = cirq.PauliSum.from_pauli_strings(
+            [cirq.Z(a) * cirq.Z(b) for a, b in zip(qubits, qubits[1:])]
+            + [cirq.X(q) * 0.5 for q in qubits]
+        )
+        self.vector = cirq.testing.random_superposition(2 ** num_qubits, random_state=0)
+
+    def time_sparse_matrix(self, num_qubits):
+        self.pauli_sum.copy().sparse_matrix()
+
+    def time_linear_operator_matvec(self, num_qubits):
+        self.pauli_sum.copy().linear_operator().matvec(self.vector)
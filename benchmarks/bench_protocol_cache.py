@@ -0,0 +1,41 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+
+import cirq
+
+
+class RepeatedUnitaries:
+    """Benchmark computing the unitaries of a few distinct gates many times."""
+
+    params = [[False, True]]
+    param_names = ['cached']
+
+    def setup(self, cached):
+        qubits = cirq.LineQubit.range(2)
+        gates = [
+            cirq.PhasedXZGate(x_exponent=0.1 * i, z_exponent=0.2, axis_phase_exponent=0.3)
+            for i in range(5)
+        ]
+        self.operations = [gate.on(qubits[0]) for gate in gates] + [
+            cirq.FSimGate(theta=0.1 * i, phi=0.2).on(*qubits) for i in range(3)
+        ]
+        self.cached = cached
+
+    def time_unitary(self, cached):
+        with cirq.ProtocolCache() if self.cached else contextlib.nullcontext():
+            for _ in range(1000):
+                for op in self.operations:
+                    cirq.unitary(op)
@@ -0,0 +1,47 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+
+
+class SimulatorDtype:
+    """Benchmark the memory and time of cirq.Simulator by dtype.
+
+    The peak memory of a complex64 simulation should be about half that of a
+    complex128 one once the state vector dominates the footprint of the
+    process, i.e. from about 24 qubits.
+    """
+
+    params = [[20, 24], ['complex64', 'complex128'], [False, True]]
+    param_names = ['num_qubits', 'dtype', 'noisy']
+    timeout = 300
+
+    def setup(self, num_qubits, dtype, noisy):
+        qubits = cirq.LineQubit.range(num_qubits)
+        self.circuit = cirq.Circuit(
+            cirq.H.on_each(*qubits),
+            cirq.testing.random_circuit(qubits, n_moments=10, op_density=1, random_state=1234),
+        )
+        noise = cirq.depolarize(1e-3) if noisy else None
+        self.simulator = cirq.Simulator(
+            dtype=np.dtype(dtype).type, noise=noise, split_untangled_states=False, seed=1234
+        )
+
+    def peakmem_simulate(self, num_qubits, dtype, noisy):
+        self.simulator.simulate(self.circuit)
+
+    def time_simulate(self, num_qubits, dtype, noisy):
+        self.simulator.simulate(self.circuit)
@@ -0,0 +1,61 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+
+
+class StateVectorKernels:
+    """Benchmark applying diagonal and permutation gates to a state vector.
+
+    These gates are applied by in-place kernels that do not use the
+    `available_buffer` of `cirq.ActOnStateVectorArgs`, so the first and last
+    qubits are both included to cover contiguous and strided access.
+    """
+
+    params = [
+        [20, 24],
+        ['X', 'Z', 'S', 'CZ', 'CZ**0.5', 'CNOT', 'SWAP'],
+        ['first', 'last'],
+    ]
+    param_names = ['num_qubits', 'gate', 'position']
+
+    gates = {
+        'X': cirq.X,
+        'Z': cirq.Z,
+        'S': cirq.S,
+        'CZ': cirq.CZ,
+        'CZ**0.5': cirq.CZ ** 0.5,
+        'CNOT': cirq.CNOT,
+        'SWAP': cirq.SWAP,
+    }
+
+    def setup(self, num_qubits, gate, position):
+        qubits = cirq.LineQubit.range(num_qubits)
+        g = self.gates[gate]
+        targets = qubits[: g.num_qubits()] if position == 'first' else qubits[-g.num_qubits() :]
+        self.op = g.on(*targets)
+        state = np.zeros((2,) * num_qubits, dtype=np.complex64)
+        state[(0,) * num_qubits] = 1
+        self.args = cirq.ActOnStateVectorArgs(
+            target_tensor=state,
+            available_buffer=np.empty_like(state),
+            prng=np.random.RandomState(),
+            log_of_measurement_results={},
+            qubits=qubits,
+        )
+
+    def time_act_on(self, num_qubits, gate, position):
+        cirq.act_on(self.op, self.args)
@@ -71,6 +71,8 @@ from cirq.circuits import (
     CircuitOperation,
     FrozenCircuit,
     InsertStrategy,
+    OptimizationPipeline,
+    OptimizationStageReport,
     PointOptimizationSummary,
     PointOptimizer,
     QasmOutput,
@@ -127,6 +129,8 @@ from cirq.linalg import (
     apply_matrix_to_slices,
     axis_angle,
     AxisAngleDecomposition,
+    batched_kak_decomposition,
+    BatchedKakDecomposition,
     bidiagonalize_real_matrix_pair_with_symmetric_products,
     bidiagonalize_unitary_with_special_orthogonals,
     block_diag,
@@ -191,6 +195,7 @@ from cirq.ops import (
     CCNotPowGate,
     CNOT,
     CNotPowGate,
+    CompiledPauliSum,
     ControlledGate,
     ControlledOperation,
     cphase,
@@ -346,6 +351,8 @@ from cirq.optimizers import (
     single_qubit_op_to_framed_phase_form,
     stratified_circuit,
     SynchronizeTerminalMeasurements,
+    TwoQubitCompileCache,
+    TwoQubitCompileCacheInfo,
     two_qubit_matrix_to_operations,
     two_qubit_matrix_to_diagonal_and_operations,
     two_qubit_matrix_to_sqrt_iswap_operations,
@@ -368,6 +375,7 @@ from cirq.qis import (
     operation_to_channel_matrix,
     operation_to_choi,
     operation_to_superoperator,
+    PackedCliffordTableau,
     QUANTUM_STATE_LIKE,
     QuantumState,
     quantum_state,
@@ -403,6 +411,7 @@ from cirq.sim import (
     final_density_matrix,
     final_state_vector,
     OperationTarget,
+    PauliFrameSampler,
     sample,
     sample_density_matrix,
     sample_state_vector,
@@ -530,6 +539,8 @@ from cirq.protocols import (
     pauli_expansion,
     phase_by,
     pow,
+    ProtocolCache,
+    ProtocolCacheInfo,
     qasm,
     QasmArgs,
     qid_shape,
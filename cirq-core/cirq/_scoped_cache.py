@@ -0,0 +1,98 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Size-bounded LRU caches that are active within `with` blocks."""
+
+import collections
+import contextvars
+from typing import Any, Callable, List, Optional, TypeVar
+
+T = TypeVar('T')
+TCache = TypeVar('TCache', bound='ScopedLruCache')
+
+
+class ScopedLruCache:
+    """Base class of LRU caches that are activated by `with` blocks.
+
+    Entering a cache makes it the value of the subclass's `_active` context
+    variable until the block exits, so blocks may nest and a cache may be
+    entered again later. Code that wants memoization reads the context
+    variable and calls `_lookup` on the active cache, if any.
+
+    Once more than `maxsize` results are held, the least recently used one is
+    evicted. Subclasses may override `_compute_missing` to find results that
+    are not held in memory elsewhere before computing them.
+    """
+
+    _active: 'contextvars.ContextVar[Optional[Any]]'
+
+    def __init__(self, maxsize: int) -> None:
+        """Inits ScopedLruCache.
+
+        Args:
+            maxsize: The maximum number of results to hold in memory.
+
+        Raises:
+            ValueError: `maxsize` is negative.
+        """
+        if maxsize < 0:
+            raise ValueError(f'maxsize must be non-negative, was {maxsize}.')
+        self._maxsize = maxsize
+        self._results: 'collections.OrderedDict[Any, Any]' = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._tokens: List[contextvars.Token] = []
+
+    def __enter__(self: TCache) -> TCache:
+        self._tokens.append(self._active.set(self))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._active.reset(self._tokens.pop())
+
+    def clear(self) -> None:
+        """Removes all results held in memory and resets the statistics."""
+        self._results.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _compute_missing(self, key: Any, compute: Callable[[], T]) -> T:
+        """Returns the result for a key that is not held in memory."""
+        self._misses += 1
+        return compute()
+
+    def _lookup(
+        self, key: Any, compute: Callable[[], T], copy: Optional[Callable[[T], T]] = None
+    ) -> T:
+        """Returns the result for the key, computing and holding it if needed.
+
+        Args:
+            key: The key of the result. Unhashable keys are never cached.
+            compute: Computes the result.
+            copy: Copies results, so that held results are never handed out.
+        """
+        try:
+            result = self._results[key]
+        except KeyError:
+            result = self._compute_missing(key, compute)
+            if self._maxsize:
+                self._results[key] = result if copy is None else copy(result)
+                if len(self._results) > self._maxsize:
+                    self._results.popitem(last=False)
+            return result
+        except TypeError:
+            return compute()
+        self._hits += 1
+        self._results.move_to_end(key)
+        return result if copy is None else copy(result)
@@ -49,3 +49,8 @@ from cirq.circuits.optimization_pass import (
     PointOptimizer,
     PointOptimizationSummary,
 )
+
+from cirq.circuits.optimization_pipeline import (
+    OptimizationPipeline,
+    OptimizationStageReport,
+)
@@ -0,0 +1,192 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import operator
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+    overload,
+)
+
+import numpy as np
+
+from cirq import ops
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class CompactMoments(Sequence['cirq.Moment']):
+    """An immutable sequence of moments stored as NumPy columns.
+
+    Qubits and gates are interned into tables, and every operation is recorded
+    as integer indices into those tables, so a stored operation costs a few
+    bytes rather than several Python objects. `cirq.Moment`s and their
+    operations are rebuilt from the columns whenever they are accessed and are
+    not retained afterwards.
+
+    Attributes:
+        qubits: The distinct qubits acted on, in order of first appearance.
+        entries: The interned gates of operations that are rebuilt exactly by
+            applying their gate to their qubits, such as untagged
+            `cirq.GateOperation`s. Any other operation is interned whole.
+        operation_entries: For each operation, the index of its entry.
+        operation_offsets: The qubits of operation `i` are
+            `qubit_indices[operation_offsets[i]:operation_offsets[i + 1]]`.
+        qubit_indices: Indices into `qubits` of the qubits of each operation,
+            concatenated.
+        moment_offsets: The operations of moment `m` are those with indices in
+            `range(moment_offsets[m], moment_offsets[m + 1])`.
+    """
+
+    def __init__(self, moments: Iterable['cirq.Moment']) -> None:
+        """Stores the given moments in columnar form.
+
+        Args:
+            moments: The moments to store.
+        """
+        qubit_ids: Dict['cirq.Qid', int] = {}
+        entry_ids: Dict[Tuple[type, Any, str], int] = {}
+        # The entry ids of objects already seen, keeping the objects alive.
+        ids_by_identity: Dict[int, Tuple[Any, int]] = {}
+        entries: List[Union['cirq.Gate', 'cirq.Operation']] = []
+        operation_entries: List[int] = []
+        operation_offsets = [0]
+        qubit_indices: List[int] = []
+        moment_offsets = [0]
+        # Whether gate.on(*qubits) rebuilds an operation, by operation and gate type.
+        rebuilds_by_type: Dict[Tuple[type, type], bool] = {}
+        for moment in moments:
+            for op in moment.operations:
+                entry = op if op.gate is None else op.gate
+                if entry is not op:
+                    type_key = (type(op), type(entry))
+                    if type_key not in rebuilds_by_type:
+                        rebuilds_by_type[type_key] = type(entry.on(*op.qubits)) is type(op)
+                    if not rebuilds_by_type[type_key]:
+                        entry = op
+                seen = ids_by_identity.get(id(entry))
+                if seen is not None:
+                    entry_id = seen[1]
+                else:
+                    # Equal entries can still differ, e.g. X**0 == X**2, so they
+                    # are only merged if their reprs match too.
+                    key = (type(entry), entry, repr(entry))
+                    try:
+                        entry_id = entry_ids.setdefault(key, len(entries))
+                    except TypeError:
+                        # Unhashable entries are stored without interning.
+                        entry_id = len(entries)
+                    ids_by_identity[id(entry)] = (entry, entry_id)
+                if entry_id == len(entries):
+                    entries.append(entry)
+                operation_entries.append(entry_id)
+                for q in op.qubits:
+                    qubit_indices.append(qubit_ids.setdefault(q, len(qubit_ids)))
+                operation_offsets.append(len(qubit_indices))
+            moment_offsets.append(len(operation_entries))
+
+        self.qubits: Tuple['cirq.Qid', ...] = tuple(qubit_ids)
+        self.entries: Tuple[Union['cirq.Gate', 'cirq.Operation'], ...] = tuple(entries)
+        self.operation_entries = np.array(operation_entries, dtype=np.int32)
+        self.operation_offsets = np.array(operation_offsets, dtype=np.int64)
+        self.qubit_indices = np.array(qubit_indices, dtype=np.int32)
+        self.moment_offsets = np.array(moment_offsets, dtype=np.int64)
+        self._hash: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.moment_offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> 'cirq.Moment':
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> Tuple['cirq.Moment', ...]:
+        pass
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self._moment(i) for i in range(len(self))[index])
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('moment index out of range')
+        return self._moment(index)
+
+    def __iter__(self) -> Iterator['cirq.Moment']:
+        for i in range(len(self)):
+            yield self._moment(i)
+
+    def __eq__(self, other):
+        if not isinstance(other, (tuple, CompactMoments)):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        # Hashes like the tuple of its moments, so that compact and regular
+        # frozen circuits that compare equal also hash equal.
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __getstate__(self):
+        # Don't save hash when pickling; see #3777.
+        state = self.__dict__.copy()
+        state['_hash'] = None
+        return state
+
+    def all_qubits(self) -> FrozenSet['cirq.Qid']:
+        """Returns the qubits acted on by any of the stored operations."""
+        return frozenset(self.qubits)
+
+    def qubit_moment_indices(self) -> Dict['cirq.Qid', List[int]]:
+        """Returns, for each qubit, the sorted indices of the moments acting on it."""
+        moment_of_operation = np.repeat(np.arange(len(self)), np.diff(self.moment_offsets))
+        operation_of_qubit = np.repeat(
+            np.arange(len(self.operation_entries)), np.diff(self.operation_offsets)
+        )
+        moment_of_qubit = moment_of_operation[operation_of_qubit]
+        order = np.lexsort((moment_of_qubit, self.qubit_indices))
+        counts = np.bincount(self.qubit_indices, minlength=len(self.qubits))
+        groups = np.split(moment_of_qubit[order], np.cumsum(counts)[:-1])
+        return {q: group.tolist() for q, group in zip(self.qubits, groups)}
+
+    def _moment(self, index: int) -> 'cirq.Moment':
+        start, end = self.moment_offsets[index : index + 2].tolist()
+        entry_ids = self.operation_entries[start:end].tolist()
+        offsets = self.operation_offsets[start : end + 1].tolist()
+        qubit_indices = self.qubit_indices[offsets[0] : offsets[-1]].tolist()
+        base = offsets[0]
+        operations = []
+        for k, entry_id in enumerate(entry_ids):
+            entry = self.entries[entry_id]
+            if isinstance(entry, ops.Operation):
+                operations.append(entry)
+            else:
+                qubits = [
+                    self.qubits[j] for j in qubit_indices[offsets[k] - base : offsets[k + 1] - base]
+                ]
+                operations.append(entry.on(*qubits))
+        return ops.Moment(operations)
@@ -0,0 +1,91 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.circuits._compact_moments import CompactMoments
+
+
+def test_round_trip():
+    a, b, c = cirq.LineQubit.range(3)
+    moments = (
+        cirq.Moment([cirq.H(a), cirq.CZ(b, c)]),
+        cirq.Moment(),
+        cirq.Moment([cirq.X(a).with_tags('tag'), cirq.MatrixGate(np.eye(2)).on(c)]),
+        cirq.Moment([cirq.measure(a, b, c, key='m')]),
+    )
+    compact = CompactMoments(moments)
+
+    assert len(compact) == 4
+    assert tuple(compact) == moments
+    assert compact[2] == moments[2]
+    assert compact[-1] == moments[-1]
+    assert compact[np.int64(0)] == moments[0]
+    assert compact[1:3] == moments[1:3]
+    assert compact == moments
+    assert compact == CompactMoments(moments)
+    assert compact != moments[:2]
+    assert compact != list(moments)
+    assert hash(compact) == hash(moments)
+    assert pickle.loads(pickle.dumps(compact))._hash is None
+    with pytest.raises(IndexError):
+        _ = compact[4]
+
+
+def test_interns_qubits_and_gates():
+    a, b = cirq.LineQubit.range(2)
+    compact = CompactMoments(cirq.Moment([cirq.X(q)]) for q in [a, b, a, b])
+
+    assert compact.qubits == (a, b)
+    assert compact.entries == (cirq.X,)
+    np.testing.assert_array_equal(compact.operation_entries, [0, 0, 0, 0])
+    np.testing.assert_array_equal(compact.qubit_indices, [0, 1, 0, 1])
+    np.testing.assert_array_equal(compact.operation_offsets, [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(compact.moment_offsets, [0, 1, 2, 3, 4])
+
+
+def test_keeps_equal_gates_of_different_types_apart():
+    q = cirq.LineQubit(0)
+    moments = (cirq.Moment([cirq.rx(np.pi).on(q)]), cirq.Moment([cirq.XPowGate(exponent=1).on(q)]))
+    compact = CompactMoments(moments)
+
+    assert [type(op.gate) for m in compact for op in m] == [cirq.Rx, cirq.XPowGate]
+
+
+def test_keeps_equal_gates_with_different_reprs_apart():
+    q = cirq.LineQubit(0)
+    moments = tuple(cirq.Moment([gate.on(q)]) for gate in [cirq.X ** 0, cirq.X ** 2, cirq.X ** 0])
+    compact = CompactMoments(moments)
+
+    assert cirq.X ** 0 == cirq.X ** 2
+    assert compact.entries == (cirq.X ** 0, cirq.X ** 2)
+    np.testing.assert_array_equal(compact.operation_entries, [0, 1, 0])
+    assert [repr(m) for m in compact] == [repr(m) for m in moments]
+    circuit = cirq.FrozenCircuit(moments)
+    assert cirq.to_json(circuit.compact()) == cirq.to_json(circuit)
+
+
+def test_qubit_moment_indices():
+    circuit = cirq.testing.random_circuit(
+        cirq.LineQubit.range(5), n_moments=15, op_density=0.5, random_state=1
+    )
+    compact = CompactMoments(circuit)
+
+    assert compact.all_qubits() == circuit.all_qubits()
+    assert compact.qubit_moment_indices() == circuit._qubit_moment_indices()
+    assert CompactMoments(()).qubit_moment_indices() == {}
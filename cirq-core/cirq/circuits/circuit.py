@@ -20,7 +20,9 @@ Moment the Operations must all act on distinct Qubits.
 """
 
 import abc
+import bisect
 import enum
+import hashlib
 import html
 import math
 from collections import defaultdict
@@ -154,6 +156,30 @@ class AbstractCircuit(abc.ABC):
             return NotImplemented
         return tuple(self.moments) == tuple(other.moments) and self.device == other.device
 
+    def fingerprint(self) -> str:
+        """Returns a digest of the `repr`s of the circuit's device and operations.
+
+        The fingerprint is a SHA-256 hex digest of the `repr`s of the device
+        and of the operations in each moment, ordered by qubit as in moment
+        equality. Unlike `hash`, it does not depend on the process or its hash
+        seed, so it can key caches shared between processes or stored on disk,
+        provided that the reprs of the device and operations round-trip, i.e.
+        that `eval(repr(op))` gives an equal operation.
+
+        Fingerprints are not valid keys for circuits containing operations
+        without such a faithful repr. The default `object.__repr__` includes a
+        memory address, so it differs between processes and even between
+        equal instances, and a repr that omits part of the value can give
+        unequal circuits the same fingerprint. Conversely, equal circuits can
+        fingerprint differently when equal operations have different reprs,
+        such as gates whose exponents differ by a period.
+        """
+        digest = hashlib.sha256()
+        digest.update(hashlib.sha256(repr(self.device).encode()).digest())
+        for moment in self.moments:
+            digest.update(moment._fingerprint())
+        return digest.hexdigest()
+
     def _approx_eq_(self, other: Any, atol: Union[int, float]) -> bool:
         """See `cirq.protocols.SupportsApproximateEquality`."""
         if not isinstance(other, AbstractCircuit):
@@ -257,14 +283,46 @@ class AbstractCircuit(abc.ABC):
             + '</pre>'
         )
 
+    def _qubit_moment_indices(self) -> Dict['cirq.Qid', List[int]]:
+        """Returns, for each qubit, the sorted indices of the moments acting on it.
+
+        Qubits that no moment acts on are absent from the result.
+        """
+        indices: Dict['cirq.Qid', List[int]] = defaultdict(list)
+        for i, moment in enumerate(self.moments):
+            for q in moment.qubits:
+                indices[q].append(i)
+        return dict(indices)
+
     def _first_moment_operating_on(
-        self, qubits: Iterable['cirq.Qid'], indices: Iterable[int]
+        self, qubits: Iterable['cirq.Qid'], start: int, end: int
     ) -> Optional[int]:
-        qubits = frozenset(qubits)
-        for m in indices:
-            if self._has_op_at(m, qubits):
-                return m
-        return None
+        """Returns the first index in [start, end) of a moment acting on qubits."""
+        qubit_moments = self._qubit_moment_indices()
+        first = None
+        for q in set(qubits):
+            indices = qubit_moments.get(q)
+            if not indices:
+                continue
+            i = bisect.bisect_left(indices, start)
+            if i < len(indices) and indices[i] < end and (first is None or indices[i] < first):
+                first = indices[i]
+        return first
+
+    def _last_moment_operating_on(
+        self, qubits: Iterable['cirq.Qid'], start: int, end: int
+    ) -> Optional[int]:
+        """Returns the last index in [start, end) of a moment acting on qubits."""
+        qubit_moments = self._qubit_moment_indices()
+        last = None
+        for q in set(qubits):
+            indices = qubit_moments.get(q)
+            if not indices:
+                continue
+            i = bisect.bisect_left(indices, end) - 1
+            if i >= 0 and indices[i] >= start and (last is None or indices[i] > last):
+                last = indices[i]
+        return last
 
     def next_moment_operating_on(
         self, qubits: Iterable['cirq.Qid'], start_moment_index: int = 0, max_distance: int = None
@@ -293,7 +351,7 @@ class AbstractCircuit(abc.ABC):
             max_distance = min(max_distance, max_circuit_distance)
 
         return self._first_moment_operating_on(
-            qubits, range(start_moment_index, start_moment_index + max_distance)
+            qubits, max(start_moment_index, 0), start_moment_index + max_distance
         )
 
     def next_moments_operating_on(
@@ -359,8 +417,8 @@ class AbstractCircuit(abc.ABC):
         if max_distance <= 0:
             return None
 
-        return self._first_moment_operating_on(
-            qubits, (end_moment_index - k - 1 for k in range(max_distance))
+        return self._last_moment_operating_on(
+            qubits, end_moment_index - max_distance, end_moment_index
         )
 
     def reachable_frontier_from(
@@ -1210,6 +1268,46 @@ class AbstractCircuit(abc.ABC):
     def _parameter_names_(self) -> AbstractSet[str]:
         return {name for op in self.all_operations() for name in protocols.parameter_names(op)}
 
+    def _parameterized_positions(self) -> List[Tuple[int, int]]:
+        """Returns the (moment index, operation index) pairs of parameterized operations."""
+        return [
+            (i, j)
+            for i, moment in enumerate(self.moments)
+            for j, op in enumerate(moment.operations)
+            if protocols.is_parameterized(op)
+        ]
+
+    def parameter_positions(self) -> Dict[str, Tuple[Tuple[int, int], ...]]:
+        """Returns where each parameter of the circuit is used.
+
+        Returns:
+            A dictionary from the name of each parameter to the positions of
+            the operations that depend on it, as (moment index, operation
+            index within the moment) pairs in circuit order.
+        """
+        positions: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for i, j in self._parameterized_positions():
+            for name in protocols.parameter_names(self.moments[i].operations[j]):
+                positions[name].append((i, j))
+        return {name: tuple(name_positions) for name, name_positions in positions.items()}
+
+    def _resolve_parameters_(
+        self: CIRCUIT_TYPE, resolver: 'cirq.ParamResolver', recursive: bool
+    ) -> CIRCUIT_TYPE:
+        # Only the parameterized operations are rebuilt. Everything else,
+        # including whole moments without parameters, is shared with `self`.
+        resolved_moments = list(self.moments)
+        positions = self._parameterized_positions()
+        for i, group in groupby(positions, key=lambda position: position[0]):
+            operations = list(resolved_moments[i].operations)
+            for _, j in group:
+                operations[j] = protocols.resolve_parameters(operations[j], resolver, recursive)
+            new_moment = ops.Moment(operations)
+            self.device.validate_moment(new_moment)
+            self._validate_op_tree_qids(new_moment)
+            resolved_moments[i] = new_moment
+        return self._with_sliced_moments(resolved_moments)
+
     def _qasm_(self) -> str:
         return self.to_qasm()
 
@@ -1661,7 +1759,54 @@ class Circuit(AbstractCircuit):
         """
         self._moments: List['cirq.Moment'] = []
         self._device = device
-        self.append(contents, strategy=strategy)
+        # Lazily built by _qubit_moment_indices and valid only while it was
+        # built for the current `_moments` list with its current length.
+        self._qubit_moments: Optional[Dict['cirq.Qid', List[int]]] = None
+        self._indexed_moments: Optional[List['cirq.Moment']] = None
+        self._indexed_length = 0
+        if strategy == InsertStrategy.EARLIEST and device is devices.UNCONSTRAINED_DEVICE:
+            self._load_contents_with_earliest_strategy(contents)
+        else:
+            self.append(contents, strategy=strategy)
+
+    def _load_contents_with_earliest_strategy(self, contents: 'cirq.OP_TREE') -> None:
+        """Loads `contents` into an empty circuit with the EARLIEST strategy.
+
+        Produces the same moments as appending `contents` to an empty circuit
+        on an unconstrained device, but assigns every operation to a moment in
+        a single pass over per-qubit frontiers and constructs each moment once
+        instead of copying it for every operation added to it.
+        """
+        # The moment after the latest one that acts on each qubit.
+        frontier: Dict['cirq.Qid', int] = {}
+        # Moments given explicitly in `contents`, keyed by their index.
+        moments_by_index: Dict[int, 'cirq.Moment'] = {}
+        # Operations placed into each moment index, in insertion order.
+        ops_by_index: Dict[int, List['cirq.Operation']] = defaultdict(list)
+        length = 0
+        for moment_or_op in ops.flatten_to_ops_or_moments(contents):
+            self._validate_op_tree_qids(moment_or_op)
+            if isinstance(moment_or_op, ops.Moment):
+                moments_by_index[length] = moment_or_op
+                for q in moment_or_op.qubits:
+                    frontier[q] = length + 1
+                length += 1
+            else:
+                op = cast(ops.Operation, moment_or_op)
+                index = max((frontier.get(q, 0) for q in op.qubits), default=0)
+                ops_by_index[index].append(op)
+                for q in op.qubits:
+                    frontier[q] = index + 1
+                length = max(length, index + 1)
+
+        for i in range(length):
+            moment = moments_by_index.get(i)
+            if i not in ops_by_index:
+                self._moments.append(ops.Moment() if moment is None else moment)
+            elif moment is None:
+                self._moments.append(ops.Moment(ops_by_index[i]))
+            else:
+                self._moments.append(ops.Moment(moment.operations, ops_by_index[i]))
 
     @property
     def device(self) -> devices.Device:
@@ -1685,6 +1830,76 @@ class Circuit(AbstractCircuit):
         new_circuit._moments = list(moments)
         return new_circuit
 
+    def _qubit_moment_indices(self) -> Dict['cirq.Qid', List[int]]:
+        if not self._qubit_moment_indices_are_current():
+            self._qubit_moments = super()._qubit_moment_indices()
+            self._indexed_moments = self._moments
+            self._indexed_length = len(self._moments)
+        return cast(Dict['cirq.Qid', List[int]], self._qubit_moments)
+
+    def _qubit_moment_indices_are_current(self) -> bool:
+        return (
+            self._qubit_moments is not None
+            and self._indexed_moments is self._moments
+            and self._indexed_length == len(self._moments)
+        )
+
+    def _invalidate_qubit_moment_indices(self) -> None:
+        self._qubit_moments = None
+
+    def _insert_moment(self, index: int, moment: 'cirq.Moment') -> None:
+        """Inserts a moment, keeping the qubit index current."""
+        current = self._qubit_moment_indices_are_current()
+        self._moments.insert(index, moment)
+        if not current:
+            self._invalidate_qubit_moment_indices()
+            return
+        qubit_moments = cast(Dict['cirq.Qid', List[int]], self._qubit_moments)
+        if index < len(self._moments) - 1:
+            self._shift_qubit_moment_indices(index, 1)
+        else:
+            self._indexed_length += 1
+        for q in moment.qubits:
+            bisect.insort(qubit_moments.setdefault(q, []), index)
+
+    def _insert_empty_moments(self, index: int, count: int) -> None:
+        """Inserts empty moments, keeping the qubit index current."""
+        if count <= 0:
+            return
+        current = self._qubit_moment_indices_are_current()
+        self._moments[index:index] = [ops.Moment()] * count
+        if current:
+            self._shift_qubit_moment_indices(index, count)
+        else:
+            self._invalidate_qubit_moment_indices()
+
+    def _shift_qubit_moment_indices(self, index: int, count: int) -> None:
+        """Accounts in the qubit index for `count` moments inserted at `index`."""
+        for indices in cast(Dict['cirq.Qid', List[int]], self._qubit_moments).values():
+            k = bisect.bisect_left(indices, index)
+            if k < len(indices):
+                indices[k:] = [i + count for i in indices[k:]]
+        self._indexed_length += count
+
+    def _replace_moment(self, index: int, moment: 'cirq.Moment') -> None:
+        """Replaces the moment at a non-negative index, keeping the qubit index current."""
+        current = self._qubit_moment_indices_are_current()
+        old_moment = self._moments[index]
+        self._moments[index] = moment
+        if not current:
+            self._invalidate_qubit_moment_indices()
+            return
+        qubit_moments = cast(Dict['cirq.Qid', List[int]], self._qubit_moments)
+        for q in old_moment.qubits - moment.qubits:
+            indices = qubit_moments[q]
+            del indices[bisect.bisect_left(indices, index)]
+        for q in moment.qubits - old_moment.qubits:
+            bisect.insort(qubit_moments.setdefault(q, []), index)
+
+    def _add_operation_to_moment(self, index: int, op: 'cirq.Operation') -> None:
+        """Adds an operation to an existing moment, keeping the qubit index current."""
+        self._replace_moment(index, self._moments[index].with_operation(op))
+
     # pylint: disable=function-redefined
     @overload
     def __setitem__(self, key: int, value: 'cirq.Moment'):
@@ -1700,6 +1915,8 @@ class Circuit(AbstractCircuit):
                 raise TypeError('Can only assign Moments into Circuits.')
             self._device.validate_moment(value)
             self._validate_op_tree_qids(value)
+            self._replace_moment(range(len(self._moments))[key], value)
+            return
 
         if isinstance(key, slice):
             value = list(value)
@@ -1710,11 +1927,13 @@ class Circuit(AbstractCircuit):
                 self._validate_op_tree_qids(moment)
 
         self._moments[key] = value
+        self._invalidate_qubit_moment_indices()
 
     # pylint: enable=function-redefined
 
     def __delitem__(self, key: Union[int, slice]):
         del self._moments[key]
+        self._invalidate_qubit_moment_indices()
 
     def __iadd__(self, other):
         self.append(other)
@@ -1740,6 +1959,7 @@ class Circuit(AbstractCircuit):
         # Auto wrap OP_TREE inputs into a circuit.
         result = self.copy()
         result._moments[:0] = Circuit(other)._moments
+        result._invalidate_qubit_moment_indices()
         result._device.validate_circuit(result)
         return result
 
@@ -1750,6 +1970,7 @@ class Circuit(AbstractCircuit):
         if not isinstance(repetitions, (int, np.integer)):
             return NotImplemented
         self._moments *= int(repetitions)
+        self._invalidate_qubit_moment_indices()
         return self
 
     def __mul__(self, repetitions: INT_TYPE):
@@ -1860,15 +2081,12 @@ class Circuit(AbstractCircuit):
 
     # pylint: enable=missing-raises-doc
     def _prev_moment_available(self, op: 'cirq.Operation', end_moment_index: int) -> Optional[int]:
-        last_available = end_moment_index
-        k = end_moment_index
-        while k > 0:
-            k -= 1
-            if not self._can_commute_past(k, op):
-                return last_available
+        blocker = self._last_moment_operating_on(op.qubits, 0, end_moment_index)
+        start = 0 if blocker is None else blocker + 1
+        for k in range(start, end_moment_index):
             if self._can_add_op_at(k, op):
-                last_available = k
-        return last_available
+                return k
+        return end_moment_index
 
     def _pick_or_create_inserted_op_moment_index(
         self, splitter_index: int, op: 'cirq.Operation', strategy: 'cirq.InsertStrategy'
@@ -1889,7 +2107,7 @@ class Circuit(AbstractCircuit):
         """
 
         if strategy is InsertStrategy.NEW or strategy is InsertStrategy.NEW_THEN_INLINE:
-            self._moments.insert(splitter_index, ops.Moment())
+            self._insert_moment(splitter_index, ops.Moment())
             return splitter_index
 
         if strategy is InsertStrategy.INLINE:
@@ -1918,9 +2136,6 @@ class Circuit(AbstractCircuit):
             return True
         return self._device.can_add_operation_into_moment(operation, self._moments[moment_index])
 
-    def _can_commute_past(self, moment_index: int, operation: 'cirq.Operation') -> bool:
-        return not self._moments[moment_index].operates_on(operation.qubits)
-
     def insert(
         self,
         index: int,
@@ -1966,14 +2181,14 @@ class Circuit(AbstractCircuit):
         k = max(min(index if index >= 0 else len(self._moments) + index, len(self._moments)), 0)
         for moment_or_op in moments_and_operations:
             if isinstance(moment_or_op, ops.Moment):
-                self._moments.insert(k, moment_or_op)
+                self._insert_moment(k, moment_or_op)
                 k += 1
             else:
                 op = cast(ops.Operation, moment_or_op)
                 p = self._pick_or_create_inserted_op_moment_index(k, op, strategy)
                 while p >= len(self._moments):
-                    self._moments.append(ops.Moment())
-                self._moments[p] = self._moments[p].with_operation(op)
+                    self._insert_moment(len(self._moments), ops.Moment())
+                self._add_operation_to_moment(p, op)
                 self._device.validate_moment(self._moments[p])
                 k = max(k, p + 1)
                 if strategy is InsertStrategy.NEW_THEN_INLINE:
@@ -2014,7 +2229,7 @@ class Circuit(AbstractCircuit):
                 i += 1
             if i >= end:
                 break
-            self._moments[i] = self._moments[i].with_operation(op)
+            self._add_operation_to_moment(i, op)
             op_index += 1
 
         if op_index >= len(flat_ops):
@@ -2060,7 +2275,7 @@ class Circuit(AbstractCircuit):
         )
         if n_new_moments > 0:
             insert_index = min(late_frontier.values())
-            self._moments[insert_index:insert_index] = [ops.Moment()] * n_new_moments
+            self._insert_empty_moments(insert_index, n_new_moments)
             for q in update_qubits:
                 if early_frontier.get(q, 0) > insert_index:
                     early_frontier[q] += n_new_moments
@@ -2086,13 +2301,13 @@ class Circuit(AbstractCircuit):
         """
         if len(operations) != len(insertion_indices):
             raise ValueError('operations and insertion_indices must have the same length.')
-        self._moments += [ops.Moment() for _ in range(1 + max(insertion_indices) - len(self))]
+        self._insert_empty_moments(len(self), 1 + max(insertion_indices) - len(self))
         moment_to_ops = defaultdict(list)  # type: Dict[int, List['cirq.Operation']]
         for op_index, moment_index in enumerate(insertion_indices):
             moment_to_ops[moment_index].append(operations[op_index])
         for moment_index, new_ops in moment_to_ops.items():
-            self._moments[moment_index] = ops.Moment(
-                self._moments[moment_index].operations + tuple(new_ops)
+            self._replace_moment(
+                moment_index, ops.Moment(self._moments[moment_index].operations + tuple(new_ops))
             )
 
     # TODO(#3388) Add documentation for Raises.
@@ -2153,6 +2368,7 @@ class Circuit(AbstractCircuit):
             )
         self._device.validate_circuit(copy)
         self._moments = copy._moments
+        self._invalidate_qubit_moment_indices()
 
     def batch_replace(
         self, replacements: Iterable[Tuple[int, 'cirq.Operation', 'cirq.Operation']]
@@ -2178,6 +2394,7 @@ class Circuit(AbstractCircuit):
             )
         self._device.validate_circuit(copy)
         self._moments = copy._moments
+        self._invalidate_qubit_moment_indices()
 
     def batch_insert_into(self, insert_intos: Iterable[Tuple[int, 'cirq.OP_TREE']]) -> None:
         """Inserts operations into empty spaces in existing moments.
@@ -2201,6 +2418,7 @@ class Circuit(AbstractCircuit):
         self._device.validate_circuit(copy)
         self._validate_op_tree_qids(copy)
         self._moments = copy._moments
+        self._invalidate_qubit_moment_indices()
 
     def batch_insert(self, insertions: Iterable[Tuple[int, 'cirq.OP_TREE']]) -> None:
         """Applies a batched insert operation to the circuit.
@@ -2235,6 +2453,7 @@ class Circuit(AbstractCircuit):
             if next_index > insert_index:
                 shift += next_index - insert_index
         self._moments = copy._moments
+        self._invalidate_qubit_moment_indices()
 
     def append(
         self,
@@ -2264,16 +2483,7 @@ class Circuit(AbstractCircuit):
         qubits = frozenset(qubits)
         for k in moment_indices:
             if 0 <= k < len(self._moments):
-                self._moments[k] = self._moments[k].without_operations_touching(qubits)
-
-    def _resolve_parameters_(self, resolver: 'cirq.ParamResolver', recursive: bool) -> 'Circuit':
-        resolved_moments = []
-        for moment in self:
-            resolved_operations = _resolve_operations(moment.operations, resolver, recursive)
-            new_moment = ops.Moment(resolved_operations)
-            resolved_moments.append(new_moment)
-        resolved_circuit = Circuit(resolved_moments, device=self.device)
-        return resolved_circuit
+                self._replace_moment(k, self._moments[k].without_operations_touching(qubits))
 
     @property
     def moments(self):
@@ -2330,15 +2540,6 @@ def _pick_inserted_ops_moment_indices(
     return moment_indices, frontier
 
 
-def _resolve_operations(
-    operations: Iterable['cirq.Operation'], param_resolver: 'cirq.ParamResolver', recursive: bool
-) -> List['cirq.Operation']:
-    resolved_operations = []  # type: List['cirq.Operation']
-    for op in operations:
-        resolved_operations.append(protocols.resolve_parameters(op, param_resolver, recursive))
-    return resolved_operations
-
-
 def _get_moment_annotations(
     moment: 'cirq.Moment',
 ) -> Iterator['cirq.Operation']:
@@ -1278,6 +1278,142 @@ def test_prev_moment_operating_on_distance(circuit_cls):
         c.prev_moment_operating_on([a], 6, max_distance=-1)
 
 
+def _assert_qubit_moment_indices_current(circuit):
+    expected = {}
+    for i, moment in enumerate(circuit):
+        for q in moment.qubits:
+            expected.setdefault(q, []).append(i)
+    assert circuit._qubit_moment_indices() == expected
+
+
+def test_qubit_moment_indices_track_mutations():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.H(a), cirq.CNOT(a, b), cirq.X(c))
+    _assert_qubit_moment_indices_current(circuit)
+
+    circuit.append([cirq.Y(c), cirq.Z(a)])
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.append(cirq.Moment([cirq.X(b)]))
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.insert(1, cirq.Moment([cirq.Z(c)]))
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.insert(0, cirq.X(b), strategy=cirq.InsertStrategy.NEW)
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.insert_into_range([cirq.Y(c)], 0, len(circuit))
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.insert_at_frontier([cirq.X(a), cirq.X(b)], 1)
+    _assert_qubit_moment_indices_current(circuit)
+    # Pushes later moments back to make room.
+    circuit.insert_at_frontier([cirq.X(a)] * 3 + [cirq.CNOT(a, c)], 2)
+    _assert_qubit_moment_indices_current(circuit)
+    circuit[0] = cirq.Moment([cirq.X(c)])
+    _assert_qubit_moment_indices_current(circuit)
+    circuit[-1] = cirq.Moment([cirq.CZ(a, c)])
+    _assert_qubit_moment_indices_current(circuit)
+    del circuit[1]
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.batch_insert([(1, cirq.Z(b))])
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.batch_insert_into([(0, cirq.Z(a))])
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.batch_remove([(0, cirq.Z(a))])
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.batch_replace([(0, cirq.X(c), cirq.X(a))])
+    _assert_qubit_moment_indices_current(circuit)
+    circuit.clear_operations_touching([a], range(3))
+    _assert_qubit_moment_indices_current(circuit)
+    # Also clears the other qubits of the cleared operations.
+    circuit.clear_operations_touching([c], range(len(circuit) - 3, len(circuit) + 1))
+    _assert_qubit_moment_indices_current(circuit)
+    circuit *= 2
+    _assert_qubit_moment_indices_current(circuit)
+    circuit = cirq.Moment([cirq.Y(b)]) + circuit
+    _assert_qubit_moment_indices_current(circuit)
+    circuit._moments.append(cirq.Moment([cirq.Z(a)]))
+    _assert_qubit_moment_indices_current(circuit)
+
+
+@pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
+def test_moment_operating_on_matches_scan(circuit_cls):
+    prng = np.random.RandomState(1234)
+    qubits = cirq.LineQubit.range(5)
+    circuit = circuit_cls(
+        cirq.testing.random_circuit(qubits, n_moments=20, op_density=0.3, random_state=prng)
+    )
+    for _ in range(100):
+        subset = [q for q in qubits if prng.rand() < 0.4]
+        index = prng.randint(-3, len(circuit) + 3)
+        distance = prng.randint(0, 10)
+        touching = [i for i, m in enumerate(circuit) if m.operates_on(subset)]
+        after = [i for i in touching if index <= i < index + distance]
+        before = [i for i in touching if index - distance <= i < index]
+        assert circuit.next_moment_operating_on(subset, index, distance) == min(after, default=None)
+        assert circuit.prev_moment_operating_on(subset, index, distance) == max(
+            before, default=None
+        )
+
+
+@pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
+def test_fingerprint(circuit_cls):
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = circuit_cls(cirq.H(a), cirq.CNOT(a, b), cirq.X(c) ** 0.5)
+    fingerprint = circuit.fingerprint()
+
+    assert len(fingerprint) == 64
+    assert circuit_cls(cirq.X(c) ** 0.5, cirq.H(a), cirq.CNOT(a, b)).fingerprint() == fingerprint
+    assert cirq.Circuit(circuit).fingerprint() == fingerprint
+    assert cirq.FrozenCircuit(circuit).fingerprint() == fingerprint
+    assert circuit_cls(cirq.H(a), cirq.CNOT(a, c)).fingerprint() != fingerprint
+    assert circuit_cls(cirq.H(a), cirq.CNOT(a, b)).fingerprint() != fingerprint
+    assert circuit_cls(cirq.H(a), cirq.CNOT(a, b), cirq.X(c)).fingerprint() != fingerprint
+    assert circuit_cls([cirq.Moment(), *circuit]).fingerprint() != fingerprint
+
+    on_device = circuit_cls(cirq.X(cirq.GridQubit(0, 6)), device=BCONE)
+    assert on_device.fingerprint() != circuit_cls(cirq.X(cirq.GridQubit(0, 6))).fingerprint()
+
+
+def test_constructor_matches_earliest_append():
+    prng = np.random.RandomState(2468)
+    qubits = cirq.LineQubit.range(5)
+    contents = []
+    for _ in range(200):
+        r = prng.rand()
+        if r < 0.05:
+            contents.append(cirq.GlobalPhaseOperation(1j))
+        elif r < 0.15:
+            contents.append(cirq.Moment([cirq.Z(qubits[prng.randint(5)])]))
+        elif r < 0.2:
+            contents.append(cirq.Moment())
+        else:
+            a, b = prng.choice(5, size=2, replace=False)
+            contents.append([cirq.X(qubits[a]), cirq.CZ(qubits[a], qubits[b])][prng.randint(2)])
+
+    expected = cirq.Circuit()
+    expected.append(contents)
+    actual = cirq.Circuit(contents)
+    assert actual == expected
+    assert [m.operations for m in actual] == [m.operations for m in expected]
+
+
+def test_earliest_insertion_matches_scan():
+    prng = np.random.RandomState(4321)
+    qubits = cirq.LineQubit.range(6)
+    operations = list(
+        cirq.testing.random_circuit(
+            qubits, n_moments=30, op_density=0.6, random_state=prng
+        ).all_operations()
+    )
+    circuit = cirq.Circuit()
+    latest = {}
+    for op in operations:
+        circuit.append(op)
+        moment_index = 1 + max((latest.get(q, -1) for q in op.qubits), default=-1)
+        for q in op.qubits:
+            latest[q] = moment_index
+        assert op in circuit[moment_index].operations
+    _assert_qubit_moment_indices_current(circuit)
+
+
 @pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
 def test_operation_at(circuit_cls):
     a = cirq.NamedQubit('a')
@@ -2945,6 +3081,49 @@ def test_parameter_names(circuit_cls, resolve_fn):
     assert cirq.parameter_names(resolved_circuit) == set()
 
 
+@pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
+def test_resolve_parameters_shares_unparameterized_structure(circuit_cls):
+    a, b = cirq.LineQubit.range(2)
+    circuit = circuit_cls(
+        cirq.Moment(cirq.H(a), cirq.H(b)),
+        cirq.Moment(cirq.CZ(a, b)),
+        cirq.Moment(cirq.X(a) ** sympy.Symbol('x'), cirq.Y(b)),
+        cirq.Moment(cirq.Z(b) ** (2 * sympy.Symbol('x') + sympy.Symbol('y'))),
+    )
+    assert circuit.parameter_positions() == {'x': ((2, 0), (3, 0)), 'y': ((3, 0),)}
+
+    resolved = cirq.resolve_parameters(circuit, {'x': 0.5, 'y': 0.25})
+    assert isinstance(resolved, circuit_cls)
+    assert resolved == circuit_cls(
+        cirq.Moment(cirq.H(a), cirq.H(b)),
+        cirq.Moment(cirq.CZ(a, b)),
+        cirq.Moment(cirq.X(a) ** 0.5, cirq.Y(b)),
+        cirq.Moment(cirq.Z(b) ** 1.25),
+    )
+    assert resolved[0] is circuit[0]
+    assert resolved[1] is circuit[1]
+    assert resolved[2] is not circuit[2]
+    assert resolved[2].operations[1] is circuit[2].operations[1]
+    assert resolved.parameter_positions() == {}
+    assert not cirq.is_parameterized(resolved)
+
+
+def test_resolve_parameters_validates_resolved_moments():
+    class SmallExponentsOnly(cirq.Device):
+        def validate_operation(self, operation):
+            if not cirq.is_parameterized(operation) and operation.gate.exponent > 0.5:
+                raise ValueError('Exponent too large.')
+
+    q = cirq.LineQubit(0)
+    device = SmallExponentsOnly()
+    circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('x'), device=device)
+    assert cirq.resolve_parameters(circuit, {'x': 0.25}) == cirq.Circuit(
+        cirq.X(q) ** 0.25, device=device
+    )
+    with pytest.raises(ValueError, match='Exponent too large'):
+        cirq.resolve_parameters(circuit, {'x': 0.75})
+
+
 def test_items():
     a = cirq.NamedQubit('a')
     b = cirq.NamedQubit('b')
@@ -16,9 +16,11 @@ from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Callable,
+    Dict,
     FrozenSet,
     Iterable,
     Iterator,
+    List,
     Optional,
     Sequence,
     Tuple,
@@ -29,6 +31,7 @@ import numpy as np
 
 from cirq import devices, ops, protocols
 from cirq.circuits import AbstractCircuit, Alignment, Circuit
+from cirq.circuits._compact_moments import CompactMoments
 from cirq.circuits.insert_strategy import InsertStrategy
 from cirq.type_workarounds import NotImplementedType
 
@@ -64,7 +67,7 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
             device: Hardware that the circuit should be able to run on.
         """
         base = Circuit(contents, strategy=strategy, device=device)
-        self._moments = tuple(base.moments)
+        self._moments: Sequence['cirq.Moment'] = tuple(base.moments)
         self._device = base.device
 
         # These variables are memoized when first requested.
@@ -76,6 +79,11 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
         self._has_measurements: Optional[bool] = None
         self._all_measurement_key_names: Optional[AbstractSet[str]] = None
         self._are_all_measurements_terminal: Optional[bool] = None
+        self._parameterized_positions_list: Optional[List[Tuple[int, int]]] = None
+        self._parameter_positions: Optional[Dict[str, Tuple[Tuple[int, int], ...]]] = None
+        self._qubit_moments: Optional[Dict['cirq.Qid', List[int]]] = None
+        self._hash: Optional[int] = None
+        self._fingerprint: Optional[str] = None
 
     @property
     def moments(self) -> Sequence['cirq.Moment']:
@@ -86,7 +94,32 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
         return self._device
 
     def __hash__(self):
-        return hash((self.moments, self.device))
+        if self._hash is None:
+            self._hash = hash((self.moments, self.device))
+        return self._hash
+
+    def __getstate__(self):
+        # Don't save hash when pickling; see #3777.
+        state = self.__dict__.copy()
+        state['_hash'] = None
+        return state
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if (
+            isinstance(other, FrozenCircuit)
+            and self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        return super().__eq__(other)
+
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = super().fingerprint()
+        return self._fingerprint
 
     def diagram_name(self):
         """Name used to represent this in circuit diagrams."""
@@ -117,10 +150,16 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
 
     def all_qubits(self) -> FrozenSet['cirq.Qid']:
         if self._all_qubits is None:
-            self._all_qubits = super().all_qubits()
+            if isinstance(self._moments, CompactMoments):
+                self._all_qubits = self._moments.all_qubits()
+            else:
+                self._all_qubits = super().all_qubits()
         return self._all_qubits
 
     def all_operations(self) -> Iterator[ops.Operation]:
+        if isinstance(self._moments, CompactMoments):
+            # Keeping every operation alive would undo the compact storage.
+            return super().all_operations()
         if self._all_operations is None:
             self._all_operations = tuple(super().all_operations())
         return iter(self._all_operations)
@@ -140,6 +179,30 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
             self._are_all_measurements_terminal = super().are_all_measurements_terminal()
         return self._are_all_measurements_terminal
 
+    def _qubit_moment_indices(self) -> Dict['cirq.Qid', List[int]]:
+        if self._qubit_moments is None:
+            if isinstance(self._moments, CompactMoments):
+                self._qubit_moments = self._moments.qubit_moment_indices()
+            else:
+                self._qubit_moments = super()._qubit_moment_indices()
+        return self._qubit_moments
+
+    def _parameterized_positions(self) -> List[Tuple[int, int]]:
+        if self._parameterized_positions_list is None:
+            self._parameterized_positions_list = super()._parameterized_positions()
+        return self._parameterized_positions_list
+
+    def parameter_positions(self) -> Dict[str, Tuple[Tuple[int, int], ...]]:
+        if self._parameter_positions is None:
+            self._parameter_positions = super().parameter_positions()
+        return self._parameter_positions
+
+    def _is_parameterized_(self) -> bool:
+        return bool(self._parameterized_positions())
+
+    def _parameter_names_(self) -> AbstractSet[str]:
+        return set(self.parameter_positions())
+
     # End of memoized methods.
 
     def __add__(self, other) -> 'FrozenCircuit':
@@ -169,6 +232,26 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
         new_circuit._moments = tuple(moments)
         return new_circuit
 
+    def compact(self) -> 'FrozenCircuit':
+        """Returns an equal frozen circuit that stores its operations in arrays.
+
+        The returned circuit keeps integer qubit IDs, an intern table of gates
+        and moment offsets in NumPy arrays rather than moment and operation
+        objects. Moments and operations are materialized from those arrays on
+        demand and not retained, which makes keeping many large circuits in
+        memory much cheaper at the cost of slower access to their contents.
+        """
+        if isinstance(self._moments, CompactMoments):
+            return self
+        new_circuit = FrozenCircuit(device=self.device)
+        new_circuit._moments = CompactMoments(self._moments)
+        return new_circuit
+
+    def _json_dict_(self):
+        json_dict = super()._json_dict_()
+        json_dict['moments'] = tuple(self._moments)
+        return json_dict
+
     def with_device(
         self,
         new_device: 'cirq.Device',
@@ -176,11 +259,6 @@ class FrozenCircuit(AbstractCircuit, protocols.SerializableByKey):
     ) -> 'FrozenCircuit':
         return self.unfreeze().with_device(new_device, qubit_mapping).freeze()
 
-    def _resolve_parameters_(
-        self, resolver: 'cirq.ParamResolver', recursive: bool
-    ) -> 'FrozenCircuit':
-        return self.unfreeze()._resolve_parameters_(resolver, recursive).freeze()
-
     def tetris_concat(
         *circuits: 'cirq.AbstractCircuit', align: Union['cirq.Alignment', str] = Alignment.LEFT
     ) -> 'cirq.FrozenCircuit':
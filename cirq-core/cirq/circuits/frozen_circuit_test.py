@@ -16,6 +16,8 @@
 Behavior shared with Circuit is tested with parameters in circuit_test.py.
 """
 
+import pickle
+
 import pytest
 
 import cirq
@@ -56,3 +58,36 @@ def test_immutable():
 
     with pytest.raises(AttributeError, match="can't set attribute"):
         c.device = cirq.UNCONSTRAINED_DEVICE
+
+
+def test_compact():
+    a, b = cirq.LineQubit.range(2)
+    f = cirq.FrozenCircuit(cirq.H(a), cirq.CNOT(a, b), cirq.measure(a, b, key='m'))
+    c = f.compact()
+
+    assert c == f
+    assert hash(c) == hash(f)
+    assert c.compact() is c
+    assert c.all_qubits() == f.all_qubits()
+    assert list(c.all_operations()) == list(f.all_operations())
+    assert c.next_moment_operating_on([b]) == 1
+    assert c[1:] == f[1:]
+    assert c.unfreeze() == f.unfreeze()
+    assert cirq.read_json(json_text=cirq.to_json(c)) == f
+    assert cirq.Simulator(seed=1).run(c, repetitions=10) == cirq.Simulator(seed=1).run(
+        f, repetitions=10
+    )
+
+
+def test_cached_hash():
+    a, b = cirq.LineQubit.range(2)
+    f = cirq.FrozenCircuit(cirq.H(a), cirq.CNOT(a, b))
+    f_bad = cirq.FrozenCircuit(cirq.H(a), cirq.CNOT(a, b))
+    f_bad._hash = hash(f) + 1
+    assert f_bad != f
+    assert f_bad == f_bad
+
+    f_ok = pickle.loads(pickle.dumps(f_bad))
+    assert f_ok == f
+    assert hash(f_ok) == hash(f)
+    assert f.fingerprint() is f.fingerprint()
@@ -141,7 +141,7 @@ class PointOptimizer:
                 if i >= len(circuit):
                     continue
                 # Skip if an optimization removed the op we're considering.
-                if op not in circuit[i].operations:
+                if not _moment_has_operation(circuit[i], op):
                     continue
                 opt = self.optimization_at(circuit, i, op)
                 # Skip if the optimization did nothing.
@@ -168,3 +168,10 @@ class PointOptimizer:
 
                 circuit.insert_at_frontier(flat_new_operations, i, frontier)
             i += 1
+
+
+def _moment_has_operation(moment: 'cirq.Moment', op: 'cirq.Operation') -> bool:
+    if not op.qubits:
+        return op in moment.operations
+    existing = moment.operation_at(op.qubits[0])
+    return existing is op or existing == op
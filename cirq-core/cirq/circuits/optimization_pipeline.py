@@ -0,0 +1,143 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runs sequences of circuit optimizations."""
+
+import dataclasses
+import functools
+import time
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+
+from cirq.circuits.circuit import Circuit
+from cirq.circuits.optimization_pass import PointOptimizationSummary, PointOptimizer
+
+if TYPE_CHECKING:
+    import cirq
+
+OptimizationStage = Union[Callable[[Circuit], None], Sequence[PointOptimizer]]
+
+
+@dataclasses.dataclass(frozen=True)
+class OptimizationStageReport:
+    """How long a stage of an `cirq.OptimizationPipeline` took.
+
+    Attributes:
+        name: The name of the stage.
+        duration: The wall-clock time spent in the stage, in seconds.
+        num_moments: The number of moments in the circuit after the stage.
+        num_operations: The number of operations in the circuit after the stage.
+    """
+
+    name: str
+    duration: float
+    num_moments: int
+    num_operations: int
+
+    def __str__(self) -> str:
+        return (
+            f'{self.name}: {self.duration:.3f} s, '
+            f'{self.num_moments} moments, {self.num_operations} operations'
+        )
+
+
+class OptimizationPipeline:
+    """Applies a sequence of optimization stages to a copy of a circuit.
+
+    Each stage is either a callable that optimizes a `cirq.Circuit` in place,
+    such as a `cirq.PointOptimizer` or `cirq.EjectZ().optimize_circuit`, or a
+    sequence of `cirq.PointOptimizer`s. The optimizers in a sequence are fused
+    into a single traversal of the circuit: at each operation they are asked
+    in order for an optimization, and the first one proposed is applied.
+    Fusing saves a pass over the circuit per optimizer, but an optimizer no
+    longer sees the whole circuit as rewritten by the optimizers before it.
+
+    The input circuit is copied once and never mutated.
+    """
+
+    def __init__(self, stages: Iterable[OptimizationStage]) -> None:
+        """Inits OptimizationPipeline.
+
+        Args:
+            stages: The stages to run, in order.
+        """
+        self._stages: List[Tuple[str, Callable[[Circuit], None]]] = []
+        for stage in stages:
+            if callable(stage):
+                self._stages.append((_stage_name(stage), stage))
+            else:
+                optimizers = tuple(stage)
+                name = '+'.join(_stage_name(optimizer) for optimizer in optimizers)
+                self._stages.append((name, _FusedPointOptimizer(optimizers)))
+
+    def __call__(self, circuit: 'cirq.AbstractCircuit') -> Circuit:
+        """Returns an optimized copy of the circuit."""
+        return self.optimize(circuit)[0]
+
+    def optimize(
+        self, circuit: 'cirq.AbstractCircuit'
+    ) -> Tuple[Circuit, List[OptimizationStageReport]]:
+        """Optimizes a copy of the circuit and reports how long each stage took.
+
+        Args:
+            circuit: The circuit to optimize. It is not modified.
+
+        Returns:
+            The optimized circuit and a report for each stage, in order.
+        """
+        result = circuit.unfreeze(copy=True)
+        reports = []
+        for name, stage in self._stages:
+            start = time.perf_counter()
+            stage(result)
+            duration = time.perf_counter() - start
+            reports.append(
+                OptimizationStageReport(
+                    name=name,
+                    duration=duration,
+                    num_moments=len(result),
+                    num_operations=sum(len(moment) for moment in result),
+                )
+            )
+        return result, reports
+
+
+class _FusedPointOptimizer(PointOptimizer):
+    """Asks several point optimizers for an optimization in a single traversal."""
+
+    def __init__(self, optimizers: Sequence[PointOptimizer]) -> None:
+        super().__init__()
+        self._optimizers = optimizers
+
+    def optimization_at(
+        self, circuit: Circuit, index: int, op: 'cirq.Operation'
+    ) -> Optional[PointOptimizationSummary]:
+        for optimizer in self._optimizers:
+            opt = optimizer.optimization_at(circuit, index, op)
+            if opt is not None:
+                return PointOptimizationSummary(
+                    clear_span=opt.clear_span,
+                    clear_qubits=opt.clear_qubits,
+                    new_operations=optimizer.post_clean_up(opt.new_operations),
+                )
+        return None
+
+
+def _stage_name(stage: Callable) -> str:
+    if isinstance(stage, functools.partial):
+        return _stage_name(stage.func)
+    owner = getattr(stage, '__self__', None)
+    if owner is not None:
+        return type(owner).__name__
+    name = getattr(stage, '__name__', None)
+    return name if name is not None else type(stage).__name__
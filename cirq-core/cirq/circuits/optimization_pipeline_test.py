@@ -0,0 +1,123 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+from typing import Optional
+
+import cirq
+
+
+class ReplaceXWithY(cirq.PointOptimizer):
+    def optimization_at(
+        self, circuit: 'cirq.Circuit', index: int, op: 'cirq.Operation'
+    ) -> Optional['cirq.PointOptimizationSummary']:
+        if op.gate != cirq.X:
+            return None
+        return cirq.PointOptimizationSummary(
+            clear_span=1, clear_qubits=op.qubits, new_operations=cirq.Y(*op.qubits)
+        )
+
+
+class ReplaceYWithZ(cirq.PointOptimizer):
+    def optimization_at(
+        self, circuit: 'cirq.Circuit', index: int, op: 'cirq.Operation'
+    ) -> Optional['cirq.PointOptimizationSummary']:
+        if op.gate != cirq.Y:
+            return None
+        return cirq.PointOptimizationSummary(
+            clear_span=1, clear_qubits=op.qubits, new_operations=cirq.Z(*op.qubits)
+        )
+
+
+def drop_z(circuit: cirq.Circuit) -> None:
+    circuit.batch_remove(
+        [(i, op) for i, moment in enumerate(circuit) for op in moment if op.gate == cirq.Z]
+    )
+
+
+def test_pipeline_matches_optimizing_in_place():
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=30, op_density=0.7, random_state=1)
+    original = circuit.copy()
+    stages = [
+        cirq.ExpandComposite(),
+        cirq.MergeInteractions(),
+        functools.partial(cirq.merge_single_qubit_gates_into_phxz, atol=1e-6),
+        cirq.EjectPhasedPaulis().optimize_circuit,
+        cirq.EjectZ().optimize_circuit,
+        cirq.DropNegligible().optimize_circuit,
+        cirq.DropEmptyMoments().optimize_circuit,
+    ]
+
+    expected = circuit.copy()
+    for stage in stages:
+        stage(expected)
+    optimized, reports = cirq.OptimizationPipeline(stages).optimize(circuit)
+
+    assert optimized == expected
+    assert circuit == original
+    assert [report.name for report in reports] == [
+        'ExpandComposite',
+        'MergeInteractions',
+        'merge_single_qubit_gates_into_phxz',
+        'EjectPhasedPaulis',
+        'EjectZ',
+        'DropNegligible',
+        'DropEmptyMoments',
+    ]
+    assert all(report.duration >= 0 for report in reports)
+    assert reports[-1].num_moments == len(expected)
+    assert reports[-1].num_operations == len(list(expected.all_operations()))
+    assert cirq.OptimizationPipeline(stages)(circuit.freeze()) == expected
+
+
+def test_fused_point_optimizers():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(a), cirq.Y(b), cirq.CZ(a, b), cirq.X(b))
+
+    # Fused optimizers each see the operations of the input circuit.
+    fused = cirq.OptimizationPipeline([(ReplaceXWithY(), ReplaceYWithZ())])
+    assert fused(circuit) == cirq.Circuit(cirq.Y(a), cirq.Z(b), cirq.CZ(a, b), cirq.Y(b))
+    optimized, reports = fused.optimize(circuit)
+    assert [report.name for report in reports] == ['ReplaceXWithY+ReplaceYWithZ']
+
+    separate = cirq.OptimizationPipeline([ReplaceXWithY(), ReplaceYWithZ(), drop_z])
+    assert separate(circuit) == cirq.Circuit(
+        [cirq.Moment(), cirq.Moment([cirq.CZ(a, b)]), cirq.Moment()]
+    )
+    assert [report.name for report in separate.optimize(circuit)[1]] == [
+        'ReplaceXWithY',
+        'ReplaceYWithZ',
+        'drop_z',
+    ]
+
+
+def test_fused_point_optimizers_apply_their_own_post_clean_up():
+    a = cirq.LineQubit(0)
+    tagged = ReplaceXWithY(post_clean_up=lambda ops: [op.with_tags('y') for op in ops])
+    pipeline = cirq.OptimizationPipeline([[ReplaceYWithZ(), tagged]])
+    assert pipeline(cirq.Circuit(cirq.X(a), cirq.Y(a))) == cirq.Circuit(
+        cirq.Y(a).with_tags('y'), cirq.Z(a)
+    )
+
+
+def test_report_str():
+    pipeline = cirq.OptimizationPipeline([lambda circuit: None])
+    _, reports = pipeline.optimize(cirq.Circuit(cirq.X(cirq.LineQubit(0))))
+    assert str(reports[0]).startswith('<lambda>: ')
+    assert str(reports[0]).endswith(' s, 1 moments, 1 operations')
+    report = cirq.OptimizationStageReport(
+        name='EjectZ', duration=1.5, num_moments=3, num_operations=4
+    )
+    assert str(report) == 'EjectZ: 1.500 s, 3 moments, 4 operations'
@@ -105,7 +105,7 @@ def replace_acquaintance_with_swap_network(
             swap_network_op = swap_network_gate(*qubit_order)
             moment = ops.Moment([swap_network_op])
             reflected = not reflected
-        circuit._moments[moment_index] = moment
+        circuit[moment_index] = moment
     return reflected
 
 
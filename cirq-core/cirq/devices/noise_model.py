@@ -93,6 +93,17 @@ class NoiseModel(metaclass=value.ABCMetaImplementAnyOneOf):
             return False
         return all(ops.VirtualTag() in op.tags for op in moment)
 
+    def _is_static_(self) -> bool:
+        """Returns whether the noisy moments of a circuit depend only on the circuit.
+
+        Simulators compute the noisy moments of a circuit once and reuse them
+        across repetitions and runs when the noise model is static. Noise
+        models that may return different moments for the same circuit, e.g.
+        because they are random or hold mutable state, must not be static,
+        which is the default.
+        """
+        return False
+
     def _noisy_moments_impl_moment(
         self, moments: 'Iterable[cirq.Moment]', system_qubits: Sequence['cirq.Qid']
     ) -> Sequence['cirq.OP_TREE']:
@@ -186,6 +197,9 @@ class _NoNoiseModel(NoiseModel):
     def _value_equality_values_(self) -> Any:
         return None
 
+    def _is_static_(self) -> bool:
+        return True
+
     def __str__(self) -> str:
         return '(no noise)'
 
@@ -208,32 +222,46 @@ class ConstantQubitNoiseModel(NoiseModel):
 
     This is the noise model that is wrapped around an operation when that
     operation is given as "the noise to use" for a `NOISE_MODEL_LIKE` parameter.
+
+    If `parallel` is set, the noise of each moment is a single
+    `cirq.ParallelGate` operation on all qubits rather than one operation per
+    qubit. The state vector and density matrix simulators apply such an
+    operation to all of its qubits at once.
     """
 
-    def __init__(self, qubit_noise_gate: 'cirq.Gate'):
+    def __init__(self, qubit_noise_gate: 'cirq.Gate', *, parallel: bool = False):
         if qubit_noise_gate.num_qubits() != 1:
             raise ValueError('noise.num_qubits() != 1')
         self.qubit_noise_gate = qubit_noise_gate
+        self.parallel = parallel
 
     def _value_equality_values_(self) -> Any:
-        return self.qubit_noise_gate
+        return self.qubit_noise_gate, self.parallel
 
     def __repr__(self) -> str:
+        if self.parallel:
+            return f'cirq.ConstantQubitNoiseModel({self.qubit_noise_gate!r}, parallel=True)'
         return f'cirq.ConstantQubitNoiseModel({self.qubit_noise_gate!r})'
 
+    def _is_static_(self) -> bool:
+        return True
+
     def noisy_moment(self, moment: 'cirq.Moment', system_qubits: Sequence['cirq.Qid']):
         # Noise should not be appended to previously-added noise.
         if self.is_virtual_moment(moment):
             return moment
-        return [
-            moment,
-            ops.Moment(
-                [self.qubit_noise_gate(q).with_tags(ops.VirtualTag()) for q in system_qubits]
-            ),
-        ]
+        if self.parallel and system_qubits:
+            noise = [
+                ops.ParallelGate(self.qubit_noise_gate, len(system_qubits))
+                .on(*system_qubits)
+                .with_tags(ops.VirtualTag())
+            ]
+        else:
+            noise = [self.qubit_noise_gate(q).with_tags(ops.VirtualTag()) for q in system_qubits]
+        return [moment, ops.Moment(noise)]
 
     def _json_dict_(self):
-        return protocols.obj_to_dict_helper(self, ['qubit_noise_gate'])
+        return protocols.obj_to_dict_helper(self, ['qubit_noise_gate', 'parallel'])
 
     def _has_unitary_(self):
         return protocols.has_unitary(self.qubit_noise_gate)
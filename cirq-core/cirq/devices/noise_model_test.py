@@ -156,6 +156,30 @@ def test_noise_composition():
 
 def test_constant_qubit_noise_repr():
     cirq.testing.assert_equivalent_repr(cirq.ConstantQubitNoiseModel(cirq.X ** 0.01))
+    cirq.testing.assert_equivalent_repr(cirq.ConstantQubitNoiseModel(cirq.X ** 0.01, parallel=True))
+
+
+def test_parallel_constant_qubit_noise():
+    a, b, c = cirq.LineQubit.range(3)
+    damp = cirq.amplitude_damp(0.5)
+    damp_all = cirq.ConstantQubitNoiseModel(damp, parallel=True)
+    assert damp_all != cirq.ConstantQubitNoiseModel(damp)
+    actual = damp_all.noisy_moments([cirq.Moment([cirq.X(a)])], [a, b, c])
+    expected = [
+        [
+            cirq.Moment([cirq.X(a)]),
+            cirq.Moment([cirq.ParallelGate(damp, 3).on(a, b, c).with_tags(ops.VirtualTag())]),
+        ]
+    ]
+    assert actual == expected
+    assert damp_all.noisy_moment(cirq.Moment(), []) == [cirq.Moment(), cirq.Moment()]
+
+
+def test_static_noise_models():
+    assert cirq.NO_NOISE._is_static_()
+    assert cirq.ConstantQubitNoiseModel(cirq.depolarize(0.1))._is_static_()
+    noise = cirq.devices.noise_model.GateSubstitutionNoiseModel(lambda op: op)
+    assert not noise._is_static_()
 
 
 def test_wrap():
@@ -111,6 +111,7 @@ def _class_resolver_dictionary() -> Dict[str, ObjectFactory]:
         '_PauliX': cirq.ops.pauli_gates._PauliX,
         '_PauliY': cirq.ops.pauli_gates._PauliY,
         '_PauliZ': cirq.ops.pauli_gates._PauliZ,
+        'PackedCliffordTableau': cirq.PackedCliffordTableau,
         'ParamResolver': cirq.ParamResolver,
         'ParallelGateOperation': cirq.ParallelGateOperation,
         'ParallelGate': cirq.ParallelGate,
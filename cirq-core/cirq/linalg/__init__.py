@@ -28,6 +28,8 @@ from cirq.linalg.combinators import (
 from cirq.linalg.decompositions import (
     axis_angle,
     AxisAngleDecomposition,
+    batched_kak_decomposition,
+    BatchedKakDecomposition,
     deconstruct_single_qubit_matrix_into_angles,
     extract_right_diag,
     kak_canonicalize_vector,
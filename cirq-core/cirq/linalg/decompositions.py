@@ -29,6 +29,7 @@ from typing import (
     TYPE_CHECKING,
     TypeVar,
     Union,
+    overload,
 )
 
 import matplotlib.pyplot as plt
@@ -670,6 +671,23 @@ def scatter_plot_normalized_kak_interaction_coefficients(
     return ax
 
 
+# These special-unitary matrices flip the X, Y, and Z axes respectively.
+_KAK_FLIPPERS = [
+    np.array([[0, 1], [1, 0]]) * 1j,
+    np.array([[0, -1j], [1j, 0]]) * 1j,
+    np.array([[1, 0], [0, -1]]) * 1j,
+]
+
+# Each of these special-unitary matrices swaps two the roles of two axes.
+# The matrix at index k swaps the *other two* axes (e.g. _KAK_SWAPPERS[1] is a
+# Hadamard operation that swaps X and Z).
+_KAK_SWAPPERS = [
+    np.array([[1, -1j], [1j, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[1, 1], [1, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[0, 1 - 1j], [1 + 1j, 0]]) * 1j * np.sqrt(0.5),
+]
+
+
 def kak_canonicalize_vector(x: float, y: float, z: float, atol: float = 1e-9) -> KakDecomposition:
     """Canonicalizes an XX/YY/ZZ interaction by swap/negate/shift-ing axes.
 
@@ -700,42 +718,26 @@ def kak_canonicalize_vector(x: float, y: float, z: float, atol: float = 1e-9) ->
     right = [np.eye(2)] * 2  # Per-qubit right factors.
     v = [x, y, z]  # Remaining XX/YY/ZZ interaction vector.
 
-    # These special-unitary matrices flip the X, Y, and Z axes respectively.
-    flippers = [
-        np.array([[0, 1], [1, 0]]) * 1j,
-        np.array([[0, -1j], [1j, 0]]) * 1j,
-        np.array([[1, 0], [0, -1]]) * 1j,
-    ]
-
-    # Each of these special-unitary matrices swaps two the roles of two axes.
-    # The matrix at index k swaps the *other two* axes (e.g. swappers[1] is a
-    # Hadamard operation that swaps X and Z).
-    swappers = [
-        np.array([[1, -1j], [1j, -1]]) * 1j * np.sqrt(0.5),
-        np.array([[1, 1], [1, -1]]) * 1j * np.sqrt(0.5),
-        np.array([[0, 1 - 1j], [1 + 1j, 0]]) * 1j * np.sqrt(0.5),
-    ]
-
     # Shifting strength by ½π is equivalent to local ops (e.g. exp(i½π XX)∝XX).
     def shift(k, step):
         v[k] += step * np.pi / 2
         phase[0] *= 1j ** step
-        right[0] = combinators.dot(flippers[k] ** (step % 4), right[0])
-        right[1] = combinators.dot(flippers[k] ** (step % 4), right[1])
+        right[0] = combinators.dot(_KAK_FLIPPERS[k] ** (step % 4), right[0])
+        right[1] = combinators.dot(_KAK_FLIPPERS[k] ** (step % 4), right[1])
 
     # Two negations is equivalent to temporarily flipping along the other axis.
     def negate(k1, k2):
         v[k1] *= -1
         v[k2] *= -1
         phase[0] *= -1
-        s = flippers[3 - k1 - k2]  # The other axis' flipper.
+        s = _KAK_FLIPPERS[3 - k1 - k2]  # The other axis' flipper.
         left[1] = combinators.dot(left[1], s)
         right[1] = combinators.dot(s, right[1])
 
     # Swapping components is equivalent to temporarily swapping the two axes.
     def swap(k1, k2):
         v[k1], v[k2] = v[k2], v[k1]
-        s = swappers[3 - k1 - k2]  # The other axis' swapper.
+        s = _KAK_SWAPPERS[3 - k1 - k2]  # The other axis' swapper.
         left[0] = combinators.dot(left[0], s)
         left[1] = combinators.dot(left[1], s)
         right[0] = combinators.dot(s, right[0])
@@ -798,6 +800,10 @@ KAK_GAMMA = np.array([[1, 1, 1, 1],
 
 # yapf: enable
 
+# Weights the imaginary part of a symmetric unitary relative to its real part
+# so that their combination has distinct eigenvalues for generic inputs.
+_KAK_EIGH_IMAG_WEIGHT = np.sqrt(2) - 0.1
+
 
 def kak_decomposition(
     unitary_object: Union[np.ndarray, 'cirq.SupportsUnitary'],
@@ -871,6 +877,267 @@ def kak_decomposition(
     )
 
 
+class BatchedKakDecomposition(Sequence[KakDecomposition]):
+    """The KAK decompositions of a stack of two-qubit operations.
+
+    The fields of the `cirq.KakDecomposition` of every operation are stored
+    stacked along the first axis of an array. Indexing the batch with an
+    integer gives the `cirq.KakDecomposition` of one operation, and indexing
+    it with a slice gives a smaller batch.
+
+    Attributes:
+        global_phases: The global phase g of each operation, with shape (N,).
+        single_qubit_operations_before: The single-qubit operations (b1, b0)
+            of each operation, with shape (N, 2, 2, 2).
+        interaction_coefficients: The interaction coefficients (x, y, z) of
+            each operation, with shape (N, 3).
+        single_qubit_operations_after: The single-qubit operations (a1, a0)
+            of each operation, with shape (N, 2, 2, 2).
+    """
+
+    def __init__(
+        self,
+        *,
+        global_phases: np.ndarray,
+        single_qubit_operations_before: np.ndarray,
+        interaction_coefficients: np.ndarray,
+        single_qubit_operations_after: np.ndarray,
+    ):
+        """Initializes a batch of decompositions of two-qubit operations.
+
+        Args:
+            global_phases: The global phase of each operation.
+            single_qubit_operations_before: The single-qubit operations
+                (b1, b0) of each operation.
+            interaction_coefficients: The interaction coefficients (x, y, z)
+                of each operation.
+            single_qubit_operations_after: The single-qubit operations
+                (a1, a0) of each operation.
+        """
+        self.global_phases = global_phases
+        self.single_qubit_operations_before = single_qubit_operations_before
+        self.interaction_coefficients = interaction_coefficients
+        self.single_qubit_operations_after = single_qubit_operations_after
+
+    def __len__(self) -> int:
+        return len(self.global_phases)
+
+    @overload
+    def __getitem__(self, index: int) -> KakDecomposition:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> 'BatchedKakDecomposition':
+        pass
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return BatchedKakDecomposition(
+                global_phases=self.global_phases[index],
+                single_qubit_operations_before=self.single_qubit_operations_before[index],
+                interaction_coefficients=self.interaction_coefficients[index],
+                single_qubit_operations_after=self.single_qubit_operations_after[index],
+            )
+        before = self.single_qubit_operations_before[index]
+        after = self.single_qubit_operations_after[index]
+        return KakDecomposition(
+            global_phase=self.global_phases[index],
+            single_qubit_operations_before=(before[0], before[1]),
+            interaction_coefficients=tuple(self.interaction_coefficients[index]),
+            single_qubit_operations_after=(after[0], after[1]),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            'cirq.BatchedKakDecomposition(\n'
+            f'    global_phases={proper_repr(self.global_phases)},\n'
+            '    single_qubit_operations_before='
+            f'{proper_repr(self.single_qubit_operations_before)},\n'
+            f'    interaction_coefficients={proper_repr(self.interaction_coefficients)},\n'
+            '    single_qubit_operations_after='
+            f'{proper_repr(self.single_qubit_operations_after)})'
+        )
+
+
+def batched_kak_decomposition(
+    unitaries: Union[Iterable[np.ndarray], np.ndarray],
+    *,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    check_preconditions: bool = True,
+) -> BatchedKakDecomposition:
+    """Decomposes a stack of 2-qubit unitaries like `cirq.kak_decomposition`.
+
+    All the unitaries are decomposed together with vectorized NumPy calls.
+    Rather than bidiagonalizing each unitary U, the eigenvectors of a fixed
+    generic combination of the real and imaginary parts of the symmetric
+    unitary U.T @ U in the magic basis are used, which are shared by both
+    parts for all but a negligible set of unitaries. Any unitary for which
+    this fails to within `atol` is decomposed by `cirq.kak_decomposition`
+    instead.
+
+    Args:
+        unitaries: The 4x4 unitary matrices to decompose, as a sequence or as
+            an array with shape (N, 4, 4).
+        rtol: Per-matrix-entry relative tolerance on equality.
+        atol: Per-matrix-entry absolute tolerance on equality.
+        check_preconditions: If set, verifies that the inputs are 4x4
+            unitaries before decomposing.
+
+    Returns:
+        A `cirq.BatchedKakDecomposition` whose decompositions are
+        canonicalized like those of `cirq.kak_decomposition`.
+
+    Raises:
+        ValueError: Bad matrices.
+        ArithmeticError: Failed to perform a decomposition.
+    """
+    mats = np.asarray(unitaries, dtype=np.complex128)
+    if mats.size == 0:
+        mats = mats.reshape((0, 4, 4))
+    if mats.ndim != 3 or mats.shape[1:] != (4, 4):
+        raise ValueError(f'Expected input unitaries to have shape (N, 4, 4), but got {mats.shape}.')
+    if check_preconditions:
+        actual = np.einsum('...ba,...bc', mats.conj(), mats) - np.eye(4)
+        if not np.allclose(actual, np.zeros_like(actual), rtol, atol):
+            raise ValueError(
+                'Input must correspond to 4x4 unitary matrices. Received input:\n' + str(mats)
+            )
+
+    # For U in the magic basis, U.T @ U = R @ diag(d)^2 @ R.T with R orthogonal,
+    # and then L = U @ R @ diag(d)^-1 is orthogonal too, giving L.T @ U @ R = diag(d).
+    magic = KAK_MAGIC_DAG @ mats @ KAK_MAGIC
+    squared = np.swapaxes(magic, -1, -2) @ magic
+    _, right = np.linalg.eigh(squared.real + _KAK_EIGH_IMAG_WEIGHT * squared.imag)
+    right[np.linalg.det(right) < 0, :, 0] *= -1
+    d = np.exp(0.5j * np.angle(np.einsum('nji,njk,nki->ni', right, squared, right)))
+    left = magic @ right * d.conj()[:, np.newaxis, :]
+    flip = np.linalg.det(left.real) < 0
+    left[flip, :, 0] *= -1
+    d[flip, 0] *= -1
+    decomposed = np.all(np.abs(left.imag) <= atol, axis=(1, 2))
+
+    a1, a0 = _so4_to_magic_su2s_batch(left.real)
+    b1, b0 = _so4_to_magic_su2s_batch(np.swapaxes(right, -1, -2))
+    w, x, y, z = (np.angle(d) @ KAK_GAMMA.T).T
+    phases, after, before, coefficients = _kak_canonicalize_vectors(np.stack([x, y, z], axis=-1))
+
+    result = BatchedKakDecomposition(
+        global_phases=np.exp(1j * w) * phases,
+        single_qubit_operations_before=np.stack([before[:, 1] @ b1, before[:, 0] @ b0], axis=1),
+        interaction_coefficients=coefficients,
+        single_qubit_operations_after=np.stack([a1 @ after[:, 1], a0 @ after[:, 0]], axis=1),
+    )
+    for i in np.flatnonzero(~decomposed):
+        kak = kak_decomposition(mats[i], rtol=rtol, atol=atol, check_preconditions=False)
+        result.global_phases[i] = kak.global_phase
+        result.single_qubit_operations_before[i] = kak.single_qubit_operations_before
+        result.interaction_coefficients[i] = kak.interaction_coefficients
+        result.single_qubit_operations_after[i] = kak.single_qubit_operations_after
+    return result
+
+
+def _so4_to_magic_su2s_batch(mats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized `cirq.so4_to_magic_su2s` of a stack of matrices, without checks."""
+    _, a, b = _kron_factor_4x4_to_2x2s_batch(MAGIC @ mats @ MAGIC_CONJ_T)
+    return a, b
+
+
+def _kron_factor_4x4_to_2x2s_batch(
+    mats: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `cirq.kron_factor_4x4_to_2x2s` of a stack of matrices."""
+    n = len(mats)
+    rows = np.arange(n)
+    a, b = np.divmod(np.abs(mats).reshape((n, 16)).argmax(axis=1), 4)
+
+    f1 = np.zeros((n, 2, 2), dtype=np.complex128)
+    f2 = np.zeros((n, 2, 2), dtype=np.complex128)
+    for i in range(2):
+        for j in range(2):
+            f1[rows, (a >> 1) ^ i, (b >> 1) ^ j] = mats[rows, a ^ (i << 1), b ^ (j << 1)]
+            f2[rows, (a & 1) ^ i, (b & 1) ^ j] = mats[rows, a ^ i, b ^ j]
+
+    for f in (f1, f2):
+        scale = np.sqrt(np.linalg.det(f))
+        scale[scale == 0] = 1
+        f /= scale[:, np.newaxis, np.newaxis]
+
+    g = mats[rows, a, b] / (f1[rows, a >> 1, b >> 1] * f2[rows, a & 1, b & 1])
+    negative = np.real(g) < 0
+    f1[negative] *= -1
+    g[negative] *= -1
+    return g, f1, f2
+
+
+def _kak_canonicalize_vectors(
+    vectors: np.ndarray, atol: float = 1e-9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `cirq.kak_canonicalize_vector` of a stack of vectors.
+
+    Args:
+        vectors: The XX/YY/ZZ interaction strengths, with shape (N, 3).
+        atol: How close x2 must be to π/4 to guarantee z2 >= 0
+
+    Returns:
+        The global phases, the per-qubit left factors and the per-qubit right
+        factors of the canonicalizations, as arrays with shapes (N,),
+        (N, 2, 2, 2) and (N, 2, 2, 2), and the canonicalized vectors.
+    """
+    v = np.array(vectors, dtype=np.float64)
+    n = len(v)
+    phase = np.ones(n, dtype=np.complex128)
+    left = np.tile(np.eye(2, dtype=np.complex128), (n, 2, 1, 1))
+    right = left.copy()
+
+    # The steps below mirror those of kak_canonicalize_vector, applied to the
+    # vectors selected by a mask.
+    def shift(k, step, mask):
+        v[mask, k] += step * np.pi / 2
+        phase[mask] *= 1j ** step
+        right[mask] = (_KAK_FLIPPERS[k] ** (step % 4)) @ right[mask]
+
+    def negate(k1, k2, mask):
+        v[mask, k1] *= -1
+        v[mask, k2] *= -1
+        phase[mask] *= -1
+        s = _KAK_FLIPPERS[3 - k1 - k2]
+        left[mask, 1] = left[mask, 1] @ s
+        right[mask, 1] = s @ right[mask, 1]
+
+    def swap(k1, k2, mask):
+        v[mask, k1], v[mask, k2] = v[mask, k2], v[mask, k1]
+        s = _KAK_SWAPPERS[3 - k1 - k2]
+        left[mask] = left[mask] @ s
+        right[mask] = s @ right[mask]
+
+    def canonical_shift(k):
+        while np.any(v[:, k] <= -np.pi / 4):
+            shift(k, +1, v[:, k] <= -np.pi / 4)
+        while np.any(v[:, k] > np.pi / 4):
+            shift(k, -1, v[:, k] > np.pi / 4)
+
+    def sort():
+        swap(0, 1, np.abs(v[:, 0]) < np.abs(v[:, 1]))
+        swap(1, 2, np.abs(v[:, 1]) < np.abs(v[:, 2]))
+        swap(0, 1, np.abs(v[:, 0]) < np.abs(v[:, 1]))
+
+    canonical_shift(0)
+    canonical_shift(1)
+    canonical_shift(2)
+    sort()
+
+    negate(0, 2, v[:, 0] < 0)
+    negate(1, 2, v[:, 1] < 0)
+    canonical_shift(2)
+
+    mask = (v[:, 0] > np.pi / 4 - atol) & (v[:, 2] < 0)
+    shift(0, -1, mask)
+    negate(0, 2, mask)
+
+    return phase, left, right, v
+
+
 # TODO(#3388) Add documentation for Raises.
 # pylint: disable=missing-raises-doc
 def kak_vector(
@@ -748,6 +748,69 @@ def test_kak_decompose(unitary: np.ndarray):
     assert len(list(circuit.all_operations())) == 8
 
 
+def test_batched_kak_decomposition():
+    unitaries = np.array(
+        [
+            np.eye(4),
+            SWAP,
+            SWAP * 1j,
+            CZ,
+            CNOT,
+            SWAP @ CZ,
+            cirq.unitary(cirq.ISWAP ** 0.5),
+            cirq.unitary(cirq.FSimGate(theta=np.pi / 2, phi=np.pi / 6)),
+            np.kron(cirq.unitary(cirq.H), cirq.unitary(cirq.T)),
+        ]
+        + [cirq.testing.random_unitary(4, random_state=seed) for seed in range(20)]
+    )
+    batch = cirq.batched_kak_decomposition(unitaries)
+    assert len(batch) == len(unitaries)
+    assert batch.interaction_coefficients.shape == (len(unitaries), 3)
+    assert batch.single_qubit_operations_before.shape == (len(unitaries), 2, 2, 2)
+    for kak, unitary in zip(batch, unitaries):
+        np.testing.assert_allclose(cirq.unitary(kak), unitary, atol=1e-8)
+        np.testing.assert_allclose(
+            kak.interaction_coefficients,
+            cirq.kak_decomposition(unitary).interaction_coefficients,
+            atol=1e-8,
+        )
+
+    assert len(batch[3:6]) == 3
+    np.testing.assert_allclose(cirq.unitary(batch[3:6][-1]), SWAP @ CZ, atol=1e-8)
+    assert len(cirq.batched_kak_decomposition([])) == 0
+
+
+def test_batched_kak_decomposition_falls_back_to_kak_decomposition(monkeypatch):
+    # Without the imaginary part, the eigenvectors of degenerate real parts
+    # don't diagonalize the whole matrix.
+    monkeypatch.setattr(cirq.linalg.decompositions, '_KAK_EIGH_IMAG_WEIGHT', 0)
+    unitary = cirq.unitary(cirq.FSimGate(theta=0.3, phi=0.2))
+    batch = cirq.batched_kak_decomposition([unitary, SWAP @ CZ])
+    np.testing.assert_allclose(cirq.unitary(batch[0]), unitary, atol=1e-8)
+    np.testing.assert_allclose(cirq.unitary(batch[1]), SWAP @ CZ, atol=1e-8)
+
+
+def test_batched_kak_decomposition_invalid_input():
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.batched_kak_decomposition(np.eye(4))
+
+    with pytest.raises(ValueError, match='4x4 unitary matrices'):
+        _ = cirq.batched_kak_decomposition([np.eye(4), np.ones((4, 4))])
+
+
+def test_batched_kak_decomposition_repr():
+    batch = cirq.batched_kak_decomposition([CZ, SWAP])
+    restored = eval(repr(batch), {'cirq': cirq, 'np': np})
+    np.testing.assert_array_equal(restored.global_phases, batch.global_phases)
+    np.testing.assert_array_equal(
+        restored.single_qubit_operations_before, batch.single_qubit_operations_before
+    )
+    np.testing.assert_array_equal(restored.interaction_coefficients, batch.interaction_coefficients)
+    np.testing.assert_array_equal(
+        restored.single_qubit_operations_after, batch.single_qubit_operations_after
+    )
+
+
 def test_num_two_qubit_gates_required():
     for i in range(4):
         assert (
@@ -125,6 +125,7 @@ from cirq.ops.kraus_channel import (
 )
 
 from cirq.ops.linear_combinations import (
+    CompiledPauliSum,
     LinearCombinationOfGates,
     LinearCombinationOfOperations,
     PauliSum,
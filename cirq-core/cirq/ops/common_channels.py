@@ -731,6 +731,12 @@ class ResetChannel(gate_features.SingleQubitGate):
                 ops.X._act_on_(args, qubits)
             return True
 
+        if isinstance(args, sim.ActOnCliffordTableauArgs):
+            axe = args.qubit_map[qubits[0]]
+            if args.tableau._measure(axe, args.prng):
+                ops.X._act_on_(args, qubits)
+            return True
+
         if isinstance(args, sim.ActOnStateVectorArgs):
             # Do a silent measurement.
             axes = args.get_axes(qubits)
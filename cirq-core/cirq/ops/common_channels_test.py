@@ -517,6 +517,23 @@ def test_reset_act_on():
     )
 
 
+def test_reset_act_on_clifford_tableau():
+    q = cirq.LineQubit.range(2)
+    args = cirq.ActOnCliffordTableauArgs(
+        tableau=cirq.CliffordTableau(num_qubits=2, initial_state=3),
+        qubits=q,
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+
+    cirq.act_on(cirq.ResetChannel(), args, [q[1]])
+    assert args.log_of_measurement_results == {}
+    assert args.tableau == cirq.CliffordTableau(num_qubits=2, initial_state=2)
+
+    cirq.act_on(cirq.ResetChannel(), args, [q[1]])
+    assert args.tableau == cirq.CliffordTableau(num_qubits=2, initial_state=2)
+
+
 def test_reset_each():
     qubits = cirq.LineQubit.range(8)
     for n in range(len(qubits) + 1):
@@ -32,6 +32,7 @@ import numpy as np
 from sympy.logic.boolalg import And, Not, Or, Xor
 from sympy.core.expr import Expr
 from sympy.core.symbol import Symbol
+import scipy.sparse.linalg
 from scipy.sparse import csr_matrix
 
 from cirq import linalg, protocols, qis, value
@@ -306,6 +307,31 @@ class LinearCombinationOfOperations(value.LinearDict[raw_types.Operation]):
             result += coefficient * u
         return result.reshape((num_dim, num_dim))
 
+    def sparse_matrix(self) -> csr_matrix:
+        """Reconstructs matrix of self as a sparse matrix using Pauli
+        expansions of underlying operations.
+
+        The matrix is built from the Pauli bitmasks of the expansion of self,
+        without forming any dense matrix, in the computational basis of
+        `self.qubits`.
+
+        Raises:
+            TypeError: if any of the operations in self does not provide a
+                Pauli expansion.
+        """
+        if self._is_parameterized_():
+            return NotImplemented
+        paulis = {'X': pauli_gates.X, 'Y': pauli_gates.Y, 'Z': pauli_gates.Z}
+        pauli_sum = PauliSum(
+            value.LinearDict(
+                {
+                    frozenset((q, paulis[p]) for q, p in zip(self.qubits, names) if p != 'I'): c
+                    for names, c in protocols.pauli_expansion(self).items()
+                }
+            )
+        )
+        return pauli_sum.sparse_matrix(self.qubits)
+
     def _has_unitary_(self) -> bool:
         m = self.matrix()
         return m is not NotImplemented and linalg.is_unitary(m)
@@ -388,6 +414,8 @@ class PauliSum:
                 "subtracting PauliStrings"
             )
         self._linear_dict = linear_dict
+        # Sparse matrices and linear operators of self, by kind and qubits.
+        self._matrix_cache: Dict[Tuple[str, Tuple[raw_types.Qid, ...]], Any] = {}
 
     def _value_equality_values_(self):
         return self._linear_dict
@@ -497,6 +525,90 @@ class PauliSum:
             result += coeff * op.matrix(qubits)
         return result
 
+    def sparse_matrix(self, qubits: Optional[Iterable[raw_types.Qid]] = None) -> csr_matrix:
+        """Returns the matrix of self as a sparse matrix, in the computational
+        basis of qubits.
+
+        The matrix is built directly from the bitmasks of the Pauli products,
+        without forming any dense matrix, and is cached until self is modified
+        in place. The returned matrix is shared between calls and must not be
+        modified.
+
+        Args:
+            qubits: Ordered collection of qubits that determine the subspace
+                in which the matrix representation of the sum is to be
+                computed. Must include all of `self.qubits`. Defaults to
+                `self.qubits`.
+
+        Returns:
+            A `scipy.sparse.csr_matrix` with shape `(2 ** n, 2 ** n)`.
+
+        Raises:
+            ValueError: if `qubits` are not distinct or do not include all of
+                the qubits of self.
+        """
+        qubits, qubit_map = self._qubits_and_map(qubits)
+        key = ('sparse_matrix', qubits)
+        if key not in self._matrix_cache:
+            groups = _pauli_groups(self._linear_dict.items(), qubit_map, len(qubits))
+            self._matrix_cache[key] = _pauli_sparse_matrix(groups, len(qubits))
+        return self._matrix_cache[key]
+
+    def linear_operator(
+        self, qubits: Optional[Iterable[raw_types.Qid]] = None
+    ) -> scipy.sparse.linalg.LinearOperator:
+        """Returns a matrix-free linear operator that applies self.
+
+        The operator acts on vectors indexed by the computational basis of
+        qubits without storing any matrix, and is cached until self is
+        modified in place. It supports products with vectors and matrices and
+        with their adjoints, and can be passed to the solvers in
+        `scipy.sparse.linalg`.
+
+        Args:
+            qubits: Ordered collection of qubits that determine the subspace
+                in which the sum acts. Must include all of `self.qubits`.
+                Defaults to `self.qubits`.
+
+        Returns:
+            A `scipy.sparse.linalg.LinearOperator` with shape
+            `(2 ** n, 2 ** n)`.
+
+        Raises:
+            ValueError: if `qubits` are not distinct or do not include all of
+                the qubits of self.
+        """
+        qubits, qubit_map = self._qubits_and_map(qubits)
+        key = ('linear_operator', qubits)
+        if key not in self._matrix_cache:
+            num_qubits = len(qubits)
+            terms = list(self._linear_dict.items())
+            groups = _pauli_groups(terms, qubit_map, num_qubits)
+            # Pauli products are Hermitian, so the adjoint conjugates only coefficients.
+            adjoint_terms = [(vec, np.conj(coeff)) for vec, coeff in terms]
+            adjoint_groups = _pauli_groups(adjoint_terms, qubit_map, num_qubits)
+            self._matrix_cache[key] = scipy.sparse.linalg.LinearOperator(
+                shape=(1 << num_qubits, 1 << num_qubits),
+                matvec=lambda v: _apply_pauli_groups(groups, num_qubits, v),
+                rmatvec=lambda v: _apply_pauli_groups(adjoint_groups, num_qubits, v),
+                matmat=lambda m: _apply_pauli_groups(groups, num_qubits, m),
+                rmatmat=lambda m: _apply_pauli_groups(adjoint_groups, num_qubits, m),
+                dtype=np.complex128,
+            )
+        return self._matrix_cache[key]
+
+    def _qubits_and_map(
+        self, qubits: Optional[Iterable[raw_types.Qid]]
+    ) -> Tuple[Tuple[raw_types.Qid, ...], Dict[raw_types.Qid, int]]:
+        qubits = self.qubits if qubits is None else tuple(qubits)
+        qubit_map = {q: i for i, q in enumerate(qubits)}
+        if len(qubit_map) != len(qubits) or not set(self.qubits) <= set(qubit_map):
+            raise ValueError(
+                f'Qubits {qubits!r} must be distinct and include all of the qubits '
+                f'{self.qubits!r} of the PauliSum.'
+            )
+        return qubits, qubit_map
+
     def _has_unitary_(self) -> bool:
         return linalg.is_unitary(self.matrix())
 
@@ -560,9 +672,7 @@ class PauliSum:
                 dtype=state_vector.dtype,
                 atol=atol,
             )
-        return sum(
-            p._expectation_from_state_vector_no_validation(state_vector, qubit_map) for p in self
-        )
+        return self.compile(qubit_map).expectation_from_state_vector(state_vector)
 
     # TODO(#3388) Add documentation for Raises.
     def expectation_from_density_matrix(
@@ -620,6 +730,19 @@ class PauliSum:
             )
         return sum(p._expectation_from_density_matrix_no_validation(state, qubit_map) for p in self)
 
+    def compile(self, qubit_map: Mapping[raw_types.Qid, int]) -> 'CompiledPauliSum':
+        """Prepares this PauliSum for evaluating expectation values of many states.
+
+        Args:
+            qubit_map: A map from all qubits used in this PauliSum to the
+                indices of the qubits that states are defined over.
+
+        Returns:
+            A `cirq.CompiledPauliSum` that evaluates the expectation value of
+            this PauliSum, as it is now, for single states or batches of them.
+        """
+        return CompiledPauliSum(self, qubit_map)
+
     # pylint: enable=missing-raises-doc
     def __iter__(self):
         for vec, coeff in self._linear_dict.items():
@@ -638,6 +761,7 @@ class PauliSum:
             return NotImplemented
 
         self._linear_dict += other._linear_dict
+        self._matrix_cache.clear()
         return self
 
     def __add__(self, other):
@@ -666,6 +790,7 @@ class PauliSum:
             return NotImplemented
 
         self._linear_dict -= other._linear_dict
+        self._matrix_cache.clear()
         return self
 
     def __sub__(self, other):
@@ -692,7 +817,7 @@ class PauliSum:
                 [term * other_term for term in self for other_term in other]
             )
             self._linear_dict = temp._linear_dict
-
+        self._matrix_cache.clear()
         return self
 
     def __mul__(self, other: PauliSumLike):
@@ -744,6 +869,226 @@ class PauliSum:
         return self.__format__('.3f')
 
 
+class CompiledPauliSum:
+    """A PauliSum prepared for evaluating the expectation values of many states.
+
+    Each Pauli product maps the computational basis state `|b⟩` to a phase
+    times `|b ^ x⟩`, where the bitmask `x` marks its X and Y factors and the
+    phase depends on the parity of `b & z`, where `z` marks its Y and Z
+    factors. Terms are grouped by `x`. For each group, the product of the
+    state with its conjugate permuted by `x` is computed once. Every term in
+    the group then reduces to a signed sum over that product. Groups with many
+    terms get all of their signed sums at once from a Walsh-Hadamard
+    transform. No term goes through the unitary protocols, and whole batches
+    of states are evaluated together.
+
+    Create instances with `cirq.PauliSum.compile`. Later changes to the
+    PauliSum are not reflected in instances compiled from it.
+    """
+
+    def __init__(self, pauli_sum: PauliSum, qubit_map: Mapping[raw_types.Qid, int]) -> None:
+        """Compiles a PauliSum.
+
+        Args:
+            pauli_sum: The observable to compile.
+            qubit_map: A map from all qubits used in `pauli_sum` to the
+                indices of the qubits that states are defined over.
+        """
+        self._qubits = pauli_sum.qubits
+        self._qubit_map = qubit_map
+        self._terms = list(pauli_sum._linear_dict.items())
+        # (x mask, z masks, weights) of each group of terms, by number of qubits.
+        self._groups: Dict[int, List[Tuple[int, np.ndarray, np.ndarray]]] = {}
+
+    def _groups_for(self, num_qubits: int) -> List[Tuple[int, np.ndarray, np.ndarray]]:
+        if num_qubits not in self._groups:
+            _validate_qubit_mapping(self._qubit_map, self._qubits, num_qubits)
+            self._groups[num_qubits] = _pauli_groups(self._terms, self._qubit_map, num_qubits)
+        return self._groups[num_qubits]
+
+    def expectation_from_state_vector(self, state_vector: np.ndarray) -> complex:
+        """Evaluates the expectation value of a state vector.
+
+        This method does not check that the state vector is normalized.
+
+        Args:
+            state_vector: A state vector with shape `(2 ** n,)` or
+                `(2,) * n`.
+
+        Returns:
+            The expectation value of the input state.
+        """
+        return self.expectation_from_state_vectors(np.reshape(state_vector, (1, -1)))[0]
+
+    # TODO(#3388) Add documentation for Raises.
+    # pylint: disable=missing-raises-doc
+    def expectation_from_state_vectors(self, state_vectors: np.ndarray) -> np.ndarray:
+        """Evaluates the expectation values of a batch of state vectors.
+
+        This method does not check that the state vectors are normalized.
+
+        Args:
+            state_vectors: State vectors with shape `(batch_size, 2 ** n)`.
+
+        Returns:
+            An array of shape `(batch_size,)` with the expectation value of
+            each input state.
+        """
+        state_vectors = np.asarray(state_vectors)
+        size = state_vectors.shape[-1]
+        num_qubits = size.bit_length() - 1
+        if len(state_vectors.shape) != 2 or size != 1 << num_qubits:
+            raise ValueError(
+                "Input array does not represent a batch of state vectors "
+                "with shape `(batch_size, 2 ** n)`."
+            )
+
+        # Basis states along the leading axes keep the halves split off by the
+        # transforms below contiguous.
+        batch_size = state_vectors.shape[0]
+        amplitudes = np.ascontiguousarray(state_vectors.T).reshape((2,) * num_qubits + (-1,))
+        result = np.zeros(batch_size, dtype=np.complex128)
+        for x, z_masks, weights in self._groups_for(num_qubits):
+            # Flipping the axes of the bits in x maps each index b to b ^ x.
+            flipped = np.flip(
+                amplitudes, [i for i in range(num_qubits) if x >> (num_qubits - 1 - i) & 1]
+            )
+            products = (flipped.conj() * amplitudes).reshape(size, batch_size)
+            if len(z_masks) > num_qubits // 2:
+                result += weights @ _walsh_hadamard_transform(products)[z_masks]
+                continue
+            for z, weight in zip(z_masks.tolist(), weights):
+                result += weight * _signed_sum(products, z)
+        return result
+
+    # pylint: enable=missing-raises-doc
+
+
+def _pauli_groups(
+    terms: Iterable[Tuple[UnitPauliStringT, value.Scalar]],
+    qubit_map: Mapping[raw_types.Qid, int],
+    num_qubits: int,
+) -> List[Tuple[int, np.ndarray, np.ndarray]]:
+    """Groups Pauli products by the basis states they map to each other.
+
+    Returns:
+        A list with an `(x, z_masks, weights)` tuple for each distinct `x`,
+        such that the terms with that `x` map `|b⟩` to
+        `sum_t weights[t] * (-1)**popcount(b & z_masks[t]) * |b ^ x⟩`. The
+        qubit with index `i` in `qubit_map` corresponds to bit
+        `num_qubits - 1 - i`.
+    """
+    terms_by_x: Dict[int, List[Tuple[int, complex]]] = defaultdict(list)
+    for vec, coeff in terms:
+        x = z = 0
+        num_y = 0
+        for qubit, pauli in vec:
+            bit = 1 << (num_qubits - 1 - qubit_map[qubit])
+            if pauli != pauli_gates.Z:
+                x |= bit
+            if pauli != pauli_gates.X:
+                z |= bit
+            if pauli == pauli_gates.Y:
+                num_y += 1
+        # Y = iXZ, with Z acting first.
+        terms_by_x[x].append((z, coeff * 1j ** num_y))
+    return [
+        (
+            x,
+            np.array([z for z, _ in terms], dtype=np.int64),
+            np.array([weight for _, weight in terms], dtype=np.complex128),
+        )
+        for x, terms in terms_by_x.items()
+    ]
+
+
+def _pauli_sparse_matrix(
+    groups: List[Tuple[int, np.ndarray, np.ndarray]], num_qubits: int
+) -> csr_matrix:
+    """Returns the sparse matrix of grouped Pauli products.
+
+    Each group contributes a permuted diagonal: column `b` has the entry
+    `sum_t weights[t] * (-1)**popcount(b & z_masks[t])` in row `b ^ x`. Every
+    row therefore has one slot per group, which fills the CSR arrays directly.
+    """
+    size = 1 << num_qubits
+    rows = np.arange(size, dtype=np.int64)
+    indices = np.empty((size, len(groups)), dtype=np.int64)
+    data = np.empty((size, len(groups)), dtype=np.complex128)
+    for k, (x, z_masks, weights) in enumerate(groups):
+        if len(z_masks) > num_qubits // 2:
+            coefficients = np.zeros((size, 1), dtype=np.complex128)
+            coefficients[z_masks, 0] = weights
+            diagonal = _walsh_hadamard_transform(coefficients)[:, 0]
+        else:
+            diagonal = np.zeros(size, dtype=np.complex128)
+            for z, weight in zip(z_masks.tolist(), weights):
+                diagonal += _negate_odd_parities(np.full((size, 1), weight), z)[:, 0]
+        indices[:, k] = rows ^ x
+        data[:, k] = diagonal[indices[:, k]]
+    matrix = csr_matrix(
+        (data.ravel(), indices.ravel(), np.arange(size + 1, dtype=np.int64) * len(groups)),
+        shape=(size, size),
+    )
+    matrix.eliminate_zeros()
+    matrix.sort_indices()
+    return matrix
+
+
+def _apply_pauli_groups(
+    groups: List[Tuple[int, np.ndarray, np.ndarray]], num_qubits: int, values: np.ndarray
+) -> np.ndarray:
+    """Applies grouped Pauli products to vectors or to the columns of a matrix."""
+    values = np.asarray(values)
+    size = 1 << num_qubits
+    columns = values.reshape(size, -1)
+    result = np.zeros(columns.shape, dtype=np.complex128)
+    for x, z_masks, weights in groups:
+        accumulated = np.zeros(columns.shape, dtype=np.complex128)
+        for z, weight in zip(z_masks.tolist(), weights):
+            accumulated += _negate_odd_parities(weight * columns, z)
+        # Flipping the axes of the bits in x maps each index b to b ^ x.
+        flipped = np.flip(
+            accumulated.reshape((2,) * num_qubits + (-1,)),
+            [i for i in range(num_qubits) if x >> (num_qubits - 1 - i) & 1],
+        )
+        result += flipped.reshape(columns.shape)
+    return result.reshape(values.shape)
+
+
+def _negate_odd_parities(values: np.ndarray, mask: int) -> np.ndarray:
+    """Multiplies each row `values[b]` by `(-1)**popcount(b & mask)` in place."""
+    bit = 1
+    while bit <= mask:
+        if mask & bit:
+            values.reshape(-1, 2, bit, values.shape[-1])[:, 1] *= -1
+        bit <<= 1
+    return values
+
+
+def _signed_sum(values: np.ndarray, mask: int) -> np.ndarray:
+    """Returns `sum_b (-1)**popcount(b & mask) * values[b]`."""
+    bit = len(values) >> 1
+    while bit:
+        halves = values.reshape(2, bit, -1)
+        values = halves[0] - halves[1] if mask & bit else halves[0] + halves[1]
+        bit >>= 1
+    return values[0]
+
+
+def _walsh_hadamard_transform(values: np.ndarray) -> np.ndarray:
+    """Returns `sum_b (-1)**popcount(b & z) * values[b]` for each `z`."""
+    values = values.copy()
+    half = len(values) >> 1
+    while half:
+        pairs = values.reshape(-1, 2, half, values.shape[-1])
+        difference = pairs[:, 0] - pairs[:, 1]
+        pairs[:, 0] += pairs[:, 1]
+        pairs[:, 1] = difference
+        half >>= 1
+    return values
+
+
 def _projector_string_from_projector_dict(projector_dict, coefficient=1.0):
     return ProjectorString(dict(projector_dict), coefficient)
 
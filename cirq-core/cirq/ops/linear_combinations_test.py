@@ -17,6 +17,7 @@ from typing import Union
 
 import numpy as np
 import pytest
+import scipy.sparse
 import sympy
 import sympy.parsing.sympy_parser as sympy_parser
 
@@ -678,6 +679,15 @@ def test_linear_combination_of_operations_has_correct_qubits(terms, expected_qub
 def test_linear_combination_of_operations_has_correct_matrix(terms, expected_matrix):
     combination = cirq.LinearCombinationOfOperations(terms)
     assert np.allclose(combination.matrix(), expected_matrix)
+    assert np.allclose(combination.sparse_matrix().toarray(), expected_matrix)
+
+
+def test_linear_combination_of_operations_sparse_matrix_unavailable():
+    q = cirq.LineQubit(0)
+    t = sympy.Symbol('t')
+    assert cirq.LinearCombinationOfOperations({cirq.X(q) ** t: 1}).sparse_matrix() is NotImplemented
+    with pytest.raises(TypeError):
+        _ = cirq.LinearCombinationOfOperations({cirq.measure(q): 1}).sparse_matrix()
 
 
 @pytest.mark.parametrize(
@@ -1224,6 +1234,67 @@ def test_pauli_sum_matrix():
     assert np.allclose(H3, paulisum.matrix([q[1], q[2], q[0]]))
 
 
+@pytest.mark.parametrize('num_qubits, num_terms', [(1, 4), (3, 2), (5, 40)])
+def test_pauli_sum_sparse_matrix_and_linear_operator(num_qubits, num_terms):
+    prng = np.random.RandomState(num_qubits)
+    qubits = cirq.LineQubit.range(num_qubits)
+    paulis = [cirq.I, cirq.X, cirq.Y, cirq.Z]
+    psum = cirq.PauliSum.from_pauli_strings(
+        [
+            cirq.PauliString({q: paulis[prng.randint(4)] for q in qubits}, prng.randn() + 1j)
+            for _ in range(num_terms)
+        ]
+    )
+    vector = prng.randn(2 ** (num_qubits + 2)) + 1j * prng.randn(2 ** (num_qubits + 2))
+    block = vector.reshape(-1, 2)
+    for order in [None, qubits[::-1], [cirq.LineQubit(num_qubits)] + qubits]:
+        matrix = psum.matrix(order)
+        sparse = psum.sparse_matrix(order)
+        assert isinstance(sparse, scipy.sparse.csr_matrix)
+        np.testing.assert_allclose(sparse.toarray(), matrix, atol=1e-12)
+        assert sparse.nnz == np.count_nonzero(np.round(matrix, 12))
+
+        operator = psum.linear_operator(order)
+        v = vector[: len(matrix)]
+        m = block[: len(matrix)]
+        np.testing.assert_allclose(operator.matvec(v), matrix @ v, atol=1e-12)
+        np.testing.assert_allclose(operator.rmatvec(v), matrix.conj().T @ v, atol=1e-12)
+        np.testing.assert_allclose(operator.matmat(m), matrix @ m, atol=1e-12)
+        np.testing.assert_allclose(operator.H @ m, matrix.conj().T @ m, atol=1e-12)
+
+
+def test_pauli_sum_sparse_matrix_cache():
+    q0, q1, q2 = cirq.LineQubit.range(3)
+    psum = cirq.X(q0) * cirq.X(q1) + cirq.Z(q0)
+    assert psum.sparse_matrix() is psum.sparse_matrix()
+    assert psum.linear_operator() is psum.linear_operator()
+    assert psum.sparse_matrix([q1, q0]) is not psum.sparse_matrix()
+
+    psum2 = psum + cirq.Y(q1)
+    np.testing.assert_allclose(psum.sparse_matrix().toarray(), psum.matrix())
+    for mutate in [
+        lambda p: p.__iadd__(cirq.Y(q1)),
+        lambda p: p.__isub__(cirq.Z(q0)),
+        lambda p: p.__imul__(2),
+        lambda p: p.__imul__(cirq.X(q1)),
+    ]:
+        sparse = psum2.sparse_matrix()
+        operator = psum2.linear_operator()
+        mutate(psum2)
+        assert psum2.sparse_matrix() is not sparse
+        np.testing.assert_allclose(psum2.sparse_matrix().toarray(), psum2.matrix())
+        np.testing.assert_allclose(psum2.linear_operator().matmat(np.eye(4)), psum2.matrix())
+        assert psum2.linear_operator() is not operator
+    np.testing.assert_allclose(psum.sparse_matrix().toarray(), psum.matrix())
+
+    np.testing.assert_allclose(cirq.PauliSum().sparse_matrix().toarray(), [[0]])
+    np.testing.assert_allclose(cirq.PauliSum().linear_operator([q0]).matvec([1, 1]), [0, 0])
+    with pytest.raises(ValueError, match='include all of the qubits'):
+        _ = psum.sparse_matrix([q0, q2])
+    with pytest.raises(ValueError, match='must be distinct'):
+        _ = psum.linear_operator([q0, q1, q0])
+
+
 def test_pauli_sum_repr():
     q = cirq.LineQubit.range(2)
     pstr1 = cirq.X(q[0]) * cirq.X(q[1])
@@ -1527,6 +1598,59 @@ def test_expectation_from_state_vector_two_qubit_states():
         )
 
 
+@pytest.mark.parametrize('num_qubits, num_terms', [(1, 4), (3, 2), (5, 40)])
+def test_compiled_expectation_from_state_vectors(num_qubits, num_terms):
+    prng = np.random.RandomState(num_qubits)
+    qubits = cirq.LineQubit.range(num_qubits)
+    paulis = [cirq.I, cirq.X, cirq.Y, cirq.Z]
+    psum = cirq.PauliSum.from_pauli_strings(
+        [
+            cirq.PauliString({q: paulis[prng.randint(4)] for q in qubits}, prng.randn())
+            for _ in range(num_terms)
+        ]
+    )
+    psum += 0.5
+    # Reversed qubit indices to exercise the qubit map.
+    q_map = {q: num_qubits - 1 - i for i, q in enumerate(qubits)}
+    matrix = psum.matrix(qubits[::-1])
+    states = np.array(
+        [cirq.testing.random_superposition(2 ** num_qubits, random_state=prng) for _ in range(4)]
+    )
+
+    compiled = psum.compile(q_map)
+    assert isinstance(compiled, cirq.CompiledPauliSum)
+    np.testing.assert_allclose(
+        compiled.expectation_from_state_vectors(states),
+        [np.vdot(state, matrix @ state) for state in states],
+        atol=1e-7,
+    )
+    np.testing.assert_allclose(
+        compiled.expectation_from_state_vector(states[0].reshape((2,) * num_qubits)),
+        psum.expectation_from_state_vector(states[0], q_map),
+        atol=1e-7,
+    )
+    for state in states:
+        np.testing.assert_allclose(
+            psum.expectation_from_state_vector(state, q_map),
+            sum(p._expectation_from_state_vector_no_validation(state, q_map) for p in psum),
+            atol=1e-7,
+        )
+
+
+def test_compiled_expectation_from_state_vectors_invalid_input():
+    q0, q1 = cirq.LineQubit.range(2)
+    compiled = (cirq.X(q0) + cirq.Z(q1)).compile({q0: 0, q1: 1})
+    with pytest.raises(ValueError, match='batch of state vectors'):
+        compiled.expectation_from_state_vectors(np.zeros(4, dtype=complex))
+    with pytest.raises(ValueError, match='batch of state vectors'):
+        compiled.expectation_from_state_vectors(np.zeros((2, 3), dtype=complex))
+    with pytest.raises(ValueError, match='must be valid for a state over 1 qubits'):
+        compiled.expectation_from_state_vectors(np.zeros((2, 2), dtype=complex))
+    np.testing.assert_allclose(
+        compiled.expectation_from_state_vectors(np.zeros((2, 8), dtype=complex)), [0, 0]
+    )
+
+
 def test_expectation_from_density_matrix_invalid_input():
     q0, q1, q2, q3 = cirq.LineQubit.range(4)
     psum = cirq.X(q0) + 2 * cirq.Y(q1) + 3 * cirq.Z(q3)
@@ -14,6 +14,7 @@
 
 """A simplified time-slice of operations within a sequenced circuit."""
 
+import hashlib
 from typing import (
     AbstractSet,
     Any,
@@ -94,6 +95,11 @@ class Moment:
         self._qubits = frozenset(self._qubit_to_op.keys())
         self._measurement_key_names: Optional[AbstractSet[str]] = None
 
+        # These variables are memoized when first requested.
+        self._sorted_operations: Optional[Tuple['cirq.Operation', ...]] = None
+        self._hash: Optional[int] = None
+        self._fingerprint_digest: Optional[bytes] = None
+
     @property
     def operations(self) -> Tuple['cirq.Operation', ...]:
         return self._operations
@@ -238,13 +244,23 @@ class Moment:
     def __bool__(self) -> bool:
         return bool(self.operations)
 
+    def _sorted_operations_(self) -> Tuple['cirq.Operation', ...]:
+        """The operations of the moment ordered by their qubits."""
+        if self._sorted_operations is None:
+            self._sorted_operations = tuple(sorted(self.operations, key=lambda op: op.qubits))
+        return self._sorted_operations
+
     def __eq__(self, other) -> bool:
         if not isinstance(other, type(self)):
             return NotImplemented
+        if self is other:
+            return True
+        if len(self._operations) != len(other._operations):
+            return False
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
 
-        return sorted(self.operations, key=lambda op: op.qubits) == sorted(
-            other.operations, key=lambda op: op.qubits
-        )
+        return self._sorted_operations_() == other._sorted_operations_()
 
     def _approx_eq_(self, other: Any, atol: Union[int, float]) -> bool:
         """See `cirq.protocols.SupportsApproximateEquality`."""
@@ -252,8 +268,8 @@ class Moment:
             return NotImplemented
 
         return protocols.approx_eq(
-            sorted(self.operations, key=lambda op: op.qubits),
-            sorted(other.operations, key=lambda op: op.qubits),
+            self._sorted_operations_(),
+            other._sorted_operations_(),
             atol=atol,
         )
 
@@ -261,7 +277,29 @@ class Moment:
         return not self == other
 
     def __hash__(self):
-        return hash((Moment, tuple(sorted(self.operations, key=lambda op: op.qubits))))
+        if self._hash is None:
+            self._hash = hash((Moment, self._sorted_operations_()))
+        return self._hash
+
+    def __getstate__(self):
+        # Don't save hash when pickling; see #3777.
+        state = self.__dict__.copy()
+        state['_hash'] = None
+        return state
+
+    def _fingerprint(self) -> bytes:
+        """A digest of the reprs of the moment's operations, ordered by qubits.
+
+        See `cirq.AbstractCircuit.fingerprint`.
+        """
+        if self._fingerprint_digest is None:
+            digest = hashlib.sha256()
+            for op in self._sorted_operations_():
+                op_repr = repr(op).encode()
+                digest.update(len(op_repr).to_bytes(8, 'little'))
+                digest.update(op_repr)
+            self._fingerprint_digest = digest.digest()
+        return self._fingerprint_digest
 
     def __iter__(self) -> Iterator['cirq.Operation']:
         return iter(self.operations)
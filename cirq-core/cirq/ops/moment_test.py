@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+
 import pytest
 
 import cirq
@@ -67,6 +69,32 @@ def test_equality():
     eq.make_equality_group(lambda: cirq.Moment([cirq.CZ(a, c), cirq.CZ(b, d)]))
 
 
+def test_cached_hash():
+    a, b = cirq.LineQubit.range(2)
+    m = cirq.Moment([cirq.X(b), cirq.Y(a)])
+    assert hash(m) == hash(cirq.Moment([cirq.Y(a), cirq.X(b)]))
+    assert m._hash is not None
+
+    # Unequal cached hashes short-circuit equality.
+    m_bad = cirq.Moment([cirq.X(b), cirq.Y(a)])
+    m_bad._hash = hash(m) + 1
+    assert m_bad != m
+
+    # The cached hash is not pickled.
+    m_ok = pickle.loads(pickle.dumps(m_bad))
+    assert m_ok == m
+    assert hash(m_ok) == hash(m)
+
+
+def test_fingerprint():
+    a, b = cirq.LineQubit.range(2)
+    m = cirq.Moment([cirq.X(b), cirq.Y(a)])
+    assert m._fingerprint() == cirq.Moment([cirq.Y(a), cirq.X(b)])._fingerprint()
+    assert m._fingerprint() != cirq.Moment([cirq.X(a), cirq.Y(b)])._fingerprint()
+    assert m._fingerprint() != cirq.Moment([cirq.X(b)])._fingerprint()
+    assert cirq.Moment()._fingerprint() == cirq.Moment()._fingerprint()
+
+
 def test_approx_eq():
     a = cirq.NamedQubit('a')
     b = cirq.NamedQubit('b')
@@ -118,6 +118,13 @@ def test_unitary(gate, num_copies, qubits):
     )
 
 
+def test_qid_shape():
+    qutrit_gate = cirq.MatrixGate(np.eye(3), qid_shape=(3,))
+    assert cirq.qid_shape(cirq.ParallelGate(qutrit_gate, 2)) == (3, 3)
+    assert cirq.qid_shape(cirq.ParallelGate(cirq.X, 3)) == (2, 2, 2)
+    _ = cirq.ParallelGate(qutrit_gate, 2).on(*cirq.LineQid.range(2, dimension=3))
+
+
 def test_not_implemented_diagram():
     q = cirq.LineQubit.range(2)
     g = cirq.SingleQubitGate()
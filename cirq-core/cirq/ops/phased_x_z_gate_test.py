@@ -227,6 +227,25 @@ def test_inverse():
     )
 
 
+def test_unitary():
+    a = random.random()
+    b = random.random()
+    c = random.random()
+    q = cirq.LineQubit(0)
+    g = cirq.PhasedXZGate(x_exponent=a, z_exponent=b, axis_phase_exponent=c)
+
+    np.testing.assert_allclose(
+        cirq.unitary(g),
+        cirq.unitary(cirq.Circuit(cirq.decompose_once_with_qubits(g, [q]))),
+        atol=1e-8,
+    )
+    t = sympy.Symbol('t')
+    assert (
+        cirq.unitary(cirq.PhasedXZGate(x_exponent=t, z_exponent=b, axis_phase_exponent=c), None)
+        is None
+    )
+
+
 @pytest.mark.parametrize('resolve_fn', [cirq.resolve_parameters, cirq.resolve_parameters_once])
 def test_parameterized(resolve_fn):
     a = random.random()
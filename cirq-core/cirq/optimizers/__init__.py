@@ -90,6 +90,11 @@ from cirq.optimizers.three_qubit_decomposition import (
     three_qubit_matrix_to_operations,
 )
 
+from cirq.optimizers.two_qubit_compile_cache import (
+    TwoQubitCompileCache,
+    TwoQubitCompileCacheInfo,
+)
+
 from cirq.optimizers.two_qubit_decompositions import (
     two_qubit_matrix_to_operations,
     two_qubit_matrix_to_diagonal_and_operations,
@@ -0,0 +1,212 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in caching of the results of two-qubit decompositions."""
+
+import contextvars
+import hashlib
+import os
+import tempfile
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+import numpy as np
+
+from cirq import circuits, devices, protocols
+from cirq._scoped_cache import ScopedLruCache
+
+if TYPE_CHECKING:
+    import cirq
+
+# The grid that unitary entries are rounded to is finer than the tolerance of
+# the decomposition by this factor.
+_GRID_DIVISOR = 16
+
+_active_cache: 'contextvars.ContextVar[Optional[TwoQubitCompileCache]]' = contextvars.ContextVar(
+    'cirq_two_qubit_compile_cache', default=None
+)
+
+
+class TwoQubitCompileCacheInfo(NamedTuple):
+    """Statistics of a `cirq.TwoQubitCompileCache`.
+
+    Attributes:
+        hits: The number of decompositions that were found in memory.
+        disk_hits: The number of decompositions that were read from disk.
+        misses: The number of decompositions that were computed.
+        maxsize: The maximum number of decompositions held in memory.
+        currsize: The number of decompositions currently held in memory.
+    """
+
+    hits: int
+    disk_hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TwoQubitCompileCache(ScopedLruCache):
+    """A content-addressed cache of decompositions of two-qubit unitaries.
+
+    While a cache is active, `cirq.two_qubit_matrix_to_operations`,
+    `cirq.two_qubit_matrix_to_sqrt_iswap_operations` and
+    `cirq.decompose_two_qubit_interaction_into_four_fsim_gates` look up the
+    decomposition of their unitary before computing it. Decompositions are
+    keyed by the target gate set and by a canonical form of the unitary: its
+    entries rounded to a grid 16 times finer than the `atol` of the
+    decomposition, after removing the global phase whenever the decomposition
+    ignores it. Decompositions are computed on placeholder qubits and moved
+    onto the requested qubits when returned.
+
+    Up to `maxsize` decompositions are held in memory, evicting the least
+    recently used one. If a directory is given, decompositions are also stored
+    there as JSON files named after their key, so that they are shared by
+    every process using that directory. Files are written atomically, and
+    files that can't be read are recomputed and overwritten.
+
+    Like `cirq.ProtocolCache`, a compile cache only takes effect inside `with`
+    blocks that enter it:
+
+        cache = cirq.TwoQubitCompileCache(directory='/tmp/cirq_compile_cache')
+        with cache:
+            cirq.MergeInteractions().optimize_circuit(circuit)
+        print(cache.cache_info())
+    """
+
+    _active = _active_cache
+
+    def __init__(self, maxsize: int = 1024, *, directory: Optional[str] = None) -> None:
+        """Inits TwoQubitCompileCache.
+
+        Args:
+            maxsize: The maximum number of decompositions to hold in memory.
+            directory: The directory to store decompositions in, which is
+                created if needed. If not set, decompositions are only held in
+                memory.
+
+        Raises:
+            ValueError: `maxsize` is negative.
+        """
+        super().__init__(maxsize)
+        self._directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._disk_hits = 0
+
+    def cache_info(self) -> TwoQubitCompileCacheInfo:
+        """Returns the hit and miss statistics and the size of the cache."""
+        return TwoQubitCompileCacheInfo(
+            hits=self._hits,
+            disk_hits=self._disk_hits,
+            misses=self._misses,
+            maxsize=self._maxsize,
+            currsize=len(self._results),
+        )
+
+    def clear(self) -> None:
+        """Removes all decompositions held in memory and resets the statistics.
+
+        Decompositions stored on disk are kept.
+        """
+        super().clear()
+        self._disk_hits = 0
+
+    def _compute_missing(self, key: str, compute: Callable[[], Any]) -> Any:
+        result = self._read(key)
+        if result is not None:
+            self._disk_hits += 1
+            return result
+        result = super()._compute_missing(key, compute)
+        self._write(key, result)
+        return result
+
+    def _path(self, key: str) -> str:
+        assert self._directory is not None
+        return os.path.join(self._directory, f'{key}.json')
+
+    def _read(self, key: str) -> Any:
+        if self._directory is None:
+            return None
+        try:
+            return protocols.read_json(self._path(key))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, result: Any) -> None:
+        if self._directory is None:
+            return
+        with tempfile.NamedTemporaryFile(
+            'w', dir=self._directory, suffix='.tmp', delete=False
+        ) as file:
+            protocols.to_json(result, file)
+        os.replace(file.name, self._path(key))
+
+
+def _cached_decomposition(
+    target: str,
+    params: Tuple,
+    val: Any,
+    qubits: Sequence['cirq.Qid'],
+    decompose: Callable[[Sequence['cirq.Qid']], Any],
+    *,
+    atol: float,
+    ignore_global_phase: bool = True,
+) -> Any:
+    """Returns `decompose(qubits)`, memoized in the active compile cache, if any.
+
+    Args:
+        target: The name of the decomposition.
+        params: Further arguments the decomposition depends on.
+        val: The two-qubit unitary being decomposed, or a value with one.
+        qubits: The qubits to decompose onto.
+        decompose: Decomposes the unitary onto the given qubits.
+        atol: The tolerance of the decomposition.
+        ignore_global_phase: Whether the decomposition is only correct up to
+            global phase, so that unitaries differing by one share it.
+    """
+    cache = _active_cache.get()
+    if cache is None:
+        return decompose(qubits)
+    mat = val if isinstance(val, np.ndarray) else protocols.unitary(val, None)
+    if mat is None or mat.shape != (4, 4):
+        return decompose(qubits)
+
+    key = _canonical_key(target, params, mat, atol=atol, ignore_global_phase=ignore_global_phase)
+    placeholders = devices.LineQubit.range(2)
+    result = cache._lookup(key, lambda: decompose(placeholders))
+    qubit_map = dict(zip(placeholders, qubits))
+    if isinstance(result, circuits.Circuit):
+        return result.transform_qubits(qubit_map.__getitem__)
+    return [op.transform_qubits(qubit_map) for op in result]
+
+
+def _canonical_key(
+    target: str, params: Tuple, mat: np.ndarray, *, atol: float, ignore_global_phase: bool
+) -> str:
+    mat = np.asarray(mat, dtype=np.complex128)
+    if ignore_global_phase:
+        largest = mat.flat[np.argmax(np.abs(mat))]
+        if largest:
+            mat = mat * (abs(largest) / largest)
+    grid = np.round(mat.view(np.float64) * (_GRID_DIVISOR / atol)).astype(np.int64)
+    digest = hashlib.sha256(repr((target, params, atol)).encode())
+    digest.update(np.ascontiguousarray(grid).tobytes())
+    return digest.hexdigest()
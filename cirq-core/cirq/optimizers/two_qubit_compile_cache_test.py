@@ -0,0 +1,148 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def assert_implements(operations, unitary, qubits):
+    actual = cirq.Circuit(operations).unitary(
+        qubit_order=qubits, qubits_that_should_be_present=qubits
+    )
+    cirq.testing.assert_allclose_up_to_global_phase(actual, unitary, atol=1e-6)
+
+
+def test_two_qubit_matrix_to_operations_cached():
+    a, b, c = cirq.LineQubit.range(3)
+    u = cirq.testing.random_unitary(4, random_state=1)
+    expected = cirq.two_qubit_matrix_to_operations(a, b, u, allow_partial_czs=False)
+    with cirq.TwoQubitCompileCache() as cache:
+        assert cirq.two_qubit_matrix_to_operations(a, b, u, allow_partial_czs=False) == expected
+        assert cache.cache_info() == cirq.TwoQubitCompileCacheInfo(
+            hits=0, disk_hits=0, misses=1, maxsize=1024, currsize=1
+        )
+        # Decompositions are shared across qubits and global phases.
+        operations = cirq.two_qubit_matrix_to_operations(c, a, 1j * u, allow_partial_czs=False)
+        assert {q for op in operations for q in op.qubits} == {a, c}
+        assert_implements(operations, u, [c, a])
+        assert cache.cache_info().hits == 1
+
+        # Other gate sets and tolerances are cached separately.
+        operations = cirq.two_qubit_matrix_to_operations(a, b, u, allow_partial_czs=True)
+        assert_implements(operations, u, [a, b])
+        cirq.two_qubit_matrix_to_operations(a, b, u, allow_partial_czs=False, atol=1e-6)
+        assert cache.cache_info().misses == 3
+
+    cirq.two_qubit_matrix_to_operations(a, b, u, allow_partial_czs=False)
+    assert cache.cache_info().hits == 1
+
+
+def test_sqrt_iswap_and_fsim_cached():
+    a, b = cirq.LineQubit.range(2)
+    u = cirq.testing.random_unitary(4, random_state=2)
+    fsim_gate = cirq.FSimGate(theta=np.pi / 2, phi=0.1)
+    with cirq.TwoQubitCompileCache() as cache:
+        for _ in range(2):
+            operations = cirq.two_qubit_matrix_to_sqrt_iswap_operations(b, a, u)
+            assert_implements(operations, u, [b, a])
+            circuit = cirq.decompose_two_qubit_interaction_into_four_fsim_gates(
+                u, fsim_gate=fsim_gate, qubits=[b, a]
+            )
+            np.testing.assert_allclose(circuit.unitary(qubit_order=[b, a]), u, atol=1e-6)
+        # The FSim decomposition includes the global phase, so it isn't shared.
+        circuit = cirq.decompose_two_qubit_interaction_into_four_fsim_gates(
+            cirq.MatrixGate(1j * u).on(a, b), fsim_gate=fsim_gate
+        )
+        np.testing.assert_allclose(circuit.unitary(qubit_order=[a, b]), 1j * u, atol=1e-6)
+    assert cache.cache_info().hits == 2
+    assert cache.cache_info().misses == 3
+
+
+def test_uncacheable_values_are_decomposed():
+    a, b = cirq.LineQubit.range(2)
+    with cirq.TwoQubitCompileCache() as cache:
+        with pytest.raises(ValueError, match='unitary'):
+            _ = cirq.two_qubit_matrix_to_sqrt_iswap_operations(a, b, np.ones((4, 4)))
+        with pytest.raises(TypeError):
+            _ = cirq.decompose_two_qubit_interaction_into_four_fsim_gates(
+                cirq.measure(a, b), fsim_gate=cirq.FSimGate(theta=np.pi / 2, phi=0)
+            )
+    assert cache.cache_info().currsize == 0
+
+
+def test_unchecked_decompositions_do_not_skip_checks():
+    a, b = cirq.LineQubit.range(2)
+    mat = 1.1 * cirq.testing.random_unitary(4, random_state=3)
+    with cirq.TwoQubitCompileCache() as cache:
+        _ = cirq.two_qubit_matrix_to_sqrt_iswap_operations(a, b, mat, check_preconditions=False)
+        with pytest.raises(ValueError, match='unitary'):
+            _ = cirq.two_qubit_matrix_to_sqrt_iswap_operations(a, b, mat)
+    assert cache.cache_info().hits == 0
+
+
+def test_eviction_and_clear():
+    a, b = cirq.LineQubit.range(2)
+    unitaries = [cirq.testing.random_unitary(4, random_state=i) for i in range(3)]
+    with cirq.TwoQubitCompileCache(maxsize=2) as cache:
+        for u in unitaries + unitaries[:1]:
+            cirq.two_qubit_matrix_to_operations(a, b, u, allow_partial_czs=True)
+        assert cache.cache_info() == cirq.TwoQubitCompileCacheInfo(
+            hits=0, disk_hits=0, misses=4, maxsize=2, currsize=2
+        )
+        cache.clear()
+        assert cache.cache_info().currsize == 0
+
+    with cirq.TwoQubitCompileCache(maxsize=0) as cache:
+        cirq.two_qubit_matrix_to_operations(a, b, unitaries[0], allow_partial_czs=True)
+        cirq.two_qubit_matrix_to_operations(a, b, unitaries[0], allow_partial_czs=True)
+    assert cache.cache_info().misses == 2
+
+    with pytest.raises(ValueError, match='non-negative'):
+        _ = cirq.TwoQubitCompileCache(maxsize=-1)
+
+
+def test_disk_store(tmpdir):
+    a, b = cirq.LineQubit.range(2)
+    u = cirq.testing.random_unitary(4, random_state=3)
+    directory = os.path.join(tmpdir, 'compiled')
+    with cirq.TwoQubitCompileCache(directory=directory):
+        expected = cirq.two_qubit_matrix_to_sqrt_iswap_operations(a, b, u)
+        expected_circuit = cirq.decompose_two_qubit_interaction_into_four_fsim_gates(
+            u, fsim_gate=cirq.ISWAP
+        )
+    files = sorted(os.listdir(directory))
+    assert len(files) == 2 and all(name.endswith('.json') for name in files)
+
+    # Another cache, e.g. in another process, reads the stored decompositions.
+    with cirq.TwoQubitCompileCache(directory=directory) as cache:
+        assert cirq.two_qubit_matrix_to_sqrt_iswap_operations(a, b, u) == expected
+        assert (
+            cirq.decompose_two_qubit_interaction_into_four_fsim_gates(u, fsim_gate=cirq.ISWAP)
+            == expected_circuit
+        )
+    assert cache.cache_info() == cirq.TwoQubitCompileCacheInfo(
+        hits=0, disk_hits=2, misses=0, maxsize=1024, currsize=2
+    )
+
+    # Unreadable files are recomputed.
+    for name in files:
+        with open(os.path.join(directory, name), 'w') as file:
+            file.write('{')
+    with cirq.TwoQubitCompileCache(directory=directory) as cache:
+        assert cirq.two_qubit_matrix_to_sqrt_iswap_operations(a, b, u) == expected
+    assert cache.cache_info().misses == 1
@@ -27,6 +27,7 @@ from cirq.optimizers import (
     eject_z,
     eject_phased_paulis,
     merge_single_qubit_gates,
+    two_qubit_compile_cache,
 )
 
 if TYPE_CHECKING:
@@ -56,6 +57,27 @@ def two_qubit_matrix_to_operations(
     Returns:
         A list of operations implementing the matrix.
     """
+    return two_qubit_compile_cache._cached_decomposition(
+        'two_qubit_matrix_to_operations',
+        (allow_partial_czs, clean_operations),
+        mat,
+        (q0, q1),
+        lambda qubits: _two_qubit_matrix_to_operations(
+            *qubits, mat, allow_partial_czs, atol=atol, clean_operations=clean_operations
+        ),
+        atol=atol,
+    )
+
+
+def _two_qubit_matrix_to_operations(
+    q0: 'cirq.Qid',
+    q1: 'cirq.Qid',
+    mat: np.ndarray,
+    allow_partial_czs: bool,
+    *,
+    atol: float,
+    clean_operations: bool,
+) -> List[ops.Operation]:
     kak = linalg.kak_decomposition(mat, atol=atol)
     operations = _kak_decomposition_to_operations(q0, q1, kak, allow_partial_czs, atol=atol)
     if clean_operations:
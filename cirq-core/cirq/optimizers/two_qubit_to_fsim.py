@@ -12,6 +12,7 @@ from typing import (
 import numpy as np
 
 from cirq import ops, linalg, circuits, devices
+from cirq.optimizers import two_qubit_compile_cache
 
 if TYPE_CHECKING:
     import cirq
@@ -67,6 +68,27 @@ def decompose_two_qubit_interaction_into_four_fsim_gates(
             qubits = devices.LineQubit.range(2)
     if len(qubits) != 2:
         raise ValueError(f'Expected a pair of qubits, but got {qubits!r}.')
+    return two_qubit_compile_cache._cached_decomposition(
+        'decompose_two_qubit_interaction_into_four_fsim_gates',
+        (fsim_gate,),
+        interaction,
+        qubits,
+        lambda qubits: _decompose_two_qubit_interaction_into_four_fsim_gates(
+            interaction, fsim_gate=fsim_gate, mapped_gate=mapped_gate, qubits=qubits
+        ),
+        atol=1e-8,
+        ignore_global_phase=False,
+    )
+
+
+# pylint: enable=missing-raises-doc
+def _decompose_two_qubit_interaction_into_four_fsim_gates(
+    interaction: Any,
+    *,
+    fsim_gate: Union['cirq.FSimGate', 'cirq.ISwapPowGate'],
+    mapped_gate: 'cirq.FSimGate',
+    qubits: Sequence['cirq.Qid'],
+) -> 'cirq.Circuit':
     kak = linalg.kak_decomposition(interaction)
 
     result_using_b_gates = _decompose_two_qubit_interaction_into_two_b_gates(kak, qubits=qubits)
@@ -85,7 +107,6 @@ def decompose_two_qubit_interaction_into_four_fsim_gates(
     return result
 
 
-# pylint: enable=missing-raises-doc
 def _sticky_0_to_1(v: float, *, atol: float) -> Optional[float]:
     if 0 <= v <= 1:
         return v
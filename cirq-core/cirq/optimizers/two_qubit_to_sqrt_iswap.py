@@ -11,7 +11,7 @@ from typing import Optional, Sequence, Tuple, TYPE_CHECKING
 import numpy as np
 
 from cirq import ops, linalg, protocols
-from cirq.optimizers import decompositions
+from cirq.optimizers import decompositions, two_qubit_compile_cache
 
 if TYPE_CHECKING:
     import cirq
@@ -72,6 +72,33 @@ def two_qubit_matrix_to_sqrt_iswap_operations(
         two-qubit gate
         https://arxiv.org/abs/2105.06074
     """
+    return two_qubit_compile_cache._cached_decomposition(
+        'two_qubit_matrix_to_sqrt_iswap_operations',
+        (required_sqrt_iswap_count, use_sqrt_iswap_inv, check_preconditions),
+        mat,
+        (q0, q1),
+        lambda qubits: _two_qubit_matrix_to_sqrt_iswap_operations(
+            *qubits,
+            mat,
+            required_sqrt_iswap_count=required_sqrt_iswap_count,
+            use_sqrt_iswap_inv=use_sqrt_iswap_inv,
+            atol=atol,
+            check_preconditions=check_preconditions,
+        ),
+        atol=atol,
+    )
+
+
+def _two_qubit_matrix_to_sqrt_iswap_operations(
+    q0: 'cirq.Qid',
+    q1: 'cirq.Qid',
+    mat: np.ndarray,
+    *,
+    required_sqrt_iswap_count: Optional[int],
+    use_sqrt_iswap_inv: bool,
+    atol: float,
+    check_preconditions: bool,
+) -> Sequence['cirq.Operation']:
     kak = linalg.kak_decomposition(
         mat, atol=atol / 10, rtol=0, check_preconditions=check_preconditions
     )
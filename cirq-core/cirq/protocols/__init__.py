@@ -122,6 +122,10 @@ from cirq.protocols.pow_protocol import (
 )
 
 # pylint: enable=redefined-builtin
+from cirq.protocols.protocol_cache import (
+    ProtocolCache,
+    ProtocolCacheInfo,
+)
 from cirq.protocols.qasm import (
     qasm,
     QasmArgs,
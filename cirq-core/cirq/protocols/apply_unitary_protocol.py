@@ -13,6 +13,7 @@
 # limitations under the License.
 """A protocol for implementing high performance unitary left-multiplies."""
 
+import warnings
 from typing import (
     Any,
     cast,
@@ -385,6 +386,17 @@ def _strat_apply_unitary_from_apply_unitary(
     sub_result = func(sub_args)
     if sub_result is NotImplemented or sub_result is None:
         return sub_result
+    if (
+        sub_result is not sub_args.available_buffer
+        and sub_result.dtype != sub_args.target_tensor.dtype
+    ):
+        warnings.warn(
+            f'{unitary_value!r}._apply_unitary_ returned an array of dtype '
+            f'{sub_result.dtype} for a target tensor of dtype '
+            f'{sub_args.target_tensor.dtype}. The result is cast back to '
+            f'{sub_args.target_tensor.dtype}, at the cost of a temporary copy.',
+            RuntimeWarning,
+        )
     return _incorporate_result_into_target(args, sub_args, sub_result)
 
 
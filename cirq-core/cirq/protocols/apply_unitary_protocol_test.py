@@ -470,6 +470,21 @@ def test_incorporate_result_not_view():
         _incorporate_result_into_target(args, not_sub_args, tensor2)
 
 
+def test_apply_unitary_warns_when_result_changes_dtype():
+    class Promotes:
+        def _apply_unitary_(self, args: cirq.ApplyUnitaryArgs):
+            return cirq.targeted_left_multiply(
+                np.array([[0, 1], [1, 0]], dtype=np.complex128), args.target_tensor, args.axes
+            )
+
+    target = cirq.one_hot(shape=(2, 2), dtype=np.complex64)
+    args = cirq.ApplyUnitaryArgs(target, np.empty_like(target), [1])
+    with pytest.warns(RuntimeWarning, match='dtype complex128'):
+        result = cirq.apply_unitary(Promotes(), args)
+    assert result.dtype == np.complex64
+    np.testing.assert_allclose(result, [[0, 1], [0, 0]])
+
+
 def test_default_method_arguments():
     with pytest.raises(TypeError, match='exactly one of'):
         cirq.ApplyUnitaryArgs.default(1, qid_shape=(2,))
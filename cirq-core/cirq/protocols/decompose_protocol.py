@@ -32,7 +32,7 @@ from typing_extensions import Protocol
 
 from cirq import devices, ops
 from cirq._doc import doc_private
-from cirq.protocols import qid_shape_protocol
+from cirq.protocols import protocol_cache, qid_shape_protocol
 from cirq.type_workarounds import NotImplementedType
 
 if TYPE_CHECKING:
@@ -282,14 +282,22 @@ def decompose_once(val: Any, default=RaiseTypeErrorIfNotProvided, *args, **kwarg
         TypeError: `val` didn't have a `_decompose_` method (or that method returned
             `NotImplemented` or `None`) and `default` wasn't set.
     """
-    method = getattr(val, '_decompose_', None)
-    decomposed = NotImplemented if method is None else method(*args, **kwargs)
-
-    if decomposed is not NotImplemented and decomposed is not None:
-        return list(ops.flatten_op_tree(decomposed))
+    if kwargs:
+        decomposed = _decompose_once(val, args, kwargs)
+    else:
+        decomposed = protocol_cache._cached(
+            'decompose_once',
+            val,
+            lambda: _decompose_once(val, args, kwargs),
+            extra=args,
+            copy=_copy_decomposition,
+        )
+    if decomposed is not None:
+        return decomposed
 
     if default is not RaiseTypeErrorIfNotProvided:
         return default
+    method = getattr(val, '_decompose_', None)
     if method is None:
         raise TypeError(f"object of type '{type(val)}' has no _decompose_ method.")
     raise TypeError(
@@ -298,6 +306,23 @@ def decompose_once(val: Any, default=RaiseTypeErrorIfNotProvided, *args, **kwarg
     )
 
 
+def _decompose_once(
+    val: Any, args: Tuple, kwargs: Dict[str, Any]
+) -> Optional[List['cirq.Operation']]:
+    """Returns the decomposition of a value, or None if it can't be decomposed."""
+    method = getattr(val, '_decompose_', None)
+    decomposed = NotImplemented if method is None else method(*args, **kwargs)
+    if decomposed is not NotImplemented and decomposed is not None:
+        return list(ops.flatten_op_tree(decomposed))
+    return None
+
+
+def _copy_decomposition(
+    result: Optional[List['cirq.Operation']],
+) -> Optional[List['cirq.Operation']]:
+    return None if result is None else list(result)
+
+
 @overload
 def decompose_once_with_qubits(val: Any, qubits: Iterable['cirq.Qid']) -> List['cirq.Operation']:
     pass
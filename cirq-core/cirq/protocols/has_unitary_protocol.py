@@ -23,7 +23,7 @@ from typing_extensions import Protocol
 
 from cirq import qis
 from cirq._doc import doc_private
-from cirq.protocols import qid_shape_protocol
+from cirq.protocols import protocol_cache, qid_shape_protocol
 from cirq.protocols.apply_unitary_protocol import ApplyUnitaryArgs
 from cirq.protocols.decompose_protocol import (
     _try_decompose_into_operations_and_qubits,
@@ -97,6 +97,16 @@ def has_unitary(val: Any, *, allow_decompose: bool = True) -> bool:
     Returns:
         Whether or not `val` has a unitary effect.
     """
+    return protocol_cache._cached(
+        'has_unitary',
+        val,
+        lambda: _has_unitary(val, allow_decompose=allow_decompose),
+        extra=(allow_decompose,),
+        gate_determined=True,
+    )
+
+
+def _has_unitary(val: Any, *, allow_decompose: bool) -> bool:
     strats = [
         _strat_has_unitary_from_has_unitary,
         _strat_has_unitary_from_decompose,
@@ -26,12 +26,14 @@ TestSpec = ModuleJsonTestSpec(
     not_yet_serializable=[
         'Alignment',
         'AxisAngleDecomposition',
+        'BatchedKakDecomposition',
         'CircuitDag',
         'CircuitDiagramInfo',
         'CircuitDiagramInfoArgs',
         'CircuitSampleJob',
         'CliffordSimulatorStepResult',
         'CliffordTrialResult',
+        'CompiledPauliSum',
         'DensityMatrixSimulator',
         'DensityMatrixSimulatorState',
         'DensityMatrixStepResult',
@@ -107,7 +109,14 @@ TestSpec = ModuleJsonTestSpec(
         'MergeInteractions',
         'MergeInteractionsToSqrtIswap',
         'MergeSingleQubitGates',
+        'OptimizationPipeline',
+        'OptimizationStageReport',
         'PointOptimizer',
+        # Result caches.
+        'ProtocolCache',
+        'ProtocolCacheInfo',
+        'TwoQubitCompileCache',
+        'TwoQubitCompileCacheInfo',
         'SynchronizeTerminalMeasurements',
         # global objects
         'CONTROL_TAG',
@@ -174,6 +183,7 @@ TestSpec = ModuleJsonTestSpec(
         'ParamDictType',
         # utility:
         'CliffordSimulator',
+        'PauliFrameSampler',
         'Simulator',
         'StabilizerSampler',
         'Unique',
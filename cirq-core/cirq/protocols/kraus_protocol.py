@@ -14,7 +14,7 @@
 
 """Protocol and methods for quantum channels."""
 
-from typing import Any, Sequence, Tuple, TypeVar, Union
+from typing import Any, Optional, Sequence, Tuple, TypeVar, Union
 import warnings
 
 import numpy as np
@@ -28,6 +28,7 @@ from cirq._doc import doc_private
 from cirq.protocols.decompose_protocol import (
     _try_decompose_into_operations_and_qubits,
 )
+from cirq.protocols import protocol_cache
 from cirq.protocols.mixture_protocol import has_mixture
 
 
@@ -158,6 +159,32 @@ def kraus(
             DeprecationWarning,
         )
 
+    result = protocol_cache._cached(
+        'kraus', val, lambda: _kraus(val), copy=_copy_kraus, gate_determined=True
+    )
+    if result is not None:
+        return result
+
+    if default is not RaiseTypeErrorIfNotProvided:
+        return default
+
+    kraus_getter = getattr(val, '_kraus_', None)
+    mixture_getter = getattr(val, '_mixture_', None)
+    unitary_getter = getattr(val, '_unitary_', None)
+    if kraus_getter is None and unitary_getter is None and mixture_getter is None:
+        raise TypeError(
+            "object of type '{}' has no _kraus_ or _mixture_ or "
+            "_unitary_ method.".format(type(val))
+        )
+
+    raise TypeError(
+        "object of type '{}' does have a _kraus_, _mixture_ or "
+        "_unitary_ method, but it returned NotImplemented.".format(type(val))
+    )
+
+
+def _kraus(val: Any) -> Optional[Tuple[np.ndarray, ...]]:
+    """Returns the Kraus operators of a value, or None if it isn't a channel."""
     kraus_getter = getattr(val, '_kraus_', None)
     kraus_result = NotImplemented if kraus_getter is None else kraus_getter()
     if kraus_result is not NotImplemented:
@@ -173,23 +200,15 @@ def kraus(
     if unitary_result is not NotImplemented and unitary_result is not None:
         return (unitary_result,)
 
+    channel_getter = getattr(val, '_channel_', None)
     channel_result = NotImplemented if channel_getter is None else channel_getter()
     if channel_result is not NotImplemented:
         return tuple(channel_result)
+    return None
 
-    if default is not RaiseTypeErrorIfNotProvided:
-        return default
 
-    if kraus_getter is None and unitary_getter is None and mixture_getter is None:
-        raise TypeError(
-            "object of type '{}' has no _kraus_ or _mixture_ or "
-            "_unitary_ method.".format(type(val))
-        )
-
-    raise TypeError(
-        "object of type '{}' does have a _kraus_, _mixture_ or "
-        "_unitary_ method, but it returned NotImplemented.".format(type(val))
-    )
+def _copy_kraus(result: Optional[Tuple[np.ndarray, ...]]) -> Optional[Tuple[np.ndarray, ...]]:
+    return None if result is None else tuple(np.copy(k) for k in result)
 
 
 @deprecated(deadline='v0.13', fix='use cirq.has_kraus instead')
@@ -0,0 +1,119 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Opt-in memoization of the results of protocols."""
+
+import contextvars
+from typing import Any, Callable, NamedTuple, Optional, Tuple, TypeVar
+
+from cirq import ops
+from cirq._scoped_cache import ScopedLruCache
+
+T = TypeVar('T')
+
+_active_cache: 'contextvars.ContextVar[Optional[ProtocolCache]]' = contextvars.ContextVar(
+    'cirq_protocol_cache', default=None
+)
+
+
+class ProtocolCacheInfo(NamedTuple):
+    """Statistics of a `cirq.ProtocolCache`.
+
+    Attributes:
+        hits: The number of results that were found in the cache.
+        misses: The number of results that were computed and then cached.
+        maxsize: The maximum number of results the cache holds.
+        currsize: The number of results the cache currently holds.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ProtocolCache(ScopedLruCache):
+    """A size-bounded LRU cache of the results of protocols.
+
+    While a cache is active, `cirq.unitary`, `cirq.has_unitary`, `cirq.kraus`
+    and `cirq.decompose_once` (and, through it, `cirq.decompose`) look up
+    their results by the protocol and by the type and value of their argument
+    before computing them. Once more than `maxsize` results are held, the least
+    recently used one is evicted. Arguments that are not hashable are never
+    cached, and returned matrices and lists are copies that the caller may
+    modify.
+
+    Results are keyed by equality, so the cache must only see immutable
+    values, such as gates and operations. A mutable value whose result was
+    cached may otherwise be given a stale result after it changes.
+
+    A cache is activated for the duration of a `with` block, and may be
+    reused across blocks:
+
+        cache = cirq.ProtocolCache(maxsize=4096)
+        with cache:
+            cirq.unitary(cirq.FSimGate(theta=0.1, phi=0.2))
+        print(cache.cache_info())
+    """
+
+    _active = _active_cache
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Inits ProtocolCache.
+
+        Args:
+            maxsize: The maximum number of results to hold.
+
+        Raises:
+            ValueError: `maxsize` is negative.
+        """
+        super().__init__(maxsize)
+
+    def cache_info(self) -> ProtocolCacheInfo:
+        """Returns the hit and miss statistics and the size of the cache."""
+        return ProtocolCacheInfo(
+            hits=self._hits, misses=self._misses, maxsize=self._maxsize, currsize=len(self._results)
+        )
+
+
+def _cached(
+    protocol: str,
+    val: Any,
+    compute: Callable[[], T],
+    *,
+    extra: Tuple = (),
+    copy: Optional[Callable[[T], T]] = None,
+    gate_determined: bool = False,
+) -> T:
+    """Returns `compute()`, memoized in the active `cirq.ProtocolCache`, if any.
+
+    Args:
+        protocol: The name of the protocol being computed.
+        val: The value the protocol is applied to.
+        compute: Computes the result of the protocol.
+        extra: Further hashable arguments the result depends on.
+        copy: Copies results, so that cached results are never handed out.
+        gate_determined: Whether the result for a `cirq.GateOperation`, tagged
+            or not, is that of its gate, which is much cheaper to hash and
+            compare. Other operations are keyed on themselves, since their
+            `gate` need not determine their result.
+    """
+    cache = _active_cache.get()
+    if cache is None:
+        return compute()
+    if gate_determined:
+        untagged = val.untagged if isinstance(val, ops.TaggedOperation) else val
+        if isinstance(untagged, ops.GateOperation):
+            val = untagged.gate
+    return cache._lookup((protocol, type(val), val) + extra, compute, copy)
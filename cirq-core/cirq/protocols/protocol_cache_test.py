@@ -0,0 +1,187 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+class CountingGate(cirq.SingleQubitGate):
+    def __init__(self, exponent):
+        self.exponent = exponent
+        self.calls = 0
+
+    def _unitary_(self):
+        self.calls += 1
+        return np.diag([1, np.exp(1j * self.exponent)])
+
+    def _decompose_(self, qubits):
+        self.calls += 1
+        return [cirq.Z(*qubits) ** (self.exponent / np.pi)]
+
+    def __eq__(self, other):
+        return isinstance(other, CountingGate) and self.exponent == other.exponent
+
+    def __hash__(self):
+        return hash(self.exponent)
+
+
+def test_unitary_is_cached_within_scope():
+    gate = CountingGate(0.5)
+    expected = np.diag([1, np.exp(0.5j)])
+    with cirq.ProtocolCache() as cache:
+        np.testing.assert_allclose(cirq.unitary(gate), expected)
+        assert cache.cache_info() == cirq.ProtocolCacheInfo(
+            hits=0, misses=1, maxsize=4096, currsize=1
+        )
+        # Results are copies, so callers can't corrupt the cache.
+        cirq.unitary(gate)[1, 1] = 0
+        np.testing.assert_allclose(cirq.unitary(CountingGate(0.5)), expected)
+        # Operations share the results of their gates.
+        np.testing.assert_allclose(cirq.unitary(gate.on(cirq.LineQubit(0))), expected)
+        assert gate.calls == 1
+        assert cache.cache_info().hits == 3
+
+    # Leaving the scope turns caching off, and re-entering it turns it back on.
+    cirq.unitary(gate)
+    assert gate.calls == 2
+    with cache:
+        cirq.unitary(gate)
+    assert gate.calls == 2
+    assert cache.cache_info().hits == 4
+
+
+def test_only_gate_operations_share_results_with_their_gates():
+    q0, q1 = cirq.LineQubit.range(2)
+    with cirq.testing.assert_deprecated(deadline="v0.14", count=None):
+        parallel = cirq.ParallelGateOperation(cirq.X, [q0, q1])
+    # The gate of a parallel operation is the gate it applies to each qubit.
+    for vals in [[cirq.X, parallel], [parallel, cirq.X]]:
+        with cirq.ProtocolCache():
+            for val in vals:
+                cirq.unitary(val)
+                cirq.kraus(val)
+            assert cirq.unitary(cirq.X).shape == (2, 2)
+            assert cirq.unitary(parallel).shape == (4, 4)
+            assert cirq.kraus(cirq.X)[0].shape == (2, 2)
+            assert cirq.kraus(parallel)[0].shape == (4, 4)
+
+    # Gate operations, tagged or not, still share the results of their gates.
+    with cirq.ProtocolCache() as cache:
+        cirq.unitary(cirq.X)
+        cirq.unitary(cirq.X.on(q0))
+        cirq.unitary(cirq.X.on(q1).with_tags('tag'))
+    assert cache.cache_info().hits == 2
+
+
+def test_nested_caches():
+    gate = CountingGate(0.5)
+    outer = cirq.ProtocolCache()
+    inner = cirq.ProtocolCache()
+    with outer:
+        cirq.unitary(gate)
+        with inner:
+            cirq.unitary(gate)
+        cirq.unitary(gate)
+    assert outer.cache_info().hits == 1
+    assert inner.cache_info().misses == 1
+    assert gate.calls == 2
+
+
+def test_eviction_and_clear():
+    gates = [CountingGate(0.1 * i) for i in range(3)]
+    with cirq.ProtocolCache(maxsize=2) as cache:
+        cirq.unitary(gates[0])
+        cirq.unitary(gates[1])
+        cirq.unitary(gates[0])
+        cirq.unitary(gates[2])
+        assert cache.cache_info() == cirq.ProtocolCacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+        # gates[1] was the least recently used result.
+        cirq.unitary(gates[0])
+        cirq.unitary(gates[1])
+        assert [gate.calls for gate in gates] == [1, 2, 1]
+
+        cache.clear()
+        assert cache.cache_info() == cirq.ProtocolCacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+    with cirq.ProtocolCache(maxsize=0) as cache:
+        cirq.unitary(gates[0])
+        cirq.unitary(gates[0])
+    assert gates[0].calls == 3
+    assert cache.cache_info().currsize == 0
+
+    with pytest.raises(ValueError, match='non-negative'):
+        _ = cirq.ProtocolCache(maxsize=-1)
+
+
+def test_keys_distinguish_types_and_arguments():
+    with cirq.ProtocolCache() as cache:
+        assert cirq.has_unitary(cirq.CCZ)
+        assert cirq.has_unitary(cirq.CCZ, allow_decompose=False)
+        assert cache.cache_info().misses == 2
+        for _ in range(2):
+            with pytest.raises(TypeError, match='unitary effect'):
+                _ = cirq.unitary(1)
+        assert cirq.unitary(cirq.measure(cirq.LineQubit(0)), None) is None
+        assert cirq.unitary(cirq.measure(cirq.LineQubit(0)), None) is None
+
+
+class UnhashableGate(cirq.SingleQubitGate):
+    __hash__ = None  # type: ignore
+
+    def _unitary_(self):
+        return np.eye(2)
+
+
+def test_unhashable_values_are_not_cached():
+    with cirq.ProtocolCache() as cache:
+        np.testing.assert_allclose(cirq.unitary(UnhashableGate()), np.eye(2))
+        np.testing.assert_allclose(cirq.unitary(UnhashableGate()), np.eye(2))
+    assert cache.cache_info().currsize == 0
+
+
+def test_kraus_is_cached():
+    channel = cirq.amplitude_damp(0.1)
+    with cirq.ProtocolCache() as cache:
+        first = cirq.kraus(channel)
+        first[0][0, 0] = 5
+        second = cirq.kraus(channel)
+        with pytest.raises(TypeError, match='no _kraus_ or _mixture_ or _unitary_ method'):
+            _ = cirq.kraus(cirq.LineQubit(0))
+        assert cirq.kraus(cirq.LineQubit(0), None) is None
+    assert cache.cache_info().hits == 2
+    cirq.testing.assert_allclose_up_to_global_phase(second[0], cirq.kraus(channel)[0], atol=1e-12)
+
+
+def test_decompose_is_cached():
+    gate = CountingGate(0.5)
+    a, b = cirq.LineQubit.range(2)
+    with cirq.ProtocolCache():
+        decomposition = cirq.decompose_once_with_qubits(gate, [a])
+        decomposition.append(cirq.X(a))
+        assert cirq.decompose_once_with_qubits(gate, [a]) == [cirq.Z(a) ** (0.5 / np.pi)]
+        # The operation decomposes through the cached decomposition of its gate.
+        assert cirq.decompose(gate.on(a)) == cirq.decompose(gate.on(a))
+        assert gate.calls == 1
+        assert cirq.decompose_once_with_qubits(gate, [b]) == [cirq.Z(b) ** (0.5 / np.pi)]
+        assert gate.calls == 2
+        # Keyword arguments bypass the cache.
+        assert cirq.decompose_once(gate, qubits=[a]) == [cirq.Z(a) ** (0.5 / np.pi)]
+        assert cirq.decompose_once(gate, qubits=[a]) == [cirq.Z(a) ** (0.5 / np.pi)]
+        assert gate.calls == 4
+        with pytest.raises(TypeError, match='no _decompose_ method'):
+            _ = cirq.decompose_once(a)
+        with pytest.raises(TypeError, match='returned NotImplemented or None'):
+            _ = cirq.decompose_once(cirq.X(a))
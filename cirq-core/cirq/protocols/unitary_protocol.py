@@ -24,7 +24,7 @@ from typing_extensions import Protocol
 
 from cirq import qis
 from cirq._doc import doc_private
-from cirq.protocols import qid_shape_protocol
+from cirq.protocols import protocol_cache, qid_shape_protocol
 from cirq.protocols.apply_unitary_protocol import (
     ApplyUnitaryArgs,
     apply_unitaries,
@@ -120,17 +120,11 @@ def unitary(
         TypeError: `val` doesn't have a unitary effect and no default value was
             specified.
     """
-    strats = [
-        _strat_unitary_from_unitary,
-        _strat_unitary_from_apply_unitary,
-        _strat_unitary_from_decompose,
-    ]
-    for strat in strats:
-        result = strat(val)
-        if result is None:
-            break
-        if result is not NotImplemented:
-            return result
+    result = protocol_cache._cached(
+        'unitary', val, lambda: _unitary(val), copy=_copy_unitary, gate_determined=True
+    )
+    if result is not None:
+        return result
 
     if default is not RaiseTypeErrorIfNotProvided:
         return default
@@ -151,6 +145,26 @@ def unitary(
     )
 
 
+def _unitary(val: Any) -> Optional[np.ndarray]:
+    """Returns the unitary of a value, or None if it doesn't have a unitary effect."""
+    strats = [
+        _strat_unitary_from_unitary,
+        _strat_unitary_from_apply_unitary,
+        _strat_unitary_from_decompose,
+    ]
+    for strat in strats:
+        result = strat(val)
+        if result is None:
+            break
+        if result is not NotImplemented:
+            return result
+    return None
+
+
+def _copy_unitary(result: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    return None if result is None else result.copy()
+
+
 def _strat_unitary_from_unitary(val: Any) -> Optional[np.ndarray]:
     """Attempts to compute a value's unitary via its _unitary_ method."""
     getter = getattr(val, '_unitary_', None)
@@ -23,7 +23,7 @@ from cirq.qis.channels import (
     operation_to_superoperator,
 )
 
-from cirq.qis.clifford_tableau import CliffordTableau
+from cirq.qis.clifford_tableau import CliffordTableau, PackedCliffordTableau
 
 from cirq.qis.measures import (
     entanglement_fidelity,
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 import numpy as np
 
 import cirq
@@ -274,21 +274,11 @@ class CliffordTableau:
         """Implements the "rowsum" routine defined by
         Aaronson and Gottesman.
         Multiplies the stabilizer in row q1 by the stabilizer in row q2."""
-
-        def g(x1, z1, x2, z2):
-            if not x1 and not z1:
-                return 0
-            elif x1 and z1:
-                return int(z2) - int(x2)
-            elif x1 and not z1:
-                return int(z2) * (2 * int(x2) - 1)
-            else:
-                return int(x2) * (1 - 2 * int(z2))
-
-        r = 2 * int(self._rs[q1]) + 2 * int(self._rs[q2])
-        for j in range(self.n):
-            r += g(self._xs[q2, j], self._zs[q2, j], self._xs[q1, j], self._zs[q1, j])
-
+        r = (
+            2 * int(self._rs[q1])
+            + 2 * int(self._rs[q2])
+            + _g_sum(self._xs[q2], self._zs[q2], self._xs[q1], self._zs[q1])
+        )
         r %= 4
 
         self._rs[q1] = bool(r)
@@ -296,6 +286,22 @@ class CliffordTableau:
         self._xs[q1, :] ^= self._xs[q2, :]
         self._zs[q1, :] ^= self._zs[q2, :]
 
+    def _rowsum_many(self, rows: np.ndarray, q2: int):
+        """Applies `_rowsum(q1, q2)` to every row q1 in `rows` at once.
+
+        The rows in `rows` must not include q2, so every update only reads
+        rows that are not written by the others.
+        """
+        r = (
+            2 * self._rs[rows].astype(int)
+            + 2 * int(self._rs[q2])
+            + _g_sum(self._xs[q2], self._zs[q2], self._xs[rows], self._zs[rows])
+        )
+        self._rs[rows] = (r % 4).astype(bool)
+
+        self._xs[rows, :] ^= self._xs[q2, :]
+        self._zs[rows, :] ^= self._zs[q2, :]
+
     # TODO(#3388) Add summary line to docstring.
     # pylint: disable=docstring-first-line-empty
     def _row_to_dense_pauli(self, i: int) -> 'cirq.DensePauliString':
@@ -340,26 +346,32 @@ class CliffordTableau:
 
         Returns: the result (0 or 1) of the measurement.
         """
-        is_commuting = True
-        for i in range(self.n, 2 * self.n):
-            if self.xs[i, q]:
-                p = i
-                is_commuting = False
-                break
-
-        if is_commuting:
-            self._xs[2 * self.n, :] = False
-            self._zs[2 * self.n, :] = False
-            self._rs[2 * self.n] = False
-
-            for i in range(self.n):
-                if self.xs[i, q]:
-                    self._rowsum(2 * self.n, self.n + i)
+        anticommuting_rows = np.flatnonzero(self.xs[self.n :, q])
+
+        if len(anticommuting_rows) == 0:
+            # The outcome is deterministic and equal to the sign of the product
+            # of the stabilizers paired with the destabilizers having an X on q.
+            # The rowsums into the scratch row are accumulated all at once: the
+            # scratch row before each step is the running XOR of earlier rows.
+            rows = self.n + np.flatnonzero(self.xs[: self.n, q])
+            xs = self._xs[rows]
+            zs = self._zs[rows]
+            acc_xs = np.bitwise_xor.accumulate(xs, axis=0)
+            acc_zs = np.bitwise_xor.accumulate(zs, axis=0)
+            prev_xs = np.zeros_like(xs)
+            prev_zs = np.zeros_like(zs)
+            prev_xs[1:] = acc_xs[:-1]
+            prev_zs[1:] = acc_zs[:-1]
+            r = 2 * int(np.sum(self._rs[rows])) + int(np.sum(_g_sum(xs, zs, prev_xs, prev_zs)))
+
+            self._xs[2 * self.n, :] = acc_xs[-1] if len(rows) else False
+            self._zs[2 * self.n, :] = acc_zs[-1] if len(rows) else False
+            self._rs[2 * self.n] = bool(r % 4)
             return int(self._rs[2 * self.n])
 
-        for i in range(2 * self.n):
-            if i != p and self.xs[i, q]:
-                self._rowsum(i, p)
+        p = self.n + anticommuting_rows[0]
+        rows = np.flatnonzero(self.xs[:, q])
+        self._rowsum_many(rows[rows != p], p)
 
         self.xs[p - self.n, :] = self.xs[p, :].copy()
         self.zs[p - self.n, :] = self.zs[p, :].copy()
@@ -373,3 +385,266 @@ class CliffordTableau:
         self.rs[p] = bool(prng.randint(2))
 
         return int(self.rs[p])
+
+
+class PackedCliffordTableau:
+    """Clifford tableau with the rows packed into the bits of uint64 words.
+
+    This stores the same data as `cirq.CliffordTableau`, but row `r` of the
+    tableau is bit `r % 64` of word `r // 64` of each column. The `xs` and `zs`
+    arrays have shape `(num_words, n)` and `rs` has shape `(num_words,)`, so
+    the column updates that the Clifford gates apply through `act_on` process
+    64 rows per machine word, and the row reductions of a measurement are
+    evaluated as bitwise operations over whole columns.
+
+    The bits beyond the last row are kept zero. The tableau can be used as the
+    `tableau` of `cirq.ActOnCliffordTableauArgs` and converted to and from
+    `cirq.CliffordTableau`.
+    """
+
+    def __init__(self, num_qubits, initial_state: int = 0):
+        """Initializes PackedCliffordTableau
+        Args:
+            num_qubits: The number of qubits in the system.
+            initial_state: The computational basis representation of the
+                state as a big endian int.
+        """
+        tableau = CliffordTableau(num_qubits, initial_state)
+        self.n = num_qubits
+        self.xs = _pack_rows(tableau.xs)
+        self.zs = _pack_rows(tableau.zs)
+        self.rs = _pack_rows(tableau.rs)
+
+    @classmethod
+    def from_tableau(cls, tableau: CliffordTableau) -> 'PackedCliffordTableau':
+        """Returns the packed form of the given `cirq.CliffordTableau`."""
+        state = cls(tableau.n)
+        state.xs = _pack_rows(tableau.xs)
+        state.zs = _pack_rows(tableau.zs)
+        state.rs = _pack_rows(tableau.rs)
+        return state
+
+    def to_tableau(self) -> CliffordTableau:
+        """Returns this tableau as an unpacked `cirq.CliffordTableau`."""
+        tableau = CliffordTableau(self.n)
+        tableau.xs = _unpack_rows(self.xs, 2 * self.n)
+        tableau.zs = _unpack_rows(self.zs, 2 * self.n)
+        tableau.rs = _unpack_rows(self.rs, 2 * self.n)
+        return tableau
+
+    def _json_dict_(self) -> Dict[str, Any]:
+        tableau = self.to_tableau()
+        return {
+            'cirq_type': self.__class__.__name__,
+            'n': self.n,
+            'rs': tableau.rs,
+            'xs': tableau.xs,
+            'zs': tableau.zs,
+        }
+
+    @classmethod
+    def _from_json_dict_(cls, n, rs, xs, zs, **kwargs):
+        return cls.from_tableau(CliffordTableau._from_json_dict_(n, rs, xs, zs))
+
+    def _validate(self) -> bool:
+        """Check if the Clifford Tabluea satisfies the symplectic property."""
+        return self.to_tableau()._validate()
+
+    def __eq__(self, other):
+        if not isinstance(other, type(self)):
+            # coverage: ignore
+            return NotImplemented
+        return (
+            self.n == other.n
+            and np.array_equal(self.rs, other.rs)
+            and np.array_equal(self.xs, other.xs)
+            and np.array_equal(self.zs, other.zs)
+        )
+
+    def __copy__(self) -> 'PackedCliffordTableau':
+        return self.copy()
+
+    def copy(self) -> 'PackedCliffordTableau':
+        state = PackedCliffordTableau(self.n)
+        state.rs = self.rs.copy()
+        state.xs = self.xs.copy()
+        state.zs = self.zs.copy()
+        return state
+
+    def __repr__(self) -> str:
+        return repr(self.to_tableau())
+
+    def __str__(self) -> str:
+        return str(self.to_tableau())
+
+    def _str_full_(self) -> str:
+        return self.to_tableau()._str_full_()
+
+    def stabilizers(self) -> List['cirq.DensePauliString']:
+        """Returns the stabilizer generators of the state. These
+        are n operators {S_1,S_2,...,S_n} such that S_i |psi> = |psi>"""
+        return self.to_tableau().stabilizers()
+
+    def destabilizers(self) -> List['cirq.DensePauliString']:
+        """Returns the destabilizer generators of the state. These
+        are n operators {S_1,S_2,...,S_n} such that along with the stabilizer
+        generators above generate the full Pauli group on n qubits."""
+        return self.to_tableau().destabilizers()
+
+    def _measure(self, q, prng: np.random.RandomState) -> int:
+        """Performs a projective measurement on the q'th qubit.
+
+        Returns: the result (0 or 1) of the measurement.
+        """
+        column = self.xs[:, q]
+        rows = np.flatnonzero(_unpack_rows(column, 2 * self.n))
+
+        if len(rows) == 0 or rows[-1] < self.n:
+            # The outcome is deterministic and equal to the sign of the product
+            # of the stabilizers paired with the destabilizers having an X on q.
+            # Writing each stabilizer as (-1)^r i^(x.z) X^x Z^z, the phase
+            # exponent of the product is the sum of 2r + x.z over the rows,
+            # plus 2 z_i.x_j for each pair of rows i < j from reordering the
+            # Paulis, minus X.Z for the product's own X and Z parts.
+            selected = np.zeros(2 * self.n, dtype=bool)
+            selected[self.n + rows] = True
+            mask = _pack_rows(selected)
+            xs = self.xs & mask[:, np.newaxis]
+            zs = self.zs & mask[:, np.newaxis]
+            x_parities = _popcount(np.bitwise_xor.reduce(xs, axis=0)) & np.uint64(1)
+            z_parities = _popcount(np.bitwise_xor.reduce(zs, axis=0)) & np.uint64(1)
+            exponent = (
+                2 * int(_popcount(self.rs & mask).sum())
+                + int(_popcount(xs & zs).sum())
+                + 2 * int(_popcount(xs & _exclusive_prefix_xor(zs)).sum())
+                - int(np.sum(x_parities & z_parities))
+            )
+            return int(exponent % 4 != 0)
+
+        p = rows[np.searchsorted(rows, self.n)]
+        xp = _row_bits(self.xs, p)
+        zp = _row_bits(self.zs, p)
+        rp = _row_bits(self.rs, p)
+
+        # Multiply row p into every other row with an X on q. Each column
+        # contributes -1, 0 or +1 to the phase exponent of a row, depending on
+        # the Pauli of row p and the bits of the row in that column. The
+        # contributions are kept as bitsliced 2-bit numbers and summed mod 4.
+        mask = column.copy()
+        mask[p // 64] &= ~(np.uint64(1) << np.uint64(p % 64))
+        x = self.xs
+        z = self.zs
+        zero = np.uint64(0)
+        is_y = xp & zp
+        is_x = xp & ~zp
+        is_z = ~xp & zp
+        plus = np.where(is_y, z & ~x, np.where(is_x, z & x, np.where(is_z, x & ~z, zero)))
+        minus = np.where(is_y, x & ~z, np.where(is_x, z & ~x, np.where(is_z, x & z, zero)))
+        lo, hi = _sum_mod_4(plus | minus, minus)
+        hi ^= self.rs
+        if rp:
+            hi = ~hi
+        self.rs = (self.rs & ~mask) | ((lo | hi) & mask)
+        self.xs ^= np.where(xp, mask[:, np.newaxis], zero)
+        self.zs ^= np.where(zp, mask[:, np.newaxis], zero)
+
+        _set_row_bits(self.xs, p - self.n, xp)
+        _set_row_bits(self.zs, p - self.n, zp)
+        _set_row_bits(self.rs, p - self.n, rp)
+
+        outcome = bool(prng.randint(2))
+        _set_row_bits(self.xs, p, np.zeros(self.n, dtype=bool))
+        _set_row_bits(self.zs, p, np.arange(self.n) == q)
+        _set_row_bits(self.rs, p, outcome)
+
+        return int(outcome)
+
+
+def _g_sum(x1: np.ndarray, z1: np.ndarray, x2: np.ndarray, z2: np.ndarray) -> np.ndarray:
+    """Sums the phase exponents of multiplying the Paulis (x1, z1) by (x2, z2).
+
+    This is the sum over qubits of the `g` function from Aaronson and Gottesman.
+    It is reduced over the last axis, so the inputs can be single rows or
+    stacks of rows that broadcast against each other.
+    """
+    x1 = x1.astype(np.int64)
+    z1 = z1.astype(np.int64)
+    x2 = x2.astype(np.int64)
+    z2 = z2.astype(np.int64)
+    g = x1 * z1 * (z2 - x2) + x1 * (1 - z1) * z2 * (2 * x2 - 1) + (1 - x1) * z1 * x2 * (1 - 2 * z2)
+    return np.sum(g, axis=-1)
+
+
+def _pack_rows(bits: np.ndarray) -> np.ndarray:
+    """Packs the rows of a boolean array into the bits of uint64 words.
+
+    Row `r` of `bits` becomes bit `r % 64` of row `r // 64` of the result.
+    """
+    num_rows = bits.shape[0]
+    num_words = (num_rows + 63) // 64
+    padded = np.zeros((num_words * 64,) + bits.shape[1:], dtype=bool)
+    padded[:num_rows] = bits
+    packed = np.packbits(padded, axis=0, bitorder='little')
+    words = np.ascontiguousarray(np.moveaxis(packed, 0, -1)).view('<u8')
+    return np.moveaxis(words, -1, 0).astype(np.uint64)
+
+
+def _unpack_rows(words: np.ndarray, num_rows: int) -> np.ndarray:
+    """Inverse of `_pack_rows`, returning the first `num_rows` rows."""
+    packed = np.ascontiguousarray(np.moveaxis(words, 0, -1), dtype='<u8').view(np.uint8)
+    bits = np.unpackbits(packed, axis=-1, count=num_rows, bitorder='little')
+    return np.moveaxis(bits, -1, 0).astype(bool)
+
+
+def _row_bits(words: np.ndarray, rows) -> np.ndarray:
+    """Returns the bits of the given packed row, or stack of rows."""
+    rows = np.asarray(rows)
+    shifts = (rows % 64).astype(np.uint64).reshape(rows.shape + (1,) * (words.ndim - 1))
+    return ((words[rows // 64] >> shifts) & np.uint64(1)).astype(bool)
+
+
+def _set_row_bits(words: np.ndarray, row: int, bits) -> None:
+    """Overwrites the bits of a packed row in place."""
+    bit = np.uint64(1) << np.uint64(row % 64)
+    words[row // 64] = (words[row // 64] & ~bit) | np.where(bits, bit, np.uint64(0))
+
+
+def _sum_mod_4(lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sums bitsliced 2-bit numbers over the last axis, modulo 4.
+
+    Bit `k` of `lo[..., j]` and `hi[..., j]` are the low and high bits of the
+    `j`th term for row `k`. The terms are added pairwise in a tree.
+    """
+    while lo.shape[-1] > 1:
+        if lo.shape[-1] % 2:
+            pad = [(0, 0)] * (lo.ndim - 1) + [(0, 1)]
+            lo = np.pad(lo, pad)
+            hi = np.pad(hi, pad)
+        lo_a, lo_b = lo[..., ::2], lo[..., 1::2]
+        hi = hi[..., ::2] ^ hi[..., 1::2] ^ (lo_a & lo_b)
+        lo = lo_a ^ lo_b
+    return lo[..., 0], hi[..., 0]
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Returns the number of set bits of each uint64 word."""
+    words = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    words = (words & np.uint64(0x3333333333333333)) + (
+        (words >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    words = (words + (words >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (words * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def _exclusive_prefix_xor(words: np.ndarray) -> np.ndarray:
+    """Returns, for each packed row, the XOR of all rows before it.
+
+    The scan is done within each word by shifting, and the parity of the
+    preceding words is then carried into every bit of the next word.
+    """
+    inclusive = words.copy()
+    for shift in [1, 2, 4, 8, 16, 32]:
+        inclusive ^= inclusive << np.uint64(shift)
+    parity = (inclusive >> np.uint64(63)).astype(bool)
+    carry = np.bitwise_xor.accumulate(parity, axis=0) ^ parity
+    return inclusive ^ words ^ np.where(carry, ~np.uint64(0), np.uint64(0))
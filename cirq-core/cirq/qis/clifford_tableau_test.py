@@ -228,6 +228,20 @@ def test_rowsum():
     assert t.stabilizers()[1] == cirq.DensePauliString('YX', coefficient=1)
 
 
+def test_rowsum_many():
+    t = cirq.CliffordTableau(num_qubits=3)
+    _H(t, 0)
+    _CNOT(t, 0, 1)
+    _S(t, 1)
+    _CNOT(t, 1, 2)
+    expected = t.copy()
+    for row in [0, 2, 4]:
+        expected._rowsum(row, 3)
+
+    t._rowsum_many(np.array([0, 2, 4]), 3)
+    assert t == expected
+
+
 def test_json_dict():
     t = cirq.CliffordTableau._from_json_dict_(n=1, rs=[0, 0], xs=[[1], [0]], zs=[[0], [1]])
     assert t.destabilizers()[0] == cirq.DensePauliString('X', coefficient=1)
@@ -518,3 +532,76 @@ def test_inverse():
     assert t.inverse() == expected_t
     assert t.then(t.inverse()) == cirq.CliffordTableau(num_qubits=100)
     assert t.inverse().then(t) == cirq.CliffordTableau(num_qubits=100)
+
+
+@pytest.mark.parametrize('num_qubits', [1, 3, 40, 70])
+def test_packed_tableau_matches_tableau(num_qubits):
+    qubits = cirq.LineQubit.range(num_qubits)
+    circuit = cirq.testing.random_circuit(
+        qubits,
+        n_moments=20,
+        op_density=0.8,
+        gate_domain={cirq.H: 1, cirq.S: 1, cirq.X: 1, cirq.CNOT: 2, cirq.CZ: 2, cirq.SWAP: 2},
+        random_state=num_qubits,
+    )
+    circuit.append(cirq.measure(q, key=f'm{q.x}') for q in qubits[::2])
+    circuit.append(cirq.measure(q, key=f'n{q.x}') for q in qubits)
+    tableau = cirq.CliffordTableau(num_qubits, initial_state=1)
+    packed = cirq.PackedCliffordTableau(num_qubits, initial_state=1)
+    assert packed.to_tableau() == tableau
+    assert cirq.PackedCliffordTableau.from_tableau(tableau) == packed
+    tableau_logs = {}
+    packed_logs = {}
+    tableau_args = cirq.ActOnCliffordTableauArgs(
+        tableau, np.random.RandomState(1234), tableau_logs, qubits
+    )
+    packed_args = cirq.ActOnCliffordTableauArgs(
+        packed, np.random.RandomState(1234), packed_logs, qubits
+    )
+    for op in circuit.all_operations():
+        cirq.act_on(op, tableau_args)
+        cirq.act_on(op, packed_args)
+        assert packed.to_tableau() == tableau
+    assert packed_logs == tableau_logs
+    assert packed._validate()
+    assert packed.stabilizers() == tableau.stabilizers()
+    assert packed.destabilizers() == tableau.destabilizers()
+
+
+def test_packed_tableau_layout():
+    t = cirq.PackedCliffordTableau(num_qubits=40, initial_state=1)
+    assert t.xs.dtype == np.uint64
+    assert t.xs.shape == (2, 40)
+    assert t.rs.shape == (2,)
+    # Row 79 is the stabilizer Z of the last qubit, with sign -1.
+    assert t.zs[1, 39] == np.uint64(1) << np.uint64(15)
+    assert t.rs[1] == np.uint64(1) << np.uint64(15)
+    assert t.xs[0, 39] == np.uint64(1) << np.uint64(39)
+
+
+def test_packed_tableau_str_repr_copy():
+    t = cirq.PackedCliffordTableau(num_qubits=2)
+    _H(t, 0)
+    _CNOT(t, 0, 1)
+    expected = cirq.CliffordTableau(num_qubits=2)
+    _H(expected, 0)
+    _CNOT(expected, 0, 1)
+    assert str(t) == str(expected)
+    assert repr(t) == repr(expected)
+    assert t._str_full_() == expected._str_full_()
+
+    new_t = t.copy()
+    assert t is not new_t
+    assert t.xs is not new_t.xs
+    assert t == new_t == t.__copy__()
+    _S(new_t, 0)
+    assert t != new_t
+
+
+def test_packed_tableau_json_dict():
+    t = cirq.PackedCliffordTableau._from_json_dict_(n=1, rs=[0, 0], xs=[[1], [0]], zs=[[0], [1]])
+    assert t == cirq.PackedCliffordTableau(num_qubits=1)
+    json_dict = t._json_dict_()
+    assert json_dict['cirq_type'] == 'PackedCliffordTableau'
+    assert json_dict['n'] == 1
+    np.testing.assert_array_equal(json_dict['xs'], [[True], [False]])
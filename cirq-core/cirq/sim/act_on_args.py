@@ -108,6 +108,18 @@ class ActOnArgs(OperationTarget[TSelf]):
         """Child classes that perform measurements should implement this with
         the implementation."""
 
+    def _project_measurement(self, qubits: Sequence['cirq.Qid'], bits: Sequence[int]) -> bool:
+        """Projects the state onto a measurement outcome of the given qubits.
+
+        Child classes that can post-select their state on a measurement outcome
+        should implement this, renormalizing the projected state. The outcome
+        must have nonzero probability. Nothing is logged.
+
+        Returns:
+            Whether the state was projected.
+        """
+        return False
+
     def copy(self: TSelf) -> TSelf:
         """Creates a copy of the object."""
         args = copy.copy(self)
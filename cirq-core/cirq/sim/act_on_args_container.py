@@ -102,6 +102,22 @@ class ActOnArgsContainer(
                 self.args[q1] = args0.rename(q0, q1, inplace=True)
             return True
 
+        if isinstance(gate, ops.ParallelGate) and self.split_untangled_states:
+            # Apply the copies on each state separately rather than joining the
+            # states of all of their qubits.
+            groups: Dict[TActOnArgs, List['cirq.Qid']] = {}
+            for q in qubits:
+                groups.setdefault(self.args[q], []).append(q)
+            if len(groups) > 1:
+                for group in groups.values():
+                    protocols.act_on(
+                        gate.with_num_copies(len(group)),
+                        self,
+                        group,
+                        allow_decompose=allow_decompose,
+                    )
+                return True
+
         # Go through the op's qubits and join any disparate ActOnArgs states
         # into a new combined state.
         op_args_opt: Optional[TActOnArgs] = None
@@ -13,11 +13,12 @@
 # limitations under the License.
 """Objects and methods for acting efficiently on a density matrix."""
 
-from typing import Any, Dict, List, Tuple, TYPE_CHECKING, Sequence, Iterable, Union
+import functools
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Sequence, Iterable, Union
 
 import numpy as np
 
-from cirq import protocols, sim
+from cirq import linalg, ops, protocols, sim, value
 from cirq._compat import deprecated_parameter
 from cirq.sim.act_on_args import ActOnArgs, strat_act_on_from_apply_decompose
 from cirq.linalg import transformations
@@ -99,6 +100,7 @@ class ActOnDensityMatrixArgs(ActOnArgs):
         allow_decompose: bool = True,
     ) -> bool:
         strats = [
+            _strat_apply_parallel_gate_to_state,
             _strat_apply_channel_to_state,
         ]
         if allow_decompose:
@@ -131,6 +133,23 @@ class ActOnDensityMatrixArgs(ActOnArgs):
         )
         return bits
 
+    def _project_measurement(self, qubits: Sequence['cirq.Qid'], bits: Sequence[int]) -> bool:
+        """Zeroes the entries inconsistent with the outcome and renormalizes."""
+        axes = self.get_axes(qubits)
+        result_slice = linalg.slice_for_qubits_equal_to(
+            axes,
+            big_endian_qureg_value=value.big_endian_digits_to_int(
+                bits, base=[self.qid_shape[i] for i in axes]
+            ),
+            qid_shape=self.qid_shape,
+        )
+        mask = np.ones(self.qid_shape * 2, dtype=bool)
+        mask[result_slice * 2] = False
+        self.target_tensor[mask] = 0
+        size = int(np.prod(self.qid_shape, dtype=np.int64))
+        self.target_tensor /= np.trace(np.reshape(self.target_tensor, (size, size))).real
+        return True
+
     def _on_copy(self, target: 'ActOnDensityMatrixArgs'):
         target.target_tensor = self.target_tensor.copy()
         target.available_buffer = [b.copy() for b in self.available_buffer]
@@ -222,3 +241,69 @@ def _strat_apply_channel_to_state(
             args.available_buffer[i] = args.target_tensor
     args.target_tensor = result
     return True
+
+
+def _strat_apply_parallel_gate_to_state(
+    action: Any, args: ActOnDensityMatrixArgs, qubits: Sequence['cirq.Qid']
+) -> bool:
+    """Apply the superoperator of the sub-gate of a parallel gate to each qubit."""
+    gate = action.gate if isinstance(action, ops.Operation) else action
+    if not isinstance(gate, ops.ParallelGate) or protocols.is_measurement(gate.sub_gate):
+        return NotImplemented
+    sub_gate = gate.sub_gate
+    dtype = args.target_tensor.dtype
+    try:
+        hash(sub_gate)
+    except TypeError:
+        # Unhashable gates are not cached.
+        superoperator = _superoperator_tensor.__wrapped__(sub_gate, dtype)
+    else:
+        superoperator = _superoperator_tensor(sub_gate, dtype)
+    if superoperator is None:
+        return NotImplemented
+    shape = args.target_tensor.shape
+    num_qubits = len(args.qubits)
+    for axis in args.get_axes(qubits):
+        # View the state as [before, row, between, column, after] and multiply
+        # the (row, column) pairs by the superoperator in a single matmul,
+        # staging the pairs through the auxiliary buffers.
+        for i in range(3):
+            if not args.available_buffer[i].flags.c_contiguous:
+                args.available_buffer[i] = np.empty(shape, dtype)
+        d = shape[axis]
+        view = (
+            int(np.prod(shape[:axis])),
+            d,
+            int(np.prod(shape[axis + 1 : axis + num_qubits])),
+            d,
+            int(np.prod(shape[axis + num_qubits + 1 :])),
+        )
+        pairs = args.available_buffer[1].reshape((d, d) + view[::2])
+        np.copyto(pairs, np.moveaxis(args.target_tensor.reshape(view), (1, 3), (0, 1)))
+        product = args.available_buffer[2].reshape(pairs.shape)
+        np.matmul(
+            superoperator.reshape((d * d, d * d)),
+            pairs.reshape((d * d, -1)),
+            out=product.reshape((d * d, -1)),
+        )
+        out = args.available_buffer[0]
+        np.copyto(out.reshape(view), np.moveaxis(product, (0, 1), (1, 3)))
+        args.available_buffer[0] = args.target_tensor
+        args.target_tensor = out
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _superoperator_tensor(gate: 'cirq.Gate', dtype: np.dtype) -> Optional[np.ndarray]:
+    """Returns the superoperator of a single-qudit gate acting on a density matrix.
+
+    Entry `[i, j, a, b]` maps entry `[a, b]` of the density matrix to entry
+    `[i, j]`.
+    """
+    kraus_operators = protocols.kraus(gate, default=None)
+    if kraus_operators is None:
+        return None
+    superoperator = sum(np.einsum('ia,jb->ijab', k, np.conj(k)) for k in kraus_operators)
+    superoperator = superoperator.astype(dtype)
+    superoperator.setflags(write=False)
+    return superoperator
@@ -13,17 +13,34 @@
 # limitations under the License.
 """Objects and methods for acting efficiently on a state vector."""
 
-from typing import Any, Tuple, TYPE_CHECKING, Union, Dict, List, Sequence, Iterable
+import concurrent.futures
+import functools
+import os
+import tempfile
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
 import numpy as np
 
-from cirq import linalg, protocols, sim
+from cirq import linalg, ops, protocols, sim, value
 from cirq._compat import deprecated_parameter
 from cirq.sim.act_on_args import ActOnArgs, strat_act_on_from_apply_decompose
 from cirq.linalg import transformations
 
 if TYPE_CHECKING:
     import cirq
+    from numpy.typing import DTypeLike
 
 
 def _rewrite_deprecated_args(args, kwargs):
@@ -66,6 +83,7 @@ class ActOnStateVectorArgs(ActOnArgs):
         log_of_measurement_results: Dict[str, Any],
         qubits: Sequence['cirq.Qid'] = None,
         axes: Iterable[int] = None,
+        num_threads: int = 1,
     ):
         """Inits ActOnStateVectorArgs.
 
@@ -87,10 +105,15 @@ class ActOnStateVectorArgs(ActOnArgs):
                 being recorded into.
             axes: The indices of axes corresponding to the qubits that the
                 operation is supposed to act upon.
+            num_threads: The number of threads used to apply unitaries to
+                large state vectors. The state is split into independent slices
+                along axes that the operation does not act on, and the slices
+                are processed concurrently.
         """
         super().__init__(prng, qubits, axes, log_of_measurement_results)
         self.target_tensor = target_tensor
         self.available_buffer = available_buffer
+        self.num_threads = num_threads
 
     def swap_target_tensor_for(self, new_target_tensor: np.ndarray):
         """Gives a new state vector for the system.
@@ -169,6 +192,8 @@ class ActOnStateVectorArgs(ActOnArgs):
         allow_decompose: bool = True,
     ) -> bool:
         strats = [
+            _strat_act_on_state_vector_from_parallel_gate,
+            _strat_act_on_state_vector_from_in_place_kernel,
             _strat_act_on_state_vector_from_apply_unitary,
             _strat_act_on_state_vector_from_mixture,
             _strat_act_on_state_vector_from_channel,
@@ -201,9 +226,26 @@ class ActOnStateVectorArgs(ActOnArgs):
         )
         return bits
 
+    def _project_measurement(self, qubits: Sequence['cirq.Qid'], bits: Sequence[int]) -> bool:
+        """Zeroes the amplitudes inconsistent with the outcome and renormalizes."""
+        axes = self.get_axes(qubits)
+        shape = self.target_tensor.shape
+        result_slice = linalg.slice_for_qubits_equal_to(
+            axes,
+            big_endian_qureg_value=value.big_endian_digits_to_int(
+                bits, base=[shape[i] for i in axes]
+            ),
+            qid_shape=shape,
+        )
+        mask = np.ones(shape, dtype=bool)
+        mask[result_slice] = False
+        self.target_tensor[mask] = 0
+        self.target_tensor /= np.linalg.norm(self.target_tensor)
+        return True
+
     def _on_copy(self, target: 'ActOnStateVectorArgs'):
-        target.target_tensor = self.target_tensor.copy()
-        target.available_buffer = self.available_buffer.copy()
+        target.target_tensor = _copy_array(self.target_tensor)
+        target.available_buffer = _copy_array(self.available_buffer)
 
     def _on_kronecker_product(self, other: 'ActOnStateVectorArgs', target: 'ActOnStateVectorArgs'):
         target_tensor = transformations.state_vector_kronecker_product(
@@ -253,10 +295,239 @@ class ActOnStateVectorArgs(ActOnArgs):
         )
 
 
+def _strat_act_on_state_vector_from_in_place_kernel(
+    action: Any, args: 'cirq.ActOnStateVectorArgs', qubits: Sequence['cirq.Qid']
+) -> bool:
+    gate = action.gate if isinstance(action, ops.Operation) else action
+    kernel = _IN_PLACE_KERNELS.get(type(gate))
+    if kernel is None:
+        return NotImplemented
+    return kernel(gate, args, args.get_axes(qubits))
+
+
+def _global_phase(gate: 'cirq.EigenGate') -> complex:
+    return 1j ** (2 * gate.exponent * gate.global_shift)
+
+
+def _z_pow_kernel(
+    gate: 'cirq.ZPowGate', args: 'cirq.ActOnStateVectorArgs', axes: Sequence[int]
+) -> bool:
+    if protocols.is_parameterized(gate):
+        return NotImplemented
+    p = _global_phase(gate)
+    c = 1j ** (2 * gate.exponent) * p
+    if p != 1:
+        args.target_tensor[args.subspace_index(axes, 0)] *= p
+    if c != 1:
+        args.target_tensor[args.subspace_index(axes, 1)] *= c
+    return True
+
+
+def _cz_pow_kernel(
+    gate: 'cirq.CZPowGate', args: 'cirq.ActOnStateVectorArgs', axes: Sequence[int]
+) -> bool:
+    if protocols.is_parameterized(gate):
+        return NotImplemented
+    p = _global_phase(gate)
+    c = 1j ** (2 * gate.exponent)
+    if c != 1:
+        args.target_tensor[args.subspace_index(axes, 0b11)] *= c
+    if p != 1:
+        args.target_tensor *= p
+    return True
+
+
+def _x_kernel(
+    gate: 'cirq.XPowGate', args: 'cirq.ActOnStateVectorArgs', axes: Sequence[int]
+) -> bool:
+    if gate.exponent != 1:
+        return NotImplemented
+    return _swap_subspaces(gate, args, args.subspace_index(axes, 0), args.subspace_index(axes, 1))
+
+
+def _cx_kernel(
+    gate: 'cirq.CXPowGate', args: 'cirq.ActOnStateVectorArgs', axes: Sequence[int]
+) -> bool:
+    if gate.exponent != 1:
+        return NotImplemented
+    return _swap_subspaces(
+        gate, args, args.subspace_index(axes, 0b01), args.subspace_index(axes, 0b11)
+    )
+
+
+def _swap_kernel(
+    gate: 'cirq.SwapPowGate', args: 'cirq.ActOnStateVectorArgs', axes: Sequence[int]
+) -> bool:
+    if gate.exponent != 1:
+        return NotImplemented
+    return _swap_subspaces(
+        gate, args, args.subspace_index(axes, 0b01), args.subspace_index(axes, 0b10)
+    )
+
+
+# The number of amplitudes the permutation kernels exchange per step. The
+# scratch space for one step is small enough to stay in cache, so the state is
+# only read and written once and `available_buffer` is never touched.
+_SWAP_CHUNK_SIZE = 2 ** 14
+
+
+def _swap_subspaces(
+    gate: 'cirq.EigenGate',
+    args: 'cirq.ActOnStateVectorArgs',
+    index_a: Tuple[Union[slice, int, 'ellipsis'], ...],
+    index_b: Tuple[Union[slice, int, 'ellipsis'], ...],
+) -> bool:
+    """Exchanges two equally shaped subspaces of the state in place."""
+    # Indexing every axis with an integer would give a scalar, not a view.
+    a = args.target_tensor[index_a + (Ellipsis,) * (Ellipsis not in index_a)]
+    b = args.target_tensor[index_b + (Ellipsis,) * (Ellipsis not in index_b)]
+
+    # Iterate over the leading axes of the subspaces, exchanging blocks spanned
+    # by the trailing axes that fit in the scratch space.
+    split = 0
+    while int(np.prod(a.shape[split:], dtype=np.int64)) > _SWAP_CHUNK_SIZE:
+        split += 1
+    block_shape = a.shape[split:]
+    scratch = np.empty(block_shape, dtype=a.dtype)
+    for index in np.ndindex(*a.shape[:split]):
+        block_a = a[index + (Ellipsis,)]
+        block_b = b[index + (Ellipsis,)]
+        np.copyto(scratch, block_a)
+        np.copyto(block_a, block_b)
+        np.copyto(block_b, scratch)
+
+    p = _global_phase(gate)
+    if p != 1:
+        args.target_tensor *= p
+    return True
+
+
+# Kernels for gates that are diagonal or permute basis states. They edit
+# `target_tensor` in place instead of going through `protocols.apply_unitary`.
+# Keys are exact gate types, so that subclasses overriding the unitary are not
+# affected.
+_IN_PLACE_KERNELS: Dict[
+    Type['cirq.Gate'], Callable[[Any, 'cirq.ActOnStateVectorArgs', Sequence[int]], bool]
+] = {
+    ops.XPowGate: _x_kernel,
+    ops.Rx: _x_kernel,
+    type(ops.X): _x_kernel,
+    ops.ZPowGate: _z_pow_kernel,
+    ops.Rz: _z_pow_kernel,
+    type(ops.Z): _z_pow_kernel,
+    ops.CZPowGate: _cz_pow_kernel,
+    ops.CXPowGate: _cx_kernel,
+    ops.SwapPowGate: _swap_kernel,
+}
+
+
+def _empty_memmap(
+    shape: Tuple[int, ...], dtype: 'DTypeLike', directory: Optional[str]
+) -> np.memmap:
+    """Allocates an array backed by a temporary file in `directory`.
+
+    The file is unlinked right away, so its storage is released when the array
+    is garbage collected. Newly created files read as zeros.
+    """
+    with tempfile.NamedTemporaryFile(dir=directory) as f:
+        return np.memmap(f, dtype=dtype, mode='w+', shape=shape)
+
+
+def _copy_array(array: np.ndarray) -> np.ndarray:
+    """Copies an array, into a new temporary file if it is memory-mapped."""
+    if isinstance(array, np.memmap) and array.filename is not None:
+        result = _empty_memmap(array.shape, array.dtype, os.path.dirname(array.filename))
+        np.copyto(result, array)
+        return result
+    return array.copy()
+
+
+# States smaller than this are not worth splitting across threads.
+_MIN_PARALLEL_SIZE = 2 ** 16
+
+
+@functools.lru_cache()
+def _thread_pool(num_threads: int) -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
+
+
 def _strat_act_on_state_vector_from_apply_unitary(
     unitary_value: Any,
     args: 'cirq.ActOnStateVectorArgs',
     qubits: Sequence['cirq.Qid'],
+) -> bool:
+    if args.num_threads > 1 and args.target_tensor.size >= _MIN_PARALLEL_SIZE:
+        return _strat_act_on_state_vector_from_parallel_apply_unitary(unitary_value, args, qubits)
+    return _strat_act_on_state_vector_from_serial_apply_unitary(unitary_value, args, qubits)
+
+
+def _strat_act_on_state_vector_from_parallel_apply_unitary(
+    unitary_value: Any,
+    args: 'cirq.ActOnStateVectorArgs',
+    qubits: Sequence['cirq.Qid'],
+) -> bool:
+    """Applies a unitary to independent slices of the state on a thread pool.
+
+    The leading axes that the operation does not act on are fixed to each of
+    their values in turn, giving slices that the unitary acts on
+    independently. Each slice is handed to `protocols.apply_unitary`, which
+    releases the GIL inside NumPy for the bulk of the work.
+    """
+    axes = args.get_axes(qubits)
+    shape = args.target_tensor.shape
+    split_axes: List[int] = []
+    num_slices = 1
+    for axis in range(len(shape)):
+        if num_slices >= args.num_threads:
+            break
+        if axis in axes:
+            continue
+        split_axes.append(axis)
+        num_slices *= shape[axis]
+    if num_slices < 2:
+        return _strat_act_on_state_vector_from_serial_apply_unitary(unitary_value, args, qubits)
+
+    # Fixing an axis to a value removes it, shifting the later axes down.
+    slice_axes = [a - sum(1 for s in split_axes if s < a) for a in axes]
+
+    def apply_to_slice(index: Tuple[int, ...]) -> Any:
+        location = [slice(None)] * len(shape)
+        for axis, value in zip(split_axes, index):
+            location[axis] = value
+        target = args.target_tensor[tuple(location)]
+        buffer = args.available_buffer[tuple(location)]
+        result = protocols.apply_unitary(
+            unitary_value,
+            protocols.ApplyUnitaryArgs(
+                target_tensor=target, available_buffer=buffer, axes=slice_axes
+            ),
+            allow_decompose=False,
+            default=NotImplemented,
+        )
+        if result is NotImplemented:
+            return NotImplemented
+        return target, buffer, result
+
+    indices = list(np.ndindex(*[shape[a] for a in split_axes]))
+    results = list(_thread_pool(args.num_threads).map(apply_to_slice, indices))
+    if any(r is NotImplemented for r in results):
+        return NotImplemented
+
+    # Each slice's result may be in place, in the buffer, or a new array; if
+    # they are not all in place, gather them into the buffer and swap it in.
+    if all(result is target for target, _, result in results):
+        return True
+    for target, buffer, result in results:
+        if result is not buffer:
+            np.copyto(dst=buffer, src=result)
+    args.swap_target_tensor_for(args.available_buffer)
+    return True
+
+
+def _strat_act_on_state_vector_from_serial_apply_unitary(
+    unitary_value: Any,
+    args: 'cirq.ActOnStateVectorArgs',
+    qubits: Sequence['cirq.Qid'],
 ) -> bool:
     new_target_tensor = protocols.apply_unitary(
         unitary_value,
@@ -277,16 +548,14 @@ def _strat_act_on_state_vector_from_apply_unitary(
 def _strat_act_on_state_vector_from_mixture(
     action: Any, args: 'cirq.ActOnStateVectorArgs', qubits: Sequence['cirq.Qid']
 ) -> bool:
-    mixture = protocols.mixture(action, default=None)
+    mixture = _cached_matrices(_mixture_tensors, action, args.target_tensor.dtype)
     if mixture is None:
         return NotImplemented
-    probabilities, unitaries = zip(*mixture)
+    probabilities, unitaries = mixture
 
     index = args.prng.choice(range(len(unitaries)), p=probabilities)
-    shape = protocols.qid_shape(action) * 2
-    unitary = unitaries[index].astype(args.target_tensor.dtype).reshape(shape)
     linalg.targeted_left_multiply(
-        unitary, args.target_tensor, args.get_axes(qubits), out=args.available_buffer
+        unitaries[index], args.target_tensor, args.get_axes(qubits), out=args.available_buffer
     )
     args.swap_target_tensor_for(args.available_buffer)
     if protocols.is_measurement(action):
@@ -295,11 +564,45 @@ def _strat_act_on_state_vector_from_mixture(
     return True
 
 
+def _strat_act_on_state_vector_from_parallel_gate(
+    action: Any, args: 'cirq.ActOnStateVectorArgs', qubits: Sequence['cirq.Qid']
+) -> bool:
+    """Applies the copies of a parallel gate one qubit at a time.
+
+    The mixture indices of all copies are sampled at once, and copies that
+    picked an identity are skipped. Gates without a mixture have their
+    channel applied to each qubit in turn.
+    """
+    gate = action.gate if isinstance(action, ops.Operation) else action
+    if not isinstance(gate, ops.ParallelGate) or protocols.is_measurement(gate.sub_gate):
+        return NotImplemented
+    mixture = _cached_matrices(_parallel_mixture_tensors, gate.sub_gate, args.target_tensor.dtype)
+    if mixture is None:
+        for q in qubits:
+            if _strat_act_on_state_vector_from_channel(gate.sub_gate, args, [q]) is not True:
+                return NotImplemented
+        return True
+    probabilities, unitaries, is_identity = mixture
+
+    if len(unitaries) == 1:
+        indices = np.zeros(len(qubits), dtype=int)
+    else:
+        indices = args.prng.choice(len(unitaries), size=len(qubits), p=probabilities)
+    for q, index in zip(qubits, indices):
+        if is_identity[index]:
+            continue
+        linalg.targeted_left_multiply(
+            unitaries[index], args.target_tensor, args.get_axes([q]), out=args.available_buffer
+        )
+        args.swap_target_tensor_for(args.available_buffer)
+    return True
+
+
 def _strat_act_on_state_vector_from_channel(
     action: Any, args: 'cirq.ActOnStateVectorArgs', qubits: Sequence['cirq.Qid']
 ) -> bool:
-    kraus_operators = protocols.kraus(action, default=None)
-    if kraus_operators is None:
+    kraus_tensors = _cached_matrices(_kraus_tensors, action, args.target_tensor.dtype)
+    if kraus_tensors is None:
         return NotImplemented
 
     def prepare_into_buffer(k: int):
@@ -310,8 +613,6 @@ def _strat_act_on_state_vector_from_channel(
             out=args.available_buffer,
         )
 
-    shape = protocols.qid_shape(action)
-    kraus_tensors = [e.reshape(shape * 2).astype(args.target_tensor.dtype) for e in kraus_operators]
     p = args.prng.random()
     weight = None
     fallback_weight = 0
@@ -342,3 +643,63 @@ def _strat_act_on_state_vector_from_channel(
         key = protocols.measurement_key_name(action)
         args.log_of_measurement_results[key] = [index]
     return True
+
+
+# The number of (gate, dtype) pairs whose mixture or Kraus matrices are kept.
+_MATRIX_CACHE_SIZE = 1024
+
+
+def _cached_matrices(func: Callable[[Any, np.dtype], Any], action: Any, dtype: np.dtype) -> Any:
+    """Calls a cached function computing the matrices of an action in a dtype.
+
+    Operations are keyed by their gate, so that the matrices are shared by all
+    qubits the gate is applied to. Unhashable values are not cached.
+    """
+    if isinstance(action, ops.Operation) and action.gate is not None:
+        action = action.gate
+    try:
+        hash(action)
+    except TypeError:
+        return func.__wrapped__(action, dtype)  # type: ignore
+    return func(action, dtype)
+
+
+def _read_only(tensor: np.ndarray) -> np.ndarray:
+    tensor.setflags(write=False)
+    return tensor
+
+
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE)
+def _mixture_tensors(
+    action: Any, dtype: np.dtype
+) -> Optional[Tuple[Tuple[float, ...], Tuple[np.ndarray, ...]]]:
+    mixture = protocols.mixture(action, default=None)
+    if mixture is None:
+        return None
+    probabilities, unitaries = zip(*mixture)
+    shape = protocols.qid_shape(action) * 2
+    return probabilities, tuple(_read_only(u.astype(dtype).reshape(shape)) for u in unitaries)
+
+
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE)
+def _parallel_mixture_tensors(
+    action: Any, dtype: np.dtype
+) -> Optional[Tuple[np.ndarray, Tuple[np.ndarray, ...], Tuple[bool, ...]]]:
+    mixture = _cached_matrices(_mixture_tensors, action, dtype)
+    if mixture is None:
+        return None
+    probabilities, unitaries = mixture
+    size = int(np.prod(protocols.qid_shape(action), dtype=np.int64))
+    is_identity = tuple(
+        np.array_equal(u.reshape((size, size)), np.eye(size, dtype=dtype)) for u in unitaries
+    )
+    return np.array(probabilities), unitaries, is_identity
+
+
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE)
+def _kraus_tensors(action: Any, dtype: np.dtype) -> Optional[Tuple[np.ndarray, ...]]:
+    kraus_operators = protocols.kraus(action, default=None)
+    if kraus_operators is None:
+        return None
+    shape = protocols.qid_shape(action) * 2
+    return tuple(_read_only(k.reshape(shape).astype(dtype)) for k in kraus_operators)
@@ -16,6 +16,7 @@ from unittest import mock
 
 import numpy as np
 import pytest
+import sympy
 
 import cirq
 
@@ -325,3 +326,180 @@ def test_axes_deprecation():
     assert args.available_buffer is buf
     assert args.qubits is qids
     assert args.log_of_measurement_results is log
+
+
+class _NewArrayGate(cirq.SingleQubitGate):
+    """Returns a freshly allocated array from `_apply_unitary_`."""
+
+    def _apply_unitary_(self, args):
+        return cirq.linalg.targeted_left_multiply(
+            cirq.unitary(cirq.H).reshape((2, 2)), args.target_tensor, args.axes
+        )
+
+
+@pytest.mark.parametrize(
+    'gate, qubit_indices',
+    [
+        (cirq.X, [0]),
+        (cirq.H, [3]),
+        (cirq.Z ** 0.3, [15]),
+        (cirq.CZ, [0, 9]),
+        (cirq.FSimGate(0.4, 0.2), [2, 1]),
+        (cirq.CCX, [16, 4, 0]),
+        (cirq.MatrixGate(cirq.testing.random_unitary(4)), [7, 12]),
+        (_NewArrayGate(), [1]),
+    ],
+)
+def test_parallel_apply_unitary_matches_serial(gate, qubit_indices):
+    qubits = cirq.LineQubit.range(17)
+    state = cirq.testing.random_superposition(2 ** 17).astype(np.complex128).reshape((2,) * 17)
+
+    def act(num_threads):
+        args = cirq.ActOnStateVectorArgs(
+            target_tensor=state.copy(),
+            available_buffer=np.empty_like(state),
+            qubits=qubits,
+            prng=np.random.RandomState(),
+            log_of_measurement_results={},
+            num_threads=num_threads,
+        )
+        cirq.act_on(gate, args, [qubits[i] for i in qubit_indices])
+        return args.target_tensor
+
+    np.testing.assert_allclose(act(4), act(1), atol=1e-8)
+
+
+def test_parallel_apply_unitary_falls_back_for_channels():
+    qubits = cirq.LineQubit.range(17)
+    args = cirq.ActOnStateVectorArgs(
+        target_tensor=cirq.one_hot(shape=(2,) * 17, dtype=np.complex64),
+        available_buffer=np.empty((2,) * 17, dtype=np.complex64),
+        qubits=qubits,
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+        num_threads=4,
+    )
+    cirq.act_on(cirq.bit_flip(1), args, [qubits[0]])
+    expected = cirq.one_hot(index=(1,) + (0,) * 16, shape=(2,) * 17, dtype=np.complex64)
+    np.testing.assert_allclose(args.target_tensor, expected)
+
+
+def test_simulator_num_threads():
+    qubits = cirq.LineQubit.range(17)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=4, op_density=1, random_state=1234)
+    expected = cirq.Simulator(dtype=np.complex128).simulate(circuit).final_state_vector
+    actual = (
+        cirq.Simulator(dtype=np.complex128, num_threads=3, split_untangled_states=False)
+        .simulate(circuit)
+        .final_state_vector
+    )
+    np.testing.assert_allclose(actual, expected, atol=1e-8)
+    with pytest.raises(ValueError, match='num_threads'):
+        _ = cirq.Simulator(num_threads=0)
+
+
+@pytest.mark.parametrize(
+    'gate',
+    [
+        cirq.X,
+        cirq.rx(np.pi),
+        cirq.XPowGate(global_shift=0.25),
+        cirq.Z,
+        cirq.S,
+        cirq.rz(0.3),
+        cirq.ZPowGate(exponent=0.7, global_shift=0.1),
+        cirq.CZ,
+        cirq.CZ ** 0.3,
+        cirq.CZPowGate(exponent=0.7, global_shift=0.1),
+        cirq.CNOT,
+        cirq.CXPowGate(global_shift=-0.5),
+        cirq.SWAP,
+        cirq.SwapPowGate(global_shift=0.3),
+    ],
+)
+@pytest.mark.parametrize('chunk_size', [1, 4, 2 ** 14])
+def test_in_place_kernels(gate, chunk_size):
+    qubits = cirq.LineQubit.range(5)
+    targets = qubits[-1 : -gate.num_qubits() - 1 : -1]
+    state = cirq.testing.random_superposition(32, random_state=1234).reshape((2,) * 5)
+    args = cirq.ActOnStateVectorArgs(
+        target_tensor=state.copy(),
+        available_buffer=np.empty_like(state),
+        qubits=qubits,
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+    target_tensor = args.target_tensor
+    with mock.patch('cirq.sim.act_on_state_vector_args._SWAP_CHUNK_SIZE', new=chunk_size):
+        cirq.act_on(gate, args, targets)
+    assert args.target_tensor is target_tensor
+    expected = cirq.apply_unitary(
+        gate,
+        cirq.ApplyUnitaryArgs(state, np.empty_like(state), [qubits.index(q) for q in targets]),
+    )
+    np.testing.assert_allclose(args.target_tensor, expected, atol=1e-8)
+
+
+def test_in_place_kernels_single_qubit_state():
+    q = cirq.LineQubit(0)
+    args = cirq.ActOnStateVectorArgs(
+        target_tensor=cirq.one_hot(shape=(2,), dtype=np.complex64),
+        available_buffer=np.empty(2, dtype=np.complex64),
+        qubits=[q],
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+    cirq.act_on(cirq.X, args, [q])
+    np.testing.assert_allclose(args.target_tensor, [0, 1])
+    cirq.act_on(cirq.X ** 0.5, args, [q])
+    np.testing.assert_allclose(args.target_tensor, cirq.unitary(cirq.X ** 0.5)[:, 1], atol=1e-6)
+    with pytest.raises(TypeError, match="Can't simulate"):
+        cirq.act_on(cirq.Z ** sympy.Symbol('t'), args, [q])
+
+
+@pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
+def test_noise_matrices_cached_per_dtype(dtype):
+    from cirq.sim import act_on_state_vector_args
+
+    qubits = cirq.LineQubit.range(2)
+    args = cirq.ActOnStateVectorArgs(
+        target_tensor=cirq.one_hot(shape=(2, 2), dtype=dtype),
+        available_buffer=np.empty((2, 2), dtype=dtype),
+        qubits=qubits,
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+    act_on_state_vector_args._mixture_tensors.cache_clear()
+    act_on_state_vector_args._kraus_tensors.cache_clear()
+    for q in qubits:
+        cirq.act_on(cirq.bit_flip(1).on(q), args)
+        cirq.act_on(cirq.amplitude_damp(0).on(q), args)
+    assert args.target_tensor.dtype == dtype
+    np.testing.assert_allclose(args.target_tensor, [[0, 0], [0, 1]])
+    # amplitude_damp has no mixture, which is cached as well.
+    assert act_on_state_vector_args._mixture_tensors.cache_info().hits == 2
+    assert act_on_state_vector_args._kraus_tensors.cache_info().hits == 1
+    _, unitaries = act_on_state_vector_args._mixture_tensors(cirq.bit_flip(1), np.dtype(dtype))
+    assert all(u.dtype == dtype and not u.flags.writeable for u in unitaries)
+
+
+def test_noise_matrices_of_unhashable_operations():
+    class UnhashableChannel(cirq.Operation):
+        qubits = (cirq.LineQubit(0),)
+        __hash__ = None  # type: ignore
+
+        def with_qubits(self, *new_qubits):
+            raise NotImplementedError()
+
+        def _mixture_(self):
+            return [(1.0, np.array([[0, 1], [1, 0]]))]
+
+    args = cirq.ActOnStateVectorArgs(
+        target_tensor=cirq.one_hot(shape=(2,), dtype=np.complex64),
+        available_buffer=np.empty(2, dtype=np.complex64),
+        qubits=UnhashableChannel.qubits,
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+    cirq.act_on(UnhashableChannel(), args)
+    np.testing.assert_allclose(args.target_tensor, [0, 1])
@@ -20,3 +20,7 @@ from cirq.sim.clifford.clifford_simulator import (
 from cirq.sim.clifford.stabilizer_sampler import (
     StabilizerSampler,
 )
+
+from cirq.sim.clifford.pauli_frame_sampler import (
+    PauliFrameSampler,
+)
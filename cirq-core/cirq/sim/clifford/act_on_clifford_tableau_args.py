@@ -18,12 +18,13 @@ from typing import Any, Dict, TYPE_CHECKING, List, Sequence, Iterable, Union
 
 import numpy as np
 
+from cirq import value
 from cirq._compat import deprecated_parameter
 from cirq.ops import common_gates
 from cirq.ops import pauli_gates
 from cirq.ops.clifford_gate import SingleQubitCliffordGate
 from cirq.protocols import has_unitary, num_qubits, unitary
-from cirq.qis.clifford_tableau import CliffordTableau
+from cirq.qis.clifford_tableau import CliffordTableau, PackedCliffordTableau
 from cirq.sim.act_on_args import ActOnArgs
 from cirq.type_workarounds import NotImplementedType
 
@@ -61,7 +62,7 @@ class ActOnCliffordTableauArgs(ActOnArgs):
     )
     def __init__(
         self,
-        tableau: CliffordTableau,
+        tableau: Union[CliffordTableau, PackedCliffordTableau],
         prng: np.random.RandomState,
         log_of_measurement_results: Dict[str, Any],
         qubits: Sequence['cirq.Qid'] = None,
@@ -70,8 +71,8 @@ class ActOnCliffordTableauArgs(ActOnArgs):
         """Inits ActOnCliffordTableauArgs.
 
         Args:
-            tableau: The CliffordTableau to act on. Operations are expected to
-                perform inplace edits of this object.
+            tableau: The CliffordTableau or PackedCliffordTableau to act on.
+                Operations are expected to perform inplace edits of this object.
             qubits: Determines the canonical ordering of the qubits. This
                 is often used in specifying the initial state, i.e. the
                 ordering of the computational basis states.
@@ -117,8 +118,33 @@ class ActOnCliffordTableauArgs(ActOnArgs):
         repetitions: int = 1,
         seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
     ) -> np.ndarray:
-        # Unnecessary for now but can be added later if there is a use case.
-        raise NotImplementedError()
+        """Samples the given qubits from the tableau without collapsing it.
+
+        The computational basis support of a stabilizer state is an affine
+        subspace `x0 + V`, where `V` is spanned by the X parts of the stabilizer
+        generators, and every point of the support is equally likely. So a
+        single reference sample `x0` is drawn from a copy of the tableau and
+        all repetitions are obtained at once by XOR-ing it with uniformly
+        random combinations of the generators' X parts.
+        """
+        prng = value.parse_random_state(seed)
+        axes = [self.qubit_map[q] for q in qubits]
+        reference = self.tableau.copy()
+        reference_bits = np.array([reference._measure(axis, prng) for axis in axes], dtype=bool)
+
+        tableau = self.tableau
+        if isinstance(tableau, PackedCliffordTableau):
+            tableau = tableau.to_tableau()
+        generators = tableau.xs[tableau.n :, axes]
+        generators = generators[np.any(generators, axis=1)]
+        if repetitions == 0 or len(generators) == 0:
+            return np.tile(reference_bits, (repetitions, 1)).astype(np.uint8)
+
+        # Float matmul is exact here (entries are bounded by the qubit count)
+        # and, unlike integer matmul, dispatches to BLAS.
+        coefficients = prng.randint(2, size=(repetitions, len(generators))).astype(np.float64)
+        flips = np.mod(coefficients @ generators.astype(np.float64), 2).astype(bool)
+        return (flips ^ reference_bits).astype(np.uint8)
 
 
 def _strat_act_on_clifford_tableau_from_single_qubit_decompose(
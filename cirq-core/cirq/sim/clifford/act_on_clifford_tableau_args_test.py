@@ -166,3 +166,25 @@ def test_axes_deprecation():
     assert args.tableau is state
     assert args.log_of_measurement_results is log
     assert args.qubits is qids
+
+
+def test_sample():
+    q = cirq.LineQubit.range(3)
+    args = cirq.ActOnCliffordTableauArgs(
+        tableau=cirq.CliffordTableau(num_qubits=3),
+        qubits=q,
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+    cirq.act_on(cirq.H(q[0]), args)
+    cirq.act_on(cirq.CNOT(q[0], q[1]), args)
+    cirq.act_on(cirq.X(q[2]), args)
+    tableau = args.tableau.copy()
+
+    samples = args.sample([q[2], q[1], q[0]], repetitions=100, seed=1234)
+    assert samples.shape == (100, 3)
+    assert np.all(samples[:, 0] == 1)
+    assert np.all(samples[:, 1] == samples[:, 2])
+    assert 20 < np.sum(samples[:, 1]) < 80
+    assert args.tableau == tableau
+    assert args.sample(q, repetitions=0).shape == (0, 3)
@@ -34,7 +34,7 @@ from typing import Any, Dict, List, Sequence, Union
 import numpy as np
 
 import cirq
-from cirq import study, protocols, value
+from cirq import study, protocols, qis, value
 from cirq.protocols import act_on
 from cirq.sim import clifford, simulator, simulator_base
 
@@ -49,13 +49,24 @@ class CliffordSimulator(
 ):
     """An efficient simulator for Clifford circuits."""
 
-    def __init__(self, seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None):
+    def __init__(
+        self,
+        seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+        packed_tableau: bool = False,
+    ):
         """Creates instance of `CliffordSimulator`.
 
         Args:
             seed: The random seed to use for this simulator.
+            packed_tableau: If True, the state is stored as a
+                `cirq.PackedCliffordTableau` instead of in CH-form. Gates and
+                measurements then act on 64 tableau rows per machine word,
+                which is much faster for large numbers of qubits, but the
+                state is only known up to global phase, and the step results
+                have a tableau `state` with no state vector.
         """
         self.init = True
+        self._packed_tableau = packed_tableau
         super().__init__(seed=seed)
 
     @staticmethod
@@ -68,10 +79,12 @@ class CliffordSimulator(
     # pylint: disable=missing-param-doc
     def _create_partial_act_on_args(
         self,
-        initial_state: Union[int, clifford.ActOnStabilizerCHFormArgs],
+        initial_state: Union[
+            int, clifford.ActOnStabilizerCHFormArgs, clifford.ActOnCliffordTableauArgs
+        ],
         qubits: Sequence['cirq.Qid'],
         logs: Dict[str, Any],
-    ) -> clifford.ActOnStabilizerCHFormArgs:
+    ) -> Union[clifford.ActOnStabilizerCHFormArgs, clifford.ActOnCliffordTableauArgs]:
         """Creates the ActOnStabilizerChFormArgs for a circuit.
 
         Args:
@@ -82,11 +95,22 @@ class CliffordSimulator(
                 ordering of the computational basis states.
 
         Returns:
-            ActOnStabilizerChFormArgs for the circuit.
+            ActOnStabilizerChFormArgs for the circuit, or ActOnCliffordTableauArgs
+            if the simulator uses packed tableaux.
         """
-        if isinstance(initial_state, clifford.ActOnStabilizerCHFormArgs):
+        if isinstance(
+            initial_state, (clifford.ActOnStabilizerCHFormArgs, clifford.ActOnCliffordTableauArgs)
+        ):
             return initial_state
 
+        if self._packed_tableau:
+            return clifford.ActOnCliffordTableauArgs(
+                tableau=qis.PackedCliffordTableau(len(qubits), initial_state=initial_state),
+                prng=self._prng,
+                log_of_measurement_results=logs,
+                qubits=qubits,
+            )
+
         qubit_map = {q: i for i, q in enumerate(qubits)}
 
         state = CliffordState(qubit_map, initial_state=initial_state)
@@ -170,6 +194,8 @@ class CliffordSimulatorStepResult(
 
     @property
     def state(self):
+        if isinstance(self._merged_sim_state, clifford.ActOnCliffordTableauArgs):
+            return self._merged_sim_state.tableau.copy()
         if self._clifford_state is None:
             clifford_state = CliffordState(self._qubit_mapping)
             clifford_state.ch_form = self._merged_sim_state.state.copy()
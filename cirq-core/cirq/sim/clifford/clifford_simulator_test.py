@@ -434,6 +434,38 @@ def test_sample_seed():
     assert result_string == '11010001111100100000'
 
 
+def test_packed_tableau_run():
+    qubits = cirq.LineQubit.range(70)
+    circuit = cirq.Circuit(
+        cirq.H(qubits[0]),
+        [cirq.CNOT(a, b) for a, b in zip(qubits, qubits[1:])],
+        cirq.measure(qubits[0], key='first'),
+        cirq.X(qubits[1]),
+        cirq.measure_each(*qubits),
+    )
+    result = cirq.CliffordSimulator(packed_tableau=True).run(circuit, repetitions=20)
+    first = result.measurements['first'][:, 0]
+    for q in qubits:
+        expected = first ^ 1 if q == qubits[1] else first
+        np.testing.assert_equal(result.measurements[str(q)][:, 0], expected)
+
+
+def test_packed_tableau_simulate():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.S(q1), cirq.measure(q0, key='m'))
+    simulator = cirq.CliffordSimulator(seed=1234, packed_tableau=True)
+    result = simulator.simulate(circuit, initial_state=2)
+    m = result.measurements['m'][0]
+    assert isinstance(result.final_state, cirq.PackedCliffordTableau)
+    assert result.final_state.stabilizers() == [
+        cirq.DensePauliString('ZI', coefficient=(-1) ** m),
+        cirq.DensePauliString('ZZ', coefficient=1),
+    ]
+    *_, step = simulator.simulate_moment_steps(circuit[:2])
+    samples = step.sample([q0, q1], repetitions=10)
+    assert all(sample[0] == sample[1] for sample in samples)
+
+
 def test_is_supported_operation():
     class MultiQubitOp(cirq.Operation):
         """Multi-qubit operation with unitary.
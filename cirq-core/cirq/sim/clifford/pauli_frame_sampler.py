@@ -0,0 +1,275 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A sampler for noisy stabilizer circuits based on Pauli frame propagation."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from cirq import circuits, ops, protocols, study, value
+from cirq.qis.clifford_tableau import CliffordTableau
+from cirq.sim.clifford.act_on_clifford_tableau_args import ActOnCliffordTableauArgs
+from cirq.work import sampler
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class PauliFrameSampler(sampler.Sampler):
+    """A sampler for Clifford circuits with Pauli noise channels.
+
+    The circuit is simulated only once, without noise, on a stabilizer tableau
+    to obtain a reference sample of all measurements. All repetitions are then
+    produced together by propagating a batch of Pauli frames (one per
+    repetition) through the circuit as boolean arrays. Noise channels whose
+    mixture consists of Pauli operations (e.g. `cirq.depolarize`,
+    `cirq.bit_flip`, `cirq.phase_flip`, `cirq.asymmetric_depolarize`) are
+    sampled into the frames, and a measurement result is the reference result
+    flipped by the X part of the frame on the measured qubit.
+
+    Random measurement outcomes are reproduced by randomizing the Z part of
+    the frames whenever a qubit is (re)initialized to |0>, i.e. at the start
+    of the circuit, after a measurement and after a reset.
+
+    Supported operations are unitary Clifford operations, `cirq.measure`,
+    `cirq.reset` and Pauli noise channels.
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+        batch_size: int = 100_000,
+    ):
+        """Inits PauliFrameSampler.
+
+        Args:
+            seed: The random seed or generator to use when sampling.
+            batch_size: The maximum number of Pauli frames propagated through
+                the circuit at once. Larger batches are faster but need
+                memory proportional to `batch_size` times the number of qubits.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError(f'batch_size must be positive, got {batch_size}.')
+        self._prng = value.parse_random_state(seed)
+        self._batch_size = batch_size
+
+    def run_sweep(
+        self,
+        program: 'cirq.AbstractCircuit',
+        params: 'cirq.Sweepable',
+        repetitions: int = 1,
+    ) -> List['cirq.Result']:
+        results: List[cirq.Result] = []
+        for param_resolver in study.to_resolvers(params):
+            resolved_circuit = protocols.resolve_parameters(program, param_resolver)
+            measurements = self._run(resolved_circuit, repetitions=repetitions)
+            results.append(study.Result(params=param_resolver, measurements=measurements))
+        return results
+
+    def _run(self, circuit: circuits.AbstractCircuit, repetitions: int) -> Dict[str, np.ndarray]:
+        qubits = sorted(circuit.all_qubits())
+        instructions = _compile(circuit, {q: i for i, q in enumerate(qubits)})
+        reference = self._reference_sample(circuit, qubits)
+
+        chunks: Dict[str, List[np.ndarray]] = {k: [] for k in reference}
+        remaining = repetitions
+        while remaining > 0:
+            batch = min(remaining, self._batch_size)
+            flips = self._propagate_frames(instructions, len(qubits), batch)
+            for key, ref in reference.items():
+                chunks[key].append((flips[key].T ^ ref).astype(np.uint8))
+            remaining -= batch
+
+        return {
+            key: (
+                np.concatenate(chunks[key])
+                if chunks[key]
+                else np.zeros((0, len(reference[key])), dtype=np.uint8)
+            )
+            for key in reference
+        }
+
+    def _reference_sample(
+        self, circuit: circuits.AbstractCircuit, qubits: Sequence['cirq.Qid']
+    ) -> Dict[str, np.ndarray]:
+        """Simulates the circuit once without noise and returns its measurements."""
+        state = ActOnCliffordTableauArgs(
+            CliffordTableau(num_qubits=len(qubits)),
+            qubits=qubits,
+            prng=self._prng,
+            log_of_measurement_results={},
+        )
+        for op in circuit.all_operations():
+            if protocols.has_unitary(op) or protocols.is_measurement(op) or _is_reset(op):
+                protocols.act_on(op, state)
+        return {k: np.array(v, dtype=bool) for k, v in state.log_of_measurement_results.items()}
+
+    def _propagate_frames(
+        self, instructions: List['_Instruction'], num_qubits: int, batch: int
+    ) -> Dict[str, np.ndarray]:
+        """Propagates `batch` random Pauli frames and returns the measurement flips."""
+        xs = np.zeros((num_qubits, batch), dtype=bool)
+        zs = self._prng.randint(2, size=(num_qubits, batch)).astype(bool)
+        flips: Dict[str, np.ndarray] = {}
+
+        for kind, axes, data in instructions:
+            if kind == _CLIFFORD:
+                old = np.concatenate([xs[axes], zs[axes]])
+                new = np.zeros_like(old)
+                for i, j in zip(*np.nonzero(data)):
+                    new[j] ^= old[i]
+                k = len(axes)
+                xs[axes] = new[:k]
+                zs[axes] = new[k:]
+            elif kind == _PAULI_CHANNEL:
+                probabilities, paulis = data
+                choices = self._prng.choice(len(probabilities), size=batch, p=probabilities)
+                xs[axes] ^= paulis[0][:, choices]
+                zs[axes] ^= paulis[1][:, choices]
+            elif kind == _MEASURE:
+                flips[data] = xs[axes].copy()
+                zs[axes] = self._prng.randint(2, size=(len(axes), batch)).astype(bool)
+            else:
+                assert kind == _RESET
+                xs[axes] = False
+                zs[axes] = self._prng.randint(2, size=(len(axes), batch)).astype(bool)
+
+        return flips
+
+
+_CLIFFORD = 'clifford'
+_PAULI_CHANNEL = 'pauli_channel'
+_MEASURE = 'measure'
+_RESET = 'reset'
+
+_Instruction = Tuple[str, List[int], Any]
+
+
+def _is_reset(op: 'cirq.Operation') -> bool:
+    return isinstance(op.gate, ops.ResetChannel)
+
+
+def _compile(
+    circuit: circuits.AbstractCircuit, qubit_map: Dict['cirq.Qid', int]
+) -> List[_Instruction]:
+    """Lowers the circuit into frame propagation instructions.
+
+    Raises:
+        ValueError: If the circuit contains an operation that is neither a
+            Clifford operation, a measurement, a reset nor a Pauli channel, or
+            if a measurement key is used more than once.
+    """
+    instructions: List[_Instruction] = []
+    clifford_cache: Dict['cirq.Operation', np.ndarray] = {}
+    keys = set()
+    for op in circuit.all_operations():
+        axes = [qubit_map[q] for q in op.qubits]
+        if isinstance(op.gate, ops.MeasurementGate):
+            key = op.gate.key
+            if key in keys:
+                raise ValueError(f'Measurement key {key!r} is used more than once.')
+            keys.add(key)
+            instructions.append((_MEASURE, axes, key))
+        elif _is_reset(op):
+            instructions.append((_RESET, axes, None))
+        elif protocols.has_unitary(op):
+            if not axes:
+                continue
+            if not protocols.has_stabilizer_effect(op):
+                raise ValueError(
+                    f'PauliFrameSampler only supports Clifford operations, got {op!r}.'
+                )
+            if op not in clifford_cache:
+                clifford_cache[op] = _frame_transform(op)
+            instructions.append((_CLIFFORD, axes, clifford_cache[op]))
+        else:
+            channel = _pauli_channel(op) if protocols.has_mixture(op) else None
+            if channel is None:
+                raise ValueError(f'PauliFrameSampler does not support {op!r}.')
+            instructions.append((_PAULI_CHANNEL, axes, channel))
+    return instructions
+
+
+def _frame_transform(op: 'cirq.Operation') -> np.ndarray:
+    """Returns the binary matrix mapping frame bits before `op` to bits after it.
+
+    Row i of the returned (2k, 2k) matrix holds the (x, z) bits of the image
+    of the i'th generator under conjugation by `op`, where the generators are
+    ordered X_0, ..., X_{k-1}, Z_0, ..., Z_{k-1}. Signs are irrelevant for
+    frames and are dropped.
+    """
+    state = ActOnCliffordTableauArgs(
+        CliffordTableau(num_qubits=len(op.qubits)),
+        qubits=op.qubits,
+        prng=np.random.RandomState(),
+        log_of_measurement_results={},
+    )
+    protocols.act_on(op, state)
+    return np.concatenate([state.tableau.xs, state.tableau.zs], axis=1)
+
+
+def _pauli_channel(op: 'cirq.Operation') -> Optional[Tuple[np.ndarray, Tuple[np.ndarray, ...]]]:
+    """Decomposes a mixture of Pauli operations into probabilities and frame bits.
+
+    Returns:
+        None if some component of the mixture is not a Pauli operation up to
+        global phase. Otherwise the probabilities of the components and the
+        (x, z) bits of each component, as two (k, num_components) arrays.
+    """
+    probabilities = []
+    xs = []
+    zs = []
+    for p, u in protocols.mixture(op):
+        bits = _pauli_bits(u)
+        if bits is None:
+            return None
+        probabilities.append(p)
+        xs.append(bits[0])
+        zs.append(bits[1])
+    probs = np.array(probabilities, dtype=np.float64)
+    return probs / np.sum(probs), (np.array(xs).T, np.array(zs).T)
+
+
+_SINGLE_QUBIT_X = np.array([[0, 1], [1, 0]])
+_SINGLE_QUBIT_Z = np.array([[1, 0], [0, -1]])
+
+
+def _pauli_bits(u: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Returns the (x, z) bits of a unitary that is a Pauli string, else None."""
+    k = int(np.log2(u.shape[0]))
+    # A Pauli string X^x Z^z maps |0...0> to |x>, and X^x times it is diagonal
+    # with (-1)^(z.b) on |b> up to global phase.
+    column = int(np.argmax(np.abs(u[:, 0])))
+    x = np.array(value.big_endian_int_to_bits(column, bit_count=k), dtype=bool)
+    phase = u[column, 0]
+    z = np.array(
+        [np.real(u[column ^ (1 << (k - 1 - i)), 1 << (k - 1 - i)] / phase) < 0 for i in range(k)],
+        dtype=bool,
+    )
+
+    pauli = np.ones((1, 1))
+    for xi, zi in zip(x, z):
+        pauli = np.kron(
+            pauli,
+            np.linalg.matrix_power(_SINGLE_QUBIT_X, int(xi))
+            @ np.linalg.matrix_power(_SINGLE_QUBIT_Z, int(zi)),
+        )
+    if not np.allclose(u, phase * pauli):
+        return None
+    return x, z
@@ -0,0 +1,152 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import sympy
+
+import cirq
+
+
+def test_noiseless_bell_pair():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.measure(a, key='a'),
+        cirq.measure(b, key='b'),
+    )
+
+    result = cirq.PauliFrameSampler(seed=1234).run(c, repetitions=1000)
+    assert result.measurements['a'].shape == (1000, 1)
+    assert 400 < np.sum(result.measurements['a']) < 600
+    assert np.all(result.measurements['a'] == result.measurements['b'])
+
+
+def test_deterministic_with_invert_mask():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(cirq.X(a), cirq.measure(a, b, key='m', invert_mask=(False, True)))
+    result = cirq.PauliFrameSampler().run(c, repetitions=5)
+    np.testing.assert_equal(result.measurements['m'], [[1, 1]] * 5)
+
+
+@pytest.mark.parametrize(
+    'channel, flip_probability',
+    [
+        (cirq.bit_flip(0.2), 0.2),
+        (cirq.depolarize(0.3), 0.2),
+        (cirq.asymmetric_depolarize(0.1, 0.2, 0.3), 0.3),
+        (cirq.X.with_probability(0.25), 0.25),
+    ],
+)
+def test_pauli_channels(channel, flip_probability):
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        channel.on(b),
+        cirq.measure(a, b, key='m'),
+    )
+    m = cirq.PauliFrameSampler(seed=1234).run(c, repetitions=20000).measurements['m']
+    assert np.mean(m[:, 0] != m[:, 1]) == pytest.approx(flip_probability, abs=0.02)
+
+
+def test_two_qubit_depolarizing_channel():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(cirq.depolarize(0.3, n_qubits=2).on(a, b), cirq.measure(a, b, key='m'))
+    m = cirq.PauliFrameSampler(seed=1234).run(c, repetitions=20000).measurements['m']
+    # 8 of the 15 non-identity Pauli strings flip a given qubit.
+    assert np.mean(m[:, 0]) == pytest.approx(0.3 * 8 / 15, abs=0.02)
+    assert np.mean(m[:, 1]) == pytest.approx(0.3 * 8 / 15, abs=0.02)
+
+
+def test_mid_circuit_measurement_and_reset():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(
+        cirq.H(a),
+        cirq.measure(a, key='first'),
+        cirq.phase_flip(0.25).on(a),
+        cirq.measure(a, key='second'),
+        cirq.H(a),
+        cirq.measure(a, key='third'),
+        cirq.CNOT(a, b),
+        cirq.reset(a),
+        cirq.measure(a, b, key='fourth'),
+    )
+    result = cirq.PauliFrameSampler(seed=1234).run(c, repetitions=20000)
+    first = result.measurements['first'][:, 0]
+    second = result.measurements['second'][:, 0]
+    third = result.measurements['third'][:, 0]
+    fourth = result.measurements['fourth']
+    assert np.mean(first) == pytest.approx(0.5, abs=0.02)
+    assert np.all(first == second)
+    assert np.mean(third) == pytest.approx(0.5, abs=0.02)
+    assert np.all(fourth[:, 0] == 0)
+    assert np.all(fourth[:, 1] == third)
+
+
+def test_matches_density_matrix_distribution():
+    q = cirq.LineQubit.range(3)
+    c = cirq.Circuit(
+        cirq.H(q[0]),
+        cirq.CNOT(q[0], q[1]),
+        cirq.depolarize(0.1).on(q[1]),
+        cirq.S(q[1]),
+        cirq.CZ(q[1], q[2]),
+        cirq.bit_flip(0.2).on(q[2]),
+        cirq.depolarize(0.1, n_qubits=2).on(q[0], q[2]),
+        cirq.CNOT(q[0], q[2]),
+        cirq.phase_flip(0.3).on(q[1]),
+        cirq.S(q[1]),
+        cirq.H(q[1]),
+    )
+    expected = np.real(np.diag(cirq.final_density_matrix(c, qubit_order=q)))
+    m = (
+        cirq.PauliFrameSampler(seed=1234)
+        .run(c + cirq.measure(*q, key='m'), repetitions=50000)
+        .measurements['m']
+    )
+    actual = np.bincount(m.dot([4, 2, 1]), minlength=8) / len(m)
+    np.testing.assert_allclose(actual, expected, atol=0.01)
+
+
+def test_batches():
+    a = cirq.LineQubit(0)
+    c = cirq.Circuit(cirq.H(a), cirq.measure(a, key='a'))
+    sampler = cirq.PauliFrameSampler(seed=1234, batch_size=7)
+    assert sampler.run(c, repetitions=100).measurements['a'].shape == (100, 1)
+    assert sampler.run(c, repetitions=0).measurements['a'].shape == (0, 1)
+    with pytest.raises(ValueError, match='batch_size'):
+        _ = cirq.PauliFrameSampler(batch_size=0)
+
+
+def test_run_sweep():
+    a = cirq.LineQubit(0)
+    c = cirq.Circuit(cirq.X(a) ** sympy.Symbol('t'), cirq.measure(a, key='a'))
+    results = cirq.PauliFrameSampler().run_sweep(c, cirq.Points('t', [0, 1]), repetitions=3)
+    np.testing.assert_equal(results[0].measurements['a'], [[0]] * 3)
+    np.testing.assert_equal(results[1].measurements['a'], [[1]] * 3)
+
+
+def test_unsupported_operations():
+    a, b = cirq.LineQubit.range(2)
+    sampler = cirq.PauliFrameSampler()
+    with pytest.raises(ValueError, match='Clifford'):
+        sampler.run(cirq.Circuit(cirq.T(a), cirq.measure(a)))
+    with pytest.raises(ValueError, match='does not support'):
+        sampler.run(cirq.Circuit(cirq.amplitude_damp(0.1).on(a), cirq.measure(a)))
+    with pytest.raises(ValueError, match='does not support'):
+        sampler.run(cirq.Circuit(cirq.MatrixGate(np.diag([1, 1j])).with_probability(0.5).on(a)))
+    with pytest.raises(ValueError, match='more than once'):
+        sampler.run(cirq.Circuit(cirq.measure(a, key='m'), cirq.measure(b, key='m')))
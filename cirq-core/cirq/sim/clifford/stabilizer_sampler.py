@@ -12,19 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List
+from typing import Dict, List, cast
 
 import numpy as np
 
 import cirq
-from cirq import circuits, protocols, value
+from cirq import circuits, ops, protocols, value
 from cirq.qis.clifford_tableau import CliffordTableau
 from cirq.sim.clifford.act_on_clifford_tableau_args import ActOnCliffordTableauArgs
 from cirq.work import sampler
 
 
 class StabilizerSampler(sampler.Sampler):
-    """An efficient sampler for stabilizer circuits."""
+    """An efficient sampler for stabilizer circuits.
+
+    When all measurements in a circuit are terminal, the circuit is simulated
+    only once and every repetition is drawn from the final stabilizer state in
+    a single vectorized step. Otherwise the circuit is simulated once per
+    repetition.
+    """
 
     def __init__(self, *, seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None):
         """Inits StabilizerSampler.
@@ -52,16 +58,19 @@ class StabilizerSampler(sampler.Sampler):
         return results
 
     def _run(self, circuit: circuits.AbstractCircuit, repetitions: int) -> Dict[str, np.ndarray]:
+        qubits = sorted(circuit.all_qubits())
+
+        if self._can_sample_terminal_measurements(circuit):
+            return self._run_terminal_measurements(circuit, qubits, repetitions)
 
         measurements: Dict[str, List[int]] = {
             key: [] for key in protocols.measurement_key_names(circuit)
         }
-        qubits = circuit.all_qubits()
 
         for _ in range(repetitions):
             state = ActOnCliffordTableauArgs(
                 CliffordTableau(num_qubits=len(qubits)),
-                qubits=list(qubits),
+                qubits=qubits,
                 prng=self._prng,
                 log_of_measurement_results={},
             )
@@ -72,3 +81,54 @@ class StabilizerSampler(sampler.Sampler):
                 measurements[k].append(v)
 
         return {k: np.array(v) for k, v in measurements.items()}
+
+    def _can_sample_terminal_measurements(self, circuit: circuits.AbstractCircuit) -> bool:
+        """Whether all repetitions can be drawn from a single simulation.
+
+        This is the case when every measurement is a plain `cirq.MeasurementGate`
+        operation with a unique key that is not followed by any other operation
+        on its qubits, and every other operation is unitary.
+        """
+        measurement_ops = [op for op in circuit.all_operations() if protocols.is_measurement(op)]
+        return (
+            all(isinstance(op.gate, ops.MeasurementGate) for op in measurement_ops)
+            and all(
+                protocols.has_unitary(op)
+                for op in circuit.all_operations()
+                if not protocols.is_measurement(op)
+            )
+            and len(protocols.measurement_key_names(circuit)) == len(measurement_ops)
+            and circuit.are_all_measurements_terminal()
+        )
+
+    def _run_terminal_measurements(
+        self,
+        circuit: circuits.AbstractCircuit,
+        qubits: List['cirq.Qid'],
+        repetitions: int,
+    ) -> Dict[str, np.ndarray]:
+        state = ActOnCliffordTableauArgs(
+            CliffordTableau(num_qubits=len(qubits)),
+            qubits=qubits,
+            prng=self._prng,
+            log_of_measurement_results={},
+        )
+        measurement_ops: List['cirq.GateOperation'] = []
+        for op in circuit.all_operations():
+            if isinstance(op.gate, ops.MeasurementGate):
+                measurement_ops.append(cast('cirq.GateOperation', op))
+            else:
+                protocols.act_on(op, state)
+
+        measured_qubits = [q for op in measurement_ops for q in op.qubits]
+        samples = state.sample(measured_qubits, repetitions, seed=self._prng)
+
+        measurements: Dict[str, np.ndarray] = {}
+        offset = 0
+        for op in measurement_ops:
+            gate = cast(ops.MeasurementGate, op.gate)
+            n = len(op.qubits)
+            invert_mask = np.array(gate.full_invert_mask(), dtype=bool)
+            measurements[gate.key] = (samples[:, offset : offset + n] ^ invert_mask).astype(int)
+            offset += n
+        return measurements
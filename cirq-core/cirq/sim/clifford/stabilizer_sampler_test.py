@@ -29,3 +29,59 @@ def test_produces_samples():
     result = cirq.StabilizerSampler().sample(c, repetitions=100)
     assert 5 < sum(result['a']) < 95
     assert np.all(result['a'] ^ result['b'] == 0)
+
+
+def test_terminal_measurements_sampled_in_batch():
+    q = cirq.LineQubit.range(4)
+    c = cirq.Circuit(
+        cirq.H(q[0]),
+        cirq.CNOT(q[0], q[1]),
+        cirq.CNOT(q[1], q[2]),
+        cirq.H(q[3]),
+        cirq.S(q[3]),
+        cirq.H(q[3]),
+        cirq.measure(q[0], q[1], key='ab', invert_mask=(False, True)),
+        cirq.measure(q[2], key='c'),
+        cirq.measure(q[3], key='d'),
+    )
+    result = cirq.StabilizerSampler(seed=1234).run(c, repetitions=1000)
+    ab = result.measurements['ab']
+    c_ = result.measurements['c']
+    d = result.measurements['d']
+    assert ab.shape == (1000, 2)
+    assert c_.shape == (1000, 1)
+    assert np.all(ab[:, 0] != ab[:, 1])
+    assert np.all(ab[:, 0] == c_[:, 0])
+    assert 400 < np.sum(ab[:, 0]) < 600
+    assert 400 < np.sum(d) < 600
+
+
+def test_deterministic_terminal_measurements():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(cirq.X(a), cirq.measure(a, b, key='m'))
+    result = cirq.StabilizerSampler().run(c, repetitions=5)
+    np.testing.assert_equal(result.measurements['m'], [[1, 0]] * 5)
+
+
+def test_mid_circuit_measurements():
+    a, b = cirq.LineQubit.range(2)
+    c = cirq.Circuit(
+        cirq.H(a),
+        cirq.measure(a, key='a'),
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.measure(a, b, key='ab'),
+    )
+    result = cirq.StabilizerSampler(seed=1).run(c, repetitions=200)
+    ab = result.measurements['ab']
+    assert result.measurements['a'].shape == (200, 1)
+    assert np.all(ab[:, 0] == ab[:, 1])
+    assert 50 < np.sum(result.measurements['a']) < 150
+    assert 50 < np.sum(ab[:, 0]) < 150
+
+
+def test_noisy_terminal_measurements_resampled_per_repetition():
+    q = cirq.LineQubit(0)
+    c = cirq.Circuit(cirq.depolarize(3 / 4).on(q), cirq.measure(q, key='m'))
+    m = np.sum(cirq.StabilizerSampler(seed=1234).sample(c, repetitions=100)['m'])
+    assert 5 < m < 95
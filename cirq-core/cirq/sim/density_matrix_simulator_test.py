@@ -380,7 +380,9 @@ def test_run_repetitions_measurement_not_terminal(dtype: Type[np.number], split:
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'0': [[b0]] * 3, '1': [[b1]] * 3})
                 assert result.repetitions == 3
-        assert mock_sim.call_count == 16
+        # The suffix after the measurements is simulated once per outcome branch
+        # rather than once per repetition, so only the prefix is iterated.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -404,7 +406,9 @@ def test_run_qudits_repetitions_measurement_not_terminal(dtype: Type[np.number],
                     result.measurements, {'0 (d=2)': [[b0]] * 3, '1 (d=3)': [[b1]] * 3}
                 )
                 assert result.repetitions == 3
-        assert mock_sim.call_count == 24
+        # The suffix after the measurements is simulated once per outcome branch
+        # rather than once per repetition, so only the prefix is iterated.
+        assert mock_sim.call_count == 6
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -1344,7 +1348,9 @@ def test_random_seed_non_terminal_measurements_deterministic():
         result.measurements['a']
         == [
             [0],
-            [0],
+            [1],
+            [1],
+            [1],
             [1],
             [0],
             [1],
@@ -1356,56 +1362,54 @@ def test_random_seed_non_terminal_measurements_deterministic():
             [0],
             [0],
             [1],
-            [0],
-            [0],
             [1],
             [1],
             [1],
             [0],
+            [1],
+            [1],
+            [1],
+            [1],
             [0],
             [0],
             [0],
-            [1],
-            [0],
             [0],
             [0],
             [1],
             [1],
-            [1],
-            [1],
         ]
     )
     assert np.all(
         result.measurements['b']
         == [
-            [1],
             [1],
             [0],
             [1],
             [1],
-            [1],
+            [0],
             [1],
             [1],
             [0],
+            [0],
             [1],
             [1],
-            [0],
             [1],
             [1],
+            [0],
             [1],
             [0],
             [0],
             [1],
             [1],
-            [1],
+            [0],
+            [0],
             [0],
             [1],
             [1],
+            [0],
             [1],
             [1],
             [1],
-            [0],
-            [1],
             [1],
             [1],
         ]
@@ -1453,6 +1457,42 @@ def test_simulate_noise_with_terminal_measurements():
     assert result1 == result2
 
 
+@pytest.mark.parametrize('split', [True, False])
+@pytest.mark.parametrize(
+    'noise_gate', [cirq.depolarize(0.2), cirq.amplitude_damp(0.3), cirq.X ** 0.1]
+)
+def test_parallel_noise_matches_noise_per_qubit(noise_gate, split):
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=8, op_density=0.8, random_state=1)
+    expected, actual = [
+        cirq.DensityMatrixSimulator(
+            dtype=np.complex128,
+            noise=cirq.ConstantQubitNoiseModel(noise_gate, parallel=parallel),
+            split_untangled_states=split,
+        )
+        .simulate(circuit)
+        .final_density_matrix
+        for parallel in [False, True]
+    ]
+    np.testing.assert_allclose(actual, expected, atol=1e-8)
+
+
+def test_parallel_noise_on_qutrits():
+    a, b = cirq.LineQid.for_qid_shape((3, 3))
+    u = cirq.testing.random_unitary(9, random_state=1)
+    circuit = cirq.Circuit(PlusGate(3, 1)(a), cirq.MatrixGate(u, qid_shape=(3, 3)).on(a, b))
+    expected, actual = [
+        cirq.DensityMatrixSimulator(
+            dtype=np.complex128,
+            noise=cirq.ConstantQubitNoiseModel(PlusGate(3, 1), parallel=parallel),
+        )
+        .simulate(circuit)
+        .final_density_matrix
+        for parallel in [False, True]
+    ]
+    np.testing.assert_allclose(actual, expected, atol=1e-8)
+
+
 def test_simulate_noise_with_subcircuit_measurements():
     q = cirq.LineQubit(0)
     circuit1 = cirq.Circuit(cirq.measure(q))
@@ -1465,6 +1505,27 @@ def test_simulate_noise_with_subcircuit_measurements():
     assert result1 == result2
 
 
+def test_simulate_sweep_shares_channel_prefix():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.amplitude_damp(0.3).on(a),
+        cirq.CNOT(a, b),
+        cirq.Y(b) ** sympy.Symbol('t'),
+    )
+    params = cirq.Linspace('t', 0, 1, 4)
+    simulator = cirq.DensityMatrixSimulator()
+    with mock.patch.object(simulator, '_core_iterator', wraps=simulator._core_iterator) as mock_sim:
+        results = simulator.simulate_sweep(circuit, params)
+        assert mock_sim.call_count == 1 + 4
+    for result, resolver in zip(results, params):
+        np.testing.assert_allclose(
+            result.final_density_matrix,
+            simulator.simulate(circuit, resolver).final_density_matrix,
+            atol=1e-6,
+        )
+
+
 def test_nonmeasuring_subcircuits_do_not_cause_sweep_repeat():
     q = cirq.LineQubit(0)
     circuit = cirq.Circuit(
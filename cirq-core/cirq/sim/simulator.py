@@ -29,8 +29,11 @@ Simulator types include:
 
 import abc
 import collections
+import concurrent.futures
+import os
 from typing import (
     Any,
+    Deque,
     Dict,
     Iterator,
     List,
@@ -44,12 +47,14 @@ from typing import (
     Callable,
     TypeVar,
     Generic,
+    Iterable,
 )
 
 import numpy as np
 
 from cirq import circuits, ops, protocols, study, value, work
 from cirq.sim.act_on_args import ActOnArgs
+from cirq.sim.operation_target import OperationTarget
 
 if TYPE_CHECKING:
     import cirq
@@ -59,6 +64,7 @@ TStepResult = TypeVar('TStepResult', bound='StepResult')
 TSimulationTrialResult = TypeVar('TSimulationTrialResult', bound='SimulationTrialResult')
 TSimulatorState = TypeVar('TSimulatorState')
 TActOnArgs = TypeVar('TActOnArgs', bound=ActOnArgs)
+TSimulator = TypeVar('TSimulator')
 
 
 class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
@@ -72,8 +78,18 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
         program: 'cirq.AbstractCircuit',
         params: study.Sweepable,
         repetitions: int = 1,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
     ) -> List[study.Result]:
-        return list(self.run_sweep_iter(program, params, repetitions))
+        if executor is None and max_workers is None:
+            # Subclasses may override run_sweep_iter without the concurrency arguments.
+            return list(self.run_sweep_iter(program, params, repetitions))
+        return list(
+            self.run_sweep_iter(
+                program, params, repetitions, executor=executor, max_workers=max_workers
+            )
+        )
 
     # TODO(#3388) Add documentation for Raises.
     # pylint: disable=missing-raises-doc
@@ -82,6 +98,9 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
         program: 'cirq.AbstractCircuit',
         params: study.Sweepable,
         repetitions: int = 1,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
     ) -> Iterator[study.Result]:
         """Runs the supplied Circuit, mimicking quantum hardware.
 
@@ -92,6 +111,15 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
             program: The circuit to simulate.
             params: Parameters to run with the program.
             repetitions: The number of repetitions to simulate.
+            executor: If given, the parameter resolvers are simulated
+                concurrently on this executor, e.g. a
+                `concurrent.futures.ProcessPoolExecutor`. The simulator and
+                circuit must then be picklable for process pools.
+            max_workers: If given without `executor`, the parameter resolvers
+                are simulated concurrently on a thread pool with this many
+                threads. If given with `executor`, this bounds the number of
+                resolvers in flight, which defaults to twice the number of
+                CPUs. Results are yielded in order either way.
 
         Returns:
             Result list for this run; one for each possible parameter
@@ -102,18 +130,43 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
 
         _verify_unique_measurement_keys(program)
 
+        if executor is not None or max_workers is not None:
+            tasks = (
+                (self._sweep_point_simulator()._run_sweep_point, (program, r, repetitions))
+                for r in study.to_resolvers(params)
+            )
+            yield from _map_in_order(tasks, executor, max_workers)
+            return
+
         for param_resolver in study.to_resolvers(params):
-            measurements = {}
-            if repetitions == 0:
-                for _, op, _ in program.findall_operations_with_gate_type(ops.MeasurementGate):
-                    measurements[protocols.measurement_key_name(op)] = np.empty([0, 1])
-            else:
-                measurements = self._run(
-                    circuit=program, param_resolver=param_resolver, repetitions=repetitions
-                )
-            yield study.Result.from_single_parameter_set(
-                params=param_resolver, measurements=measurements
+            yield self._run_sweep_point(program, param_resolver, repetitions)
+
+    def _run_sweep_point(
+        self,
+        program: 'cirq.AbstractCircuit',
+        param_resolver: study.ParamResolver,
+        repetitions: int,
+    ) -> study.Result:
+        measurements = {}
+        if repetitions == 0:
+            for _, op, _ in program.findall_operations_with_gate_type(ops.MeasurementGate):
+                measurements[protocols.measurement_key_name(op)] = np.empty([0, 1])
+        else:
+            measurements = self._run(
+                circuit=program, param_resolver=param_resolver, repetitions=repetitions
             )
+        return study.Result.from_single_parameter_set(
+            params=param_resolver, measurements=measurements
+        )
+
+    def _sweep_point_simulator(self: TSimulator) -> TSimulator:
+        """Returns the simulator to use for one point of a concurrent sweep.
+
+        Simulators with random state should return a copy with its own
+        generator, seeded from theirs, so that concurrently simulated points
+        are independent and reproducible.
+        """
+        return self
 
     # pylint: enable=missing-raises-doc
     @abc.abstractmethod
@@ -508,12 +561,44 @@ class SimulatesIntermediateState(
     a state vector.
     """
 
+    def simulate_sweep(
+        self,
+        program: 'cirq.AbstractCircuit',
+        params: study.Sweepable,
+        qubit_order: ops.QubitOrderOrList = ops.QubitOrder.DEFAULT,
+        initial_state: Any = None,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[TSimulationTrialResult]:
+        """Wraps computed states in a list.
+
+        See `simulate_sweep_iter` for the arguments.
+        """
+        if executor is None and max_workers is None:
+            # Subclasses may override simulate_sweep_iter without the
+            # concurrency arguments.
+            return list(self.simulate_sweep_iter(program, params, qubit_order, initial_state))
+        return list(
+            self.simulate_sweep_iter(
+                program,
+                params,
+                qubit_order,
+                initial_state,
+                executor=executor,
+                max_workers=max_workers,
+            )
+        )
+
     def simulate_sweep_iter(
         self,
         program: 'cirq.AbstractCircuit',
         params: study.Sweepable,
         qubit_order: ops.QubitOrderOrList = ops.QubitOrder.DEFAULT,
         initial_state: Any = None,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
     ) -> Iterator[TSimulationTrialResult]:
         """Simulates the supplied Circuit.
 
@@ -531,25 +616,65 @@ class SimulatesIntermediateState(
                 either a raw state or an `OperationTarget`. The form of the
                 raw state depends on the simulation implementation. See
                 documentation of the implementing class for details.
+            executor: If given, the parameter resolvers are simulated
+                concurrently on this executor, e.g. a
+                `concurrent.futures.ProcessPoolExecutor`. The simulator,
+                circuit and initial state must then be picklable for process
+                pools, and an `OperationTarget` initial state is copied for
+                each resolver.
+            max_workers: If given without `executor`, the parameter resolvers
+                are simulated concurrently on a thread pool with this many
+                threads. If given with `executor`, this bounds the number of
+                resolvers in flight, which defaults to twice the number of
+                CPUs. Results are yielded in order either way.
 
         Returns:
             List of SimulationTrialResults for this run, one for each
             possible parameter resolver.
         """
         qubit_order = ops.QubitOrder.as_qubit_order(qubit_order)
-        for param_resolver in study.to_resolvers(params):
-            all_step_results = self.simulate_moment_steps(
-                program, param_resolver, qubit_order, initial_state
-            )
-            measurements = {}  # type: Dict[str, np.ndarray]
-            for step_result in all_step_results:
-                for k, v in step_result.measurements.items():
-                    measurements[k] = np.array(v, dtype=np.uint8)
-            yield self._create_simulator_trial_result(
-                params=param_resolver,
-                measurements=measurements,
-                final_step_result=step_result,
+        if executor is not None or max_workers is not None:
+            # Pass the qubits themselves, since qubit orders may not be picklable.
+            qubits = tuple(qubit_order.order_for(program.all_qubits()))
+            tasks = (
+                (
+                    self._sweep_point_simulator()._simulate_sweep_point,
+                    (
+                        program,
+                        param_resolver,
+                        qubits,
+                        initial_state.copy()
+                        if isinstance(initial_state, OperationTarget)
+                        else initial_state,
+                    ),
+                )
+                for param_resolver in study.to_resolvers(params)
             )
+            yield from _map_in_order(tasks, executor, max_workers)
+            return
+
+        for param_resolver in study.to_resolvers(params):
+            yield self._simulate_sweep_point(program, param_resolver, qubit_order, initial_state)
+
+    def _simulate_sweep_point(
+        self,
+        program: 'cirq.AbstractCircuit',
+        param_resolver: study.ParamResolver,
+        qubit_order: ops.QubitOrderOrList,
+        initial_state: Any,
+    ) -> TSimulationTrialResult:
+        all_step_results = self.simulate_moment_steps(
+            program, param_resolver, qubit_order, initial_state
+        )
+        measurements = {}  # type: Dict[str, np.ndarray]
+        for step_result in all_step_results:
+            for k, v in step_result.measurements.items():
+                measurements[k] = np.array(v, dtype=np.uint8)
+        return self._create_simulator_trial_result(
+            params=param_resolver,
+            measurements=measurements,
+            final_step_result=step_result,
+        )
 
     def simulate_moment_steps(
         self,
@@ -922,6 +1047,37 @@ def _verify_unique_measurement_keys(circuit: circuits.AbstractCircuit):
             raise ValueError(f"Measurement key {','.join(duplicates)} repeated")
 
 
+def _map_in_order(
+    tasks: Iterable[Tuple[Callable[..., Any], Tuple[Any, ...]]],
+    executor: Optional[concurrent.futures.Executor],
+    max_workers: Optional[int],
+) -> Iterator[Any]:
+    """Runs `(func, args)` tasks on an executor, yielding results in order.
+
+    At most `max_workers` tasks (twice the CPU count if not given) are in
+    flight at once, so long sweeps do not hold every result in memory. If no
+    executor is given, a thread pool with `max_workers` threads is used.
+    """
+    if executor is None:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            yield from _map_in_order(tasks, pool, max_workers)
+        return
+    window = max_workers if max_workers is not None else 2 * (os.cpu_count() or 1)
+    if window < 1:
+        raise ValueError(f'max_workers must be positive, got {max_workers}.')
+    pending: Deque[concurrent.futures.Future] = collections.deque()
+    try:
+        for func, args in tasks:
+            pending.append(executor.submit(func, *args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
 def check_all_resolved(circuit):
     """Raises if the circuit contains unresolved symbols."""
     if protocols.is_parameterized(circuit):
@@ -16,6 +16,9 @@
 
 import abc
 import collections
+import concurrent.futures
+import copy
+import itertools
 from typing import (
     Any,
     Dict,
@@ -43,6 +46,7 @@ from cirq.sim.simulator import (
     SimulatesIntermediateState,
     SimulatesSamples,
     StepResult,
+    _verify_unique_measurement_keys,
     check_all_resolved,
     split_into_matching_protocol_then_general,
 )
@@ -53,6 +57,9 @@ if TYPE_CHECKING:
 
 TStepResultBase = TypeVar('TStepResultBase', bound='StepResultBase')
 
+# The number of circuits whose noisy moments a simulator keeps.
+_NOISY_MOMENTS_CACHE_SIZE = 16
+
 
 class SimulatorBase(
     Generic[TStepResultBase, TSimulationTrialResult, TSimulatorState, TActOnArgs],
@@ -80,8 +87,11 @@ class SimulatorBase(
     result when possible. If not possible, due to noise or classical
     probabilities on a state vector, the implementation attempts to fully
     iterate the unitary prefix once, then only repeat the non-unitary
-    suffix from copies of the state obtained by the prefix. If more advanced
-    functionality is required, then the `_run` method can be overridden.
+    suffix from copies of the state obtained by the prefix. When the only
+    randomness left in the suffix comes from measurements, the suffix is
+    instead simulated once per distinct measurement outcome, forking the
+    state at each measurement. If more advanced functionality is required,
+    then the `_run` method can be overridden.
 
     Note that state here refers to simulator state, which is not necessarily
     a state vector. The included simulators and corresponding states are state
@@ -115,9 +125,18 @@ class SimulatorBase(
         self._dtype = dtype
         self._prng = value.parse_random_state(seed)
         self.noise = devices.NoiseModel.from_noise_model_like(noise)
+        self._noisy_moments_cache: Dict[
+            Tuple['cirq.Moment', ...],
+            Tuple['cirq.NoiseModel', List[Tuple['cirq.Operation', ...]]],
+        ] = {}
         self._ignore_measurement_results = ignore_measurement_results
         self._split_untangled_states = split_untangled_states
 
+    def _sweep_point_simulator(self):
+        sim = copy.copy(self)
+        sim._prng = np.random.RandomState(self._prng.randint(2 ** 32, dtype=np.int64))
+        return sim
+
     @abc.abstractmethod
     def _create_partial_act_on_args(
         self,
@@ -199,10 +218,9 @@ class SimulatorBase(
             yield self._create_step_result(sim_state)
             return
 
-        noisy_moments = self.noise.noisy_moments(circuit, sorted(circuit.all_qubits()))
         measured: Dict[Tuple['cirq.Qid', ...], bool] = collections.defaultdict(bool)
-        for moment in noisy_moments:
-            for op in ops.flatten_to_ops(moment):
+        for moment_ops in self._noisy_moments(circuit):
+            for op in moment_ops:
                 try:
                     # TODO: support more general measurements.
                     # Github issue: https://github.com/quantumlib/Cirq/issues/3566
@@ -227,6 +245,161 @@ class SimulatorBase(
             sim_state = step_result._sim_state
 
     # pylint: enable=missing-param-doc,missing-raises-doc
+    def _noisy_moments(
+        self, circuit: circuits.AbstractCircuit
+    ) -> List[Tuple['cirq.Operation', ...]]:
+        """Returns the operations of each moment of the circuit with noise added.
+
+        The noisy moments of static noise models (see `NoiseModel._is_static_`)
+        are computed once per circuit, keyed by its moments, and shared by all
+        repetitions, sweep points and runs that simulate the same circuit.
+        """
+        if self.noise is devices.NO_NOISE:
+            return [moment.operations for moment in circuit]
+        static = self.noise._is_static_()
+        if static:
+            key = tuple(circuit.moments)
+            noise, cached = self._noisy_moments_cache.get(key, (None, None))
+            if noise is self.noise and cached is not None:
+                return cached
+        noisy_moments = [
+            tuple(ops.flatten_to_ops(moment))
+            for moment in self.noise.noisy_moments(circuit, sorted(circuit.all_qubits()))
+        ]
+        if static:
+            # Dropping every entry at once, rather than the least recently used
+            # one, keeps the cache consistent when sweep points run on threads.
+            if len(self._noisy_moments_cache) >= _NOISY_MOMENTS_CACHE_SIZE:
+                self._noisy_moments_cache.clear()
+            self._noisy_moments_cache[key] = (self.noise, noisy_moments)
+        return noisy_moments
+
+    def _sweep_prefix_length(self, circuit: circuits.AbstractCircuit) -> int:
+        """Returns the number of leading moments that all sweep points share.
+
+        These moments contain no parameters and only operations that are
+        deterministic for the state representation (see
+        `_can_be_in_run_prefix`), so the state after them can be simulated
+        once and copied for every point of a sweep. With a noise model the
+        noise of a moment may depend on the rest of the circuit, so nothing is
+        shared.
+        """
+        if self.noise is not devices.NO_NOISE:
+            return 0
+        for i, moment in enumerate(circuit):
+            if any(
+                protocols.is_parameterized(op) or not self._can_be_in_run_prefix(op)
+                for op in moment
+            ):
+                return i
+        return len(circuit)
+
+    def _fork_sweep_prefix(
+        self,
+        prefix: circuits.AbstractCircuit,
+        qubits: Sequence['cirq.Qid'],
+        initial_state: Any,
+        resolvers: Iterator[study.ParamResolver],
+    ) -> Iterator[Tuple[study.ParamResolver, OperationTarget[TActOnArgs]]]:
+        """Simulates `prefix` once and yields a copy of the state per resolver.
+
+        The last resolver gets the simulated state itself rather than a copy.
+        """
+        sim_state = self._create_act_on_args(initial_state, qubits)
+        for step_result in self._core_iterator(prefix, sim_state):
+            sim_state = step_result._sim_state
+        param_resolver = next(resolvers, None)
+        while param_resolver is not None:
+            next_resolver = next(resolvers, None)
+            yield param_resolver, sim_state if next_resolver is None else sim_state.copy()
+            param_resolver = next_resolver
+
+    def run_sweep_iter(
+        self,
+        program: 'cirq.AbstractCircuit',
+        params: study.Sweepable,
+        repetitions: int = 1,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[study.Result]:
+        """See definition in `cirq.SimulatesSamples`.
+
+        Leading moments without parameters are simulated once and their state
+        is shared by all parameter resolvers of a serial sweep.
+        """
+        resolvers = iter(study.to_resolvers(params))
+        head = list(itertools.islice(resolvers, 2))
+        prefix_length = self._sweep_prefix_length(program) if len(head) > 1 else 0
+        if (
+            executor is not None
+            or max_workers is not None
+            or prefix_length == 0
+            or repetitions == 0
+            or self._ignore_measurement_results
+        ):
+            params = itertools.chain(head, resolvers)
+            yield from super().run_sweep_iter(
+                program, params, repetitions, executor=executor, max_workers=max_workers
+            )
+            return
+
+        if not program.has_measurements():
+            raise ValueError("Circuit has no measurements to sample.")
+        _verify_unique_measurement_keys(program)
+
+        suffix = program[prefix_length:]
+        qubits = tuple(sorted(program.all_qubits()))
+        for param_resolver, sim_state in self._fork_sweep_prefix(
+            program[:prefix_length], qubits, 0, itertools.chain(head, resolvers)
+        ):
+            resolved_suffix = protocols.resolve_parameters(suffix, param_resolver)
+            check_all_resolved(resolved_suffix)
+            measurements = self._run_from_state(resolved_suffix, sim_state, repetitions)
+            yield study.Result.from_single_parameter_set(
+                params=param_resolver, measurements=measurements
+            )
+
+    def simulate_sweep_iter(
+        self,
+        program: 'cirq.AbstractCircuit',
+        params: study.Sweepable,
+        qubit_order: 'cirq.QubitOrderOrList' = ops.QubitOrder.DEFAULT,
+        initial_state: Any = None,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[TSimulationTrialResult]:
+        """See definition in `cirq.SimulatesIntermediateState`.
+
+        Leading moments without parameters are simulated once and their state
+        is shared by all parameter resolvers of a serial sweep.
+        """
+        resolvers = iter(study.to_resolvers(params))
+        head = list(itertools.islice(resolvers, 2))
+        prefix_length = self._sweep_prefix_length(program) if len(head) > 1 else 0
+        if executor is not None or max_workers is not None or prefix_length == 0:
+            params = itertools.chain(head, resolvers)
+            yield from super().simulate_sweep_iter(
+                program,
+                params,
+                qubit_order,
+                initial_state,
+                executor=executor,
+                max_workers=max_workers,
+            )
+            return
+
+        suffix = program[prefix_length:]
+        qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(program.all_qubits())
+        for param_resolver, sim_state in self._fork_sweep_prefix(
+            program[:prefix_length],
+            qubits,
+            0 if initial_state is None else initial_state,
+            itertools.chain(head, resolvers),
+        ):
+            yield self._simulate_sweep_point(suffix, param_resolver, qubits, sim_state)
+
     def _run(
         self,
         circuit: circuits.AbstractCircuit,
@@ -242,7 +415,15 @@ class SimulatorBase(
         check_all_resolved(resolved_circuit)
         qubits = tuple(sorted(resolved_circuit.all_qubits()))
         act_on_args = self._create_act_on_args(0, qubits)
+        return self._run_from_state(resolved_circuit, act_on_args, repetitions)
 
+    def _run_from_state(
+        self,
+        resolved_circuit: circuits.AbstractCircuit,
+        act_on_args: OperationTarget[TActOnArgs],
+        repetitions: int,
+    ) -> Dict[str, np.ndarray]:
+        """Samples a resolved circuit starting from the given state."""
         prefix, general_suffix = (
             split_into_matching_protocol_then_general(resolved_circuit, self._can_be_in_run_prefix)
             if self._can_be_in_run_prefix(self.noise)
@@ -267,6 +448,13 @@ class SimulatorBase(
             measurement_ops = [cast(ops.GateOperation, op) for op in general_ops]
             return step_result.sample_measurement_ops(measurement_ops, repetitions, seed=self._prng)
 
+        suffix_ops = [op for moment_ops in self._noisy_moments(general_suffix) for op in moment_ops]
+        if all(
+            isinstance(op.gate, ops.MeasurementGate) or self._can_be_in_run_prefix(op)
+            for op in suffix_ops
+        ):
+            return self._run_branching(suffix_ops, act_on_args, repetitions)
+
         measurements: Dict[str, List[np.ndarray]] = {}
         for i in range(repetitions):
             all_step_results = self._core_iterator(
@@ -281,6 +469,111 @@ class SimulatorBase(
                 measurements[k].append(np.array(v, dtype=np.uint8))
         return {k: np.array(v) for k, v in measurements.items()}
 
+    def _run_branching(
+        self,
+        suffix_ops: List['cirq.Operation'],
+        act_on_args: OperationTarget[TActOnArgs],
+        repetitions: int,
+    ) -> Dict[str, np.ndarray]:
+        """Samples a suffix whose only randomness comes from measurements.
+
+        Rather than replaying the suffix once per repetition, the suffix is
+        simulated once per distinct measurement outcome. At each measurement
+        the outcomes of all shots that reached it are sampled at once, and the
+        state is only forked for the distinct outcomes that occurred. The
+        simulation cost therefore scales with the number of branches instead
+        of the number of repetitions.
+
+        Args:
+            suffix_ops: The operations to simulate, in order. Every operation
+                must either be a `cirq.MeasurementGate` operation or be
+                deterministic for this simulator's state representation.
+            act_on_args: The state after simulating the prefix.
+            repetitions: The number of shots to sample.
+
+        Returns:
+            The measurement results, keyed by measurement key.
+        """
+        measurements: Dict[str, List[np.ndarray]] = {}
+        pending = [(act_on_args, 0, repetitions)]
+        while pending:
+            sim_state, start, count = pending.pop()
+            for i in range(start, len(suffix_ops)):
+                op = suffix_ops[i]
+                if isinstance(op.gate, ops.MeasurementGate):
+                    for branch_state, branch_count in self._fork_on_measurement(
+                        op, sim_state, count
+                    ):
+                        pending.append((branch_state, i + 1, branch_count))
+                    break
+                try:
+                    protocols.act_on(op, sim_state)
+                except TypeError:
+                    raise TypeError(f"{self.__class__.__name__} doesn't support {op!r}")
+            else:
+                for k, v in sim_state.log_of_measurement_results.items():
+                    measurements.setdefault(k, []).append(
+                        np.tile(np.array(v, dtype=np.uint8), (count, 1))
+                    )
+
+        # Branches are collected in groups; shuffle so that shots are exchangeable.
+        permutation = self._prng.permutation(repetitions)
+        return {k: np.concatenate(v)[permutation] for k, v in measurements.items()}
+
+    def _fork_on_measurement(
+        self,
+        op: 'cirq.Operation',
+        sim_state: OperationTarget[TActOnArgs],
+        count: int,
+    ) -> List[Tuple[OperationTarget[TActOnArgs], int]]:
+        """Splits `count` shots at a measurement into per-outcome states.
+
+        The outcomes of all shots are sampled from the state together, and the
+        post-measurement state of each distinct outcome is obtained by
+        projecting a copy of the state onto that outcome. If the state cannot
+        be projected, a copy of it is measured for every shot instead, and the
+        outcomes of these independent measurements are the shots.
+        """
+        if count == 0:
+            return []
+        gate = cast(ops.MeasurementGate, op.gate)
+        key = gate.key
+        invert_mask = np.array(gate.full_invert_mask(), dtype=bool)
+        samples = sim_state.sample(list(op.qubits), count, seed=self._prng)
+        samples = samples ^ ((samples < 2) & invert_mask)
+        counts = collections.Counter(tuple(int(b) for b in row) for row in samples)
+
+        branches: List[Tuple[OperationTarget[TActOnArgs], int]] = []
+        for outcome, n in counts.items():
+            branch_state = sim_state.copy()
+            bits = np.array(outcome)
+            bits ^= (bits < 2) & invert_mask
+            if not _project_measurement(branch_state, op.qubits, bits):
+                return self._fork_on_independent_measurements(op, sim_state, count)
+            if key in branch_state.log_of_measurement_results:
+                raise ValueError(f"Measurement already logged to key {key!r}")
+            branch_state.log_of_measurement_results[key] = list(outcome)
+            branches.append((branch_state, n))
+        return branches
+
+    def _fork_on_independent_measurements(
+        self,
+        op: 'cirq.Operation',
+        sim_state: OperationTarget[TActOnArgs],
+        count: int,
+    ) -> List[Tuple[OperationTarget[TActOnArgs], int]]:
+        """Measures a copy of the state per shot, keeping one per outcome."""
+        key = cast(ops.MeasurementGate, op.gate).key
+        states: Dict[Tuple[int, ...], OperationTarget[TActOnArgs]] = {}
+        counts: Dict[Tuple[int, ...], int] = collections.Counter()
+        for _ in range(count):
+            branch_state = sim_state.copy()
+            protocols.act_on(op, branch_state)
+            outcome = tuple(int(b) for b in branch_state.log_of_measurement_results[key])
+            states.setdefault(outcome, branch_state)
+            counts[outcome] += 1
+        return [(states[outcome], n) for outcome, n in counts.items()]
+
     def _create_act_on_args(
         self,
         initial_state: Any,
@@ -318,6 +611,25 @@ class SimulatorBase(
             )
 
 
+def _project_measurement(
+    sim_state: OperationTarget, qubits: Sequence['cirq.Qid'], bits: Sequence[int]
+) -> bool:
+    """Projects the states holding `qubits` onto the measurement outcome `bits`.
+
+    Returns:
+        Whether all of the states could be projected.
+    """
+    groups: Dict['cirq.ActOnArgs', Tuple[List['cirq.Qid'], List[int]]] = {}
+    for q, bit in zip(qubits, bits):
+        group_qubits, group_bits = groups.setdefault(sim_state[q], ([], []))
+        group_qubits.append(q)
+        group_bits.append(bit)
+    return all(
+        args._project_measurement(group_qubits, group_bits)
+        for args, (group_qubits, group_bits) in groups.items()
+    )
+
+
 class StepResultBase(Generic[TSimulatorState, TActOnArgs], StepResult[TSimulatorState], abc.ABC):
     """A base class for step results."""
 
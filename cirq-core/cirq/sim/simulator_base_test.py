@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import math
+from unittest import mock
 from typing import List, Dict, Any, Sequence, Tuple, Union
 
 import numpy as np
@@ -55,7 +56,7 @@ class CountingActOnArgs(cirq.ActOnArgs):
         return True
 
     def sample(self, qubits, repetitions=1, seed=None):
-        pass
+        return np.full((repetitions, len(qubits)), self.gate_count)
 
 
 class SplittableCountingActOnArgs(CountingActOnArgs):
@@ -197,6 +198,45 @@ def test_noise_applied_measurement_gate():
     assert r._final_simulator_state.measurement_count == 1
 
 
+class CountingNoiseModel(cirq.NoiseModel):
+    def __init__(self, static):
+        self.static = static
+        self.calls = 0
+
+    def noisy_moment(self, moment, system_qubits):
+        self.calls += 1
+        return [moment, cirq.Moment(cirq.X(q).with_tags(cirq.VirtualTag()) for q in system_qubits)]
+
+    def _is_static_(self):
+        return self.static
+
+
+def test_noisy_moments_of_static_noise_are_cached():
+    circuit = cirq.Circuit(cirq.phase_damp(1).on(q0), cirq.measure(q0))
+    noise = CountingNoiseModel(static=True)
+    sim = CountingSimulator(noise=noise)
+    r = sim.run(circuit, repetitions=3)
+    assert np.allclose(r.measurements['0'], [[2], [2], [2]])
+    assert noise.calls == 2
+    sim.run(circuit.copy(), repetitions=3)
+    sim.simulate(circuit)
+    assert noise.calls == 2
+    # Changing the circuit changes its noisy moments.
+    circuit.append(cirq.X(q1))
+    sim.run(circuit, repetitions=1)
+    assert noise.calls == 4
+
+    # So does changing the noise model.
+    sim.noise = CountingNoiseModel(static=True)
+    sim.run(circuit, repetitions=1)
+    assert sim.noise.calls == 2
+
+    noise = CountingNoiseModel(static=False)
+    sim = CountingSimulator(noise=noise)
+    sim.run(circuit, repetitions=3)
+    assert noise.calls == 8
+
+
 def test_cannot_act():
     class BadOp(TestOp):
         def _act_on_(self, args):
@@ -356,3 +396,39 @@ def test_measurements_retained_in_step_results():
     assert next(iterator).measurements.keys() == {'a', 'b'}
     assert next(iterator).measurements.keys() == {'a', 'b', 'c'}
     assert not any(iterator)
+
+
+def _assert_non_terminal_measurement_outcomes_binomial(simulator):
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(
+        cirq.ry(2 * np.arcsin(np.sqrt(0.3)))(q),
+        cirq.measure(q, key='a'),
+        cirq.X(q),
+        cirq.measure(q, key='b'),
+    )
+    num_runs = 1000
+    ones_per_run = np.zeros(4)
+    for _ in range(num_runs):
+        result = simulator.run(circuit, repetitions=3)
+        np.testing.assert_equal(result.measurements['a'], 1 - result.measurements['b'])
+        ones_per_run[np.sum(result.measurements['a'])] += 1
+    # The shots are independent, so the number of them measuring 1 is binomial.
+    expected = [math.comb(3, k) * 0.3 ** k * 0.7 ** (3 - k) for k in range(4)]
+    np.testing.assert_allclose(ones_per_run / num_runs, expected, atol=0.05)
+
+
+@pytest.mark.parametrize(
+    'simulator',
+    [
+        cirq.Simulator(seed=1234),
+        cirq.Simulator(seed=1234, split_untangled_states=False),
+        cirq.DensityMatrixSimulator(seed=1234),
+    ],
+)
+def test_run_non_terminal_measurement_outcome_distribution(simulator):
+    _assert_non_terminal_measurement_outcomes_binomial(simulator)
+
+
+def test_run_non_terminal_measurement_outcome_distribution_without_projection():
+    with mock.patch.object(cirq.ActOnStateVectorArgs, '_project_measurement', return_value=False):
+        _assert_non_terminal_measurement_outcomes_binomial(cirq.Simulator(seed=1234))
@@ -19,6 +19,7 @@ from unittest import mock
 import duet
 import numpy as np
 import pytest
+import sympy
 
 import cirq
 from cirq import study
@@ -563,3 +564,28 @@ def test_trial_result_initializer():
         _ = SimulationTrialResult(cirq.ParamResolver(), {}, None, None)
     with pytest.raises(ValueError, match='Exactly one of'):
         _ = SimulationTrialResult(cirq.ParamResolver(), {}, object(), mock.Mock(TStepResult))
+
+
+def test_sweep_iter_overrides_without_concurrency_arguments():
+    class LegacySimulator(cirq.Simulator):
+        """Overrides the sweep iterators with their signatures from before executors."""
+
+        def run_sweep_iter(self, program, params, repetitions=1):
+            yield from super().run_sweep_iter(program, params, repetitions)
+
+        def simulate_sweep_iter(
+            self, program, params, qubit_order=cirq.QubitOrder.DEFAULT, initial_state=None
+        ):
+            yield from super().simulate_sweep_iter(program, params, qubit_order, initial_state)
+
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'), cirq.measure(q, key='m'))
+    params = cirq.Points('t', [0, 1])
+    simulator = LegacySimulator()
+    results = simulator.run_sweep(circuit, params, repetitions=3)
+    assert [r.measurements['m'][:, 0].tolist() for r in results] == [[0, 0, 0], [1, 1, 1]]
+    trial_results = simulator.simulate_sweep(circuit[:-1], params)
+    np.testing.assert_allclose(trial_results[1].final_state_vector, [0, 1], atol=1e-7)
+    # The concurrency arguments are only passed on when given.
+    with pytest.raises(TypeError, match='executor'):
+        _ = simulator.run_sweep(circuit, params, max_workers=2)
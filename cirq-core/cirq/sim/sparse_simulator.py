@@ -19,6 +19,8 @@ from typing import (
     Dict,
     Iterator,
     List,
+    Set,
+    Tuple,
     Type,
     TYPE_CHECKING,
     Union,
@@ -28,7 +30,7 @@ from typing import (
 
 import numpy as np
 
-from cirq import ops, protocols, qis
+from cirq import circuits, devices, ops, protocols, qis
 from cirq.sim import (
     simulator,
     state_vector,
@@ -148,25 +150,60 @@ class Simulator(
         noise: 'cirq.NOISE_MODEL_LIKE' = None,
         seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
         split_untangled_states: bool = True,
+        max_fused_qubits: Optional[int] = None,
+        num_threads: int = 1,
+        memmap_dir: Optional[str] = None,
     ):
         """A sparse matrix simulator.
 
         Args:
             dtype: The `numpy.dtype` used by the simulation. One of
-                `numpy.complex64` or `numpy.complex128`.
+                `numpy.complex64` or `numpy.complex128`. The state is kept in
+                this dtype throughout; if an operation's `_apply_unitary_`
+                returns a state of another dtype, it is cast back with a
+                `RuntimeWarning`.
             noise: A noise model to apply while simulating.
             seed: The random seed to use for this simulator.
             split_untangled_states: If True, optimizes simulation by running
                 unentangled qubit sets independently and merging those states
                 at the end.
+            max_fused_qubits: If set, consecutive unitary operations acting on
+                at most this many qubits in total are fused into a single dense
+                matrix gate before simulation, so that each fused group costs
+                one pass over the state vector instead of one per operation.
+                Fusion may merge operations across moments, in which case the
+                steps yielded by `simulate_moment_steps` correspond to moments
+                of the fused circuit. Fusion is skipped when a noise model is
+                given, since noise is applied moment by moment.
+            num_threads: The number of threads used to apply unitaries to large
+                state vectors, by processing independent slices of the state
+                concurrently.
+            memmap_dir: If set, the state vector and its workspace are stored
+                in temporary memory-mapped files in this directory instead of
+                in memory, so that states larger than the available memory can
+                be simulated. Untangled states are then never split. When no
+                noise model is given, runs of unitary operations that only act
+                on the last qubits of the state are grouped and applied one
+                contiguous block of the file at a time, so that each group
+                costs a single sequential pass over the file. Steps yielded by
+                `simulate_moment_steps` then correspond to moments of the
+                scheduled circuit. Note that measurements and sampling still
+                compute outcome probabilities in memory.
         """
         if np.dtype(dtype).kind != 'c':
             raise ValueError(f'dtype must be a complex type but was {dtype}')
+        if max_fused_qubits is not None and max_fused_qubits < 1:
+            raise ValueError(f'max_fused_qubits must be positive but was {max_fused_qubits}')
+        if num_threads < 1:
+            raise ValueError(f'num_threads must be positive but was {num_threads}')
+        self._max_fused_qubits = max_fused_qubits
+        self._num_threads = num_threads
+        self._memmap_dir = memmap_dir
         super().__init__(
             dtype=dtype,
             noise=noise,
             seed=seed,
-            split_untangled_states=split_untangled_states,
+            split_untangled_states=split_untangled_states and memmap_dir is None,
         )
 
     # pylint: enable=missing-raises-doc
@@ -194,19 +231,63 @@ class Simulator(
             return initial_state
 
         qid_shape = protocols.qid_shape(qubits)
-        state = qis.to_valid_state_vector(
-            initial_state, len(qubits), qid_shape=qid_shape, dtype=self._dtype
-        )
+        if self._memmap_dir is not None and qid_shape:
+            target_tensor, available_buffer = self._create_memmap_tensors(initial_state, qid_shape)
+        else:
+            state = qis.to_valid_state_vector(
+                initial_state, len(qubits), qid_shape=qid_shape, dtype=self._dtype
+            )
+            target_tensor = np.reshape(state, qid_shape)
+            available_buffer = np.empty(qid_shape, dtype=self._dtype)
 
         return act_on_state_vector_args.ActOnStateVectorArgs(
-            target_tensor=np.reshape(state, qid_shape),
-            available_buffer=np.empty(qid_shape, dtype=self._dtype),
+            target_tensor=target_tensor,
+            available_buffer=available_buffer,
             qubits=qubits,
             prng=self._prng,
             log_of_measurement_results=logs,
+            num_threads=self._num_threads,
+        )
+
+    def _create_memmap_tensors(
+        self, initial_state: 'cirq.STATE_VECTOR_LIKE', qid_shape: Tuple[int, ...]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        target_tensor = act_on_state_vector_args._empty_memmap(
+            qid_shape, self._dtype, self._memmap_dir
+        )
+        if isinstance(initial_state, (int, np.integer)):
+            # The new file is zeroed, so only the one amplitude needs writing.
+            target_tensor[np.unravel_index(initial_state, qid_shape)] = 1
+        else:
+            state = qis.to_valid_state_vector(
+                initial_state, len(qid_shape), qid_shape=qid_shape, dtype=self._dtype
+            )
+            np.copyto(target_tensor, np.reshape(state, qid_shape))
+        available_buffer = act_on_state_vector_args._empty_memmap(
+            qid_shape, self._dtype, self._memmap_dir
         )
+        return target_tensor, available_buffer
 
     # pylint: enable=missing-param-doc
+    def _core_iterator(
+        self,
+        circuit: 'cirq.AbstractCircuit',
+        sim_state: 'cirq.OperationTarget[cirq.ActOnStateVectorArgs]',
+        all_measurements_are_terminal: bool = False,
+    ) -> Iterator['SparseSimulatorStep']:
+        if self._max_fused_qubits is not None and self.noise == devices.NO_NOISE:
+            circuit = _fuse_unitary_operations(circuit, self._max_fused_qubits)
+        if (
+            isinstance(sim_state, act_on_state_vector_args.ActOnStateVectorArgs)
+            and isinstance(sim_state.target_tensor, np.memmap)
+            and len(sim_state.qubits) > _MEMMAP_BLOCK_QUBITS
+            and self.noise == devices.NO_NOISE
+        ):
+            circuit = _schedule_blocked_operations(
+                circuit, sim_state.qubits[-_MEMMAP_BLOCK_QUBITS:]
+            )
+        return super()._core_iterator(circuit, sim_state, all_measurements_are_terminal)
+
     def _create_step_result(
         self,
         sim_state: 'cirq.OperationTarget[cirq.ActOnStateVectorArgs]',
@@ -332,3 +413,187 @@ class SparseSimulatorStep(
                 array this is the full state vector.
         """
         self._sim_state = self._simulator._create_act_on_args(state, self._qubits)
+
+
+class _FusedBlock:
+    """A group of consecutive operations to be applied as one unitary."""
+
+    def __init__(self, op: 'cirq.Operation', fusible: bool):
+        self.ops = [op]
+        self.qubits = set(op.qubits)
+        self.fusible = fusible
+
+    def to_operation(self) -> 'cirq.Operation':
+        if len(self.ops) == 1:
+            return self.ops[0]
+        qubits = sorted(self.qubits)
+        unitary = circuits.Circuit(self.ops).unitary(
+            qubit_order=qubits, qubits_that_should_be_present=qubits
+        )
+        return ops.MatrixGate(unitary, qid_shape=protocols.qid_shape(qubits)).on(*qubits)
+
+
+def _fuse_unitary_operations(
+    circuit: 'cirq.AbstractCircuit', max_fused_qubits: int
+) -> 'cirq.Circuit':
+    """Greedily fuses consecutive unitary operations on small qubit sets.
+
+    Operations are visited in circuit order. A unitary operation is merged
+    with the most recent groups on its qubits when none of those groups has
+    been followed by another operation on its qubits and the merged group acts
+    on at most `max_fused_qubits` qubits. Since such groups commute with
+    everything emitted after them, the merged group can be placed last without
+    changing the circuit's action. Groups of more than one operation become a
+    single `cirq.MatrixGate`; everything else is passed through unchanged.
+    """
+    blocks: List[Optional[_FusedBlock]] = []
+    positions: Dict[int, int] = {}
+    latest: Dict['cirq.Qid', _FusedBlock] = {}
+
+    def emit(block: _FusedBlock):
+        positions[id(block)] = len(blocks)
+        blocks.append(block)
+        for q in block.qubits:
+            latest[q] = block
+
+    for op in circuit.all_operations():
+        fusible = (
+            0 < len(op.qubits) <= max_fused_qubits
+            and not protocols.is_measurement(op)
+            and protocols.has_unitary(op)
+        )
+        if not fusible:
+            emit(_FusedBlock(op, fusible=False))
+            continue
+
+        candidates = list({id(latest[q]): latest[q] for q in op.qubits if q in latest}.values())
+        qubits = set(op.qubits).union(*(b.qubits for b in candidates))
+        if (
+            candidates
+            and len(qubits) <= max_fused_qubits
+            and all(b.fusible and all(latest[q] is b for q in b.qubits) for b in candidates)
+        ):
+            merged = _FusedBlock(op, fusible=True)
+            merged.ops = [o for b in candidates for o in b.ops] + [op]
+            merged.qubits = qubits
+            for b in candidates:
+                blocks[positions.pop(id(b))] = None
+            emit(merged)
+        else:
+            emit(_FusedBlock(op, fusible=True))
+
+    return circuits.Circuit(b.to_operation() for b in blocks if b is not None)
+
+
+# The number of trailing qubits spanned by one block of a memory-mapped state.
+# Blocks are processed in memory, together with a workspace of the same size.
+_MEMMAP_BLOCK_QUBITS = 24
+
+
+class _BlockedOperations(ops.Operation):
+    """Unitary operations on trailing qubits, applied to one block at a time.
+
+    The leading axes of the state, i.e. those of the qubits not acted on, are
+    fixed to each of their values in turn. Each such block of the state is
+    contiguous; it is read into memory, has all of the operations applied to
+    it and is written back.
+    """
+
+    def __init__(self, operations: Sequence['cirq.Operation'], block_qubits: Sequence['cirq.Qid']):
+        self._operations = tuple(operations)
+        self._block_qubits = tuple(block_qubits)
+
+    @property
+    def qubits(self) -> Tuple['cirq.Qid', ...]:
+        qubits = {q for op in self._operations for q in op.qubits}
+        return tuple(q for q in self._block_qubits if q in qubits)
+
+    def with_qubits(self, *new_qubits: 'cirq.Qid') -> 'cirq.Operation':
+        if len(new_qubits) != len(self.qubits):
+            raise ValueError(f'Expected {len(self.qubits)} qubits, got {len(new_qubits)}.')
+        qubit_map = dict(zip(self.qubits, new_qubits))
+        return _BlockedOperations(
+            [op.transform_qubits(qubit_map) for op in self._operations],
+            [qubit_map.get(q, q) for q in self._block_qubits],
+        )
+
+    def _has_unitary_(self) -> bool:
+        return True
+
+    def _decompose_(self) -> Sequence['cirq.Operation']:
+        return self._operations
+
+    def _act_on_(self, args: 'cirq.ActOnArgs') -> bool:
+        if not isinstance(args, act_on_state_vector_args.ActOnStateVectorArgs):
+            return NotImplemented
+        num_blocks = len(args.qubits) - len(self._block_qubits)
+        if tuple(args.qubits[num_blocks:]) != self._block_qubits:
+            return NotImplemented
+        shape = args.target_tensor.shape
+        block_target = np.empty(shape[num_blocks:], dtype=args.target_tensor.dtype)
+        block_args = act_on_state_vector_args.ActOnStateVectorArgs(
+            target_tensor=block_target,
+            available_buffer=np.empty_like(block_target),
+            prng=args.prng,
+            log_of_measurement_results=args.log_of_measurement_results,
+            qubits=self._block_qubits,
+            num_threads=args.num_threads,
+        )
+        for index in np.ndindex(*shape[:num_blocks]):
+            np.copyto(block_args.target_tensor, args.target_tensor[index])
+            for op in self._operations:
+                protocols.act_on(op, block_args)
+            np.copyto(args.target_tensor[index], block_args.target_tensor)
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f'cirq.sim.sparse_simulator._BlockedOperations('
+            f'{self._operations!r}, {self._block_qubits!r})'
+        )
+
+
+def _schedule_blocked_operations(
+    circuit: 'cirq.AbstractCircuit', block_qubits: Sequence['cirq.Qid']
+) -> 'cirq.Circuit':
+    """Groups unitary operations on `block_qubits` into `_BlockedOperations`.
+
+    Operations are visited in circuit order. Unitary operations acting only on
+    `block_qubits` are collected into the current group, while other operations
+    are deferred until the group is emitted. An operation may join the group
+    when it shares no qubits with the deferred operations, since it then
+    commutes with all of them. Otherwise the group and the deferred operations
+    are emitted, and a new group is started.
+    """
+    local = set(block_qubits)
+    scheduled: List['cirq.Operation'] = []
+    group: List['cirq.Operation'] = []
+    deferred: List['cirq.Operation'] = []
+    deferred_qubits: Set['cirq.Qid'] = set()
+
+    def flush():
+        if len(group) > 1:
+            scheduled.append(_BlockedOperations(group, block_qubits))
+        else:
+            scheduled.extend(group)
+        scheduled.extend(deferred)
+        group.clear()
+        deferred.clear()
+        deferred_qubits.clear()
+
+    for op in circuit.all_operations():
+        if (
+            op.qubits
+            and local.issuperset(op.qubits)
+            and not protocols.is_measurement(op)
+            and protocols.has_unitary(op)
+        ):
+            if not deferred_qubits.isdisjoint(op.qubits):
+                flush()
+            group.append(op)
+        else:
+            deferred.append(op)
+            deferred_qubits.update(op.qubits)
+    flush()
+
+    return circuits.Circuit(scheduled)
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
 import itertools
 import random
 from typing import Type
@@ -152,8 +153,9 @@ def test_run_invert_mask_measure_not_terminal(dtype: Type[np.number], split: boo
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'m': [[1 - b0, b1]] * 3})
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # The suffix after the measurements is simulated once per outcome branch
+        # rather than once per repetition, so only the prefix is iterated.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -173,8 +175,9 @@ def test_run_partial_invert_mask_measure_not_terminal(dtype: Type[np.number], sp
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'m': [[1 - b0, b1]] * 3})
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # The suffix after the measurements is simulated once per outcome branch
+        # rather than once per repetition, so only the prefix is iterated.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -220,8 +223,9 @@ def test_run_repetitions_measurement_not_terminal(dtype: Type[np.number], split:
                 result = simulator.run(circuit, repetitions=3)
                 np.testing.assert_equal(result.measurements, {'0': [[b0]] * 3, '1': [[b1]] * 3})
                 assert result.repetitions == 3
-        # We expect repeated calls per b0,b1 instead of one call.
-        assert mock_sim.call_count > 4
+        # The suffix after the measurements is simulated once per outcome branch
+        # rather than once per repetition, so only the prefix is iterated.
+        assert mock_sim.call_count == 4
 
 
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
@@ -314,6 +318,121 @@ def test_run_sweeps_param_resolvers(dtype: Type[np.number], split: bool):
             assert results[1].params == params[1]
 
 
+@pytest.mark.parametrize(
+    'use_executor, max_workers', [(False, 1), (False, 3), (True, None), (True, 1)]
+)
+def test_sweeps_on_executor_match_serial(use_executor, max_workers):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        executor_kwargs = {
+            'executor': executor if use_executor else None,
+            'max_workers': max_workers,
+        }
+        _assert_sweeps_match_serial(executor_kwargs)
+
+
+def _assert_sweeps_match_serial(executor_kwargs):
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.X(q0) ** sympy.Symbol('a'),
+        cirq.CNOT(q0, q1),
+        cirq.Y(q1) ** sympy.Symbol('b'),
+        cirq.measure(q0, q1, key='m'),
+    )
+    params = cirq.Points('a', [0, 1]) * cirq.Points('b', [0, 1])
+    simulator = cirq.Simulator()
+
+    results = simulator.run_sweep(circuit, params, repetitions=4, **executor_kwargs)
+    assert results == simulator.run_sweep(circuit, params, repetitions=4)
+
+    params = cirq.Linspace('a', 0, 1, 5) * cirq.Linspace('b', 0, 1, 3)
+
+    unmeasured = circuit[:-1]
+    trial_results = simulator.simulate_sweep(unmeasured, params, **executor_kwargs)
+    assert [r.params for r in trial_results] == list(cirq.to_resolvers(params))
+    for actual, expected in zip(trial_results, simulator.simulate_sweep(unmeasured, params)):
+        np.testing.assert_allclose(actual.final_state_vector, expected.final_state_vector)
+
+
+def test_sweeps_on_executor_are_seeded_per_point():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.H(q), cirq.measure(q, key='m'))
+    params = [{}] * 4
+
+    def measurements(**kwargs):
+        results = cirq.Simulator(seed=1234).run_sweep(circuit, params, repetitions=32, **kwargs)
+        return [tuple(r.measurements['m'][:, 0]) for r in results]
+
+    samples = measurements(max_workers=2)
+    assert samples == measurements(max_workers=4)
+    assert len(set(samples)) == 4
+
+
+def test_simulate_sweep_on_executor_copies_operation_target():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q) ** sympy.Symbol('t'))
+    simulator = cirq.Simulator(split_untangled_states=False)
+    args = simulator._create_act_on_args(0, [q])
+    results = simulator.simulate_sweep(
+        circuit, cirq.Points('t', [1, 1]), initial_state=args, max_workers=2
+    )
+    for result in results:
+        np.testing.assert_allclose(result.final_state_vector, [0, 1])
+    np.testing.assert_allclose(args.target_tensor, [1, 0])
+
+
+def test_sweeps_share_unparameterized_prefix():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.T(b),
+        cirq.X(a) ** sympy.Symbol('t'),
+        cirq.H(b),
+        cirq.measure(a, b, key='m'),
+    )
+    params = cirq.Linspace('t', 0, 1, 5)
+    simulator = cirq.Simulator(seed=1234)
+    with mock.patch.object(simulator, '_core_iterator', wraps=simulator._core_iterator) as mock_sim:
+        results = simulator.run_sweep(circuit, params, repetitions=20)
+        # One call for the shared prefix, then a unitary part and the
+        # measurements per resolver.
+        assert mock_sim.call_count == 1 + 5 * 2
+    reference = cirq.Simulator(seed=1234)
+    assert results == [reference.run(circuit, r, repetitions=20) for r in params]
+
+    unmeasured = circuit[:-1]
+    with mock.patch.object(simulator, '_core_iterator', wraps=simulator._core_iterator) as mock_sim:
+        trial_results = simulator.simulate_sweep(unmeasured, params, initial_state=1)
+        assert mock_sim.call_count == 6
+    for trial_result, resolver in zip(trial_results, params):
+        assert trial_result.params == resolver
+        np.testing.assert_allclose(
+            trial_result.final_state_vector,
+            simulator.simulate(unmeasured, resolver, initial_state=1).final_state_vector,
+            atol=1e-6,
+        )
+
+
+def test_sweeps_do_not_share_prefix_with_noise():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.H(q), cirq.X(q) ** sympy.Symbol('t'), cirq.measure(q))
+    simulator = cirq.Simulator(noise=cirq.depolarize(0.1))
+    with mock.patch.object(simulator, '_core_iterator', wraps=simulator._core_iterator) as mock_sim:
+        simulator.run_sweep(circuit, cirq.Linspace('t', 0, 1, 3))
+        assert mock_sim.call_count == 3 * 2
+    with mock.patch.object(simulator, '_core_iterator', wraps=simulator._core_iterator) as mock_sim:
+        simulator.simulate_sweep(circuit[:-1], cirq.Linspace('t', 0, 1, 3))
+        assert mock_sim.call_count == 3
+
+
+def test_sweeps_on_executor_invalid_max_workers():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q))
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        with pytest.raises(ValueError, match='max_workers'):
+            cirq.Simulator().run_sweep(circuit, {}, executor=executor, max_workers=0)
+
+
 @pytest.mark.parametrize('dtype', [np.complex64, np.complex128])
 @pytest.mark.parametrize('split', [True, False])
 def test_simulate_random_unitary(dtype: Type[np.number], split: bool):
@@ -1056,9 +1175,11 @@ def test_random_seed_non_terminal_measurements_deterministic():
     assert np.all(
         result.measurements['a']
         == [
-            [0],
             [0],
             [1],
+            [1],
+            [1],
+            [1],
             [0],
             [1],
             [0],
@@ -1069,62 +1190,93 @@ def test_random_seed_non_terminal_measurements_deterministic():
             [0],
             [0],
             [1],
-            [0],
-            [0],
             [1],
             [1],
             [1],
             [0],
+            [1],
+            [1],
+            [1],
+            [1],
             [0],
             [0],
             [0],
-            [1],
-            [0],
             [0],
             [0],
             [1],
             [1],
-            [1],
-            [1],
         ]
     )
     assert np.all(
         result.measurements['b']
         == [
-            [1],
             [1],
             [0],
             [1],
             [1],
-            [1],
+            [0],
             [1],
             [1],
             [0],
+            [0],
             [1],
             [1],
-            [0],
             [1],
             [1],
+            [0],
             [1],
             [0],
             [0],
             [1],
             [1],
-            [1],
+            [0],
+            [0],
             [0],
             [1],
             [1],
+            [0],
             [1],
             [1],
             [1],
-            [0],
-            [1],
             [1],
             [1],
         ]
     )
 
 
+def test_run_non_terminal_measurements_branch_statistics():
+    q = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(q[0]),
+        cirq.CNOT(q[0], q[1]),
+        cirq.measure(q[0], key='a'),
+        cirq.H(q[0]),
+        cirq.X(q[2]) ** 0.5,
+        cirq.measure(*q, key='b'),
+    )
+    result = cirq.Simulator(seed=1234).run(circuit, repetitions=2000)
+    a = result.measurements['a']
+    b = result.measurements['b']
+    assert a.shape == (2000, 1)
+    assert b.shape == (2000, 3)
+    assert np.all(a[:, 0] == b[:, 1])
+    for column in [a[:, 0], b[:, 0], b[:, 2]]:
+        assert 0.45 < np.mean(column) < 0.55
+
+
+def test_run_non_terminal_measurements_many_outcomes():
+    q = cirq.LineQubit.range(6)
+    circuit = cirq.Circuit(
+        cirq.H.on_each(*q),
+        cirq.measure(*q, key='a'),
+        cirq.I.on_each(*q),
+        cirq.measure(*q, key='b'),
+    )
+    result = cirq.Simulator(seed=1234).run(circuit, repetitions=20)
+    np.testing.assert_equal(result.measurements['a'], result.measurements['b'])
+    assert len({tuple(row) for row in result.measurements['a']}) > 1
+
+
 def test_random_seed_mixture_deterministic():
     a = cirq.NamedQubit('a')
     circuit = cirq.Circuit(
@@ -1332,3 +1484,219 @@ def test_noise_model():
     result = simulator.run(circuit, repetitions=100)
 
     assert 40 <= sum(result.measurements['0'])[0] < 60
+
+
+@pytest.mark.parametrize('noise_gate', [cirq.depolarize(0.2), cirq.amplitude_damp(0.3)])
+def test_parallel_noise_matches_noise_per_qubit(noise_gate):
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=8, op_density=0.8, random_state=1)
+    circuit.append(cirq.measure(*qubits, key='m'))
+    results = [
+        cirq.Simulator(
+            dtype=np.complex128,
+            noise=cirq.ConstantQubitNoiseModel(noise_gate, parallel=parallel),
+            seed=1234,
+            split_untangled_states=False,
+        ).run(circuit, repetitions=20)
+        for parallel in [False, True]
+    ]
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize('split', [True, False])
+def test_parallel_unitary_noise_matches_noise_per_qubit(split):
+    qubits = cirq.LineQubit.range(4)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=8, op_density=0.8, random_state=1)
+    expected, actual = [
+        cirq.Simulator(
+            dtype=np.complex128,
+            noise=cirq.ConstantQubitNoiseModel(cirq.X ** 0.1, parallel=parallel),
+            split_untangled_states=split,
+        )
+        .simulate(circuit)
+        .final_state_vector
+        for parallel in [False, True]
+    ]
+    np.testing.assert_allclose(actual, expected, atol=1e-8)
+
+
+def test_parallel_noise_on_split_states():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(cirq.X(a), cirq.CNOT(a, b), cirq.measure(a, b, c, key='m'))
+    simulator = cirq.Simulator(noise=cirq.ConstantQubitNoiseModel(cirq.X, parallel=True))
+    assert simulator.run(circuit).measurements['m'].tolist() == [[1, 0, 0]]
+    simulator = cirq.Simulator(
+        noise=cirq.ConstantQubitNoiseModel(cirq.bit_flip(1), parallel=True), seed=1234
+    )
+    assert simulator.run(circuit).measurements['m'].tolist() == [[1, 0, 0]]
+
+
+@pytest.mark.parametrize('max_fused_qubits', [1, 2, 3, 4])
+def test_fused_simulation_matches_unfused(max_fused_qubits):
+    qubits = cirq.LineQubit.range(5)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=15, op_density=0.8, random_state=1234)
+    expected = cirq.Simulator(dtype=np.complex128).simulate(circuit).final_state_vector
+    actual = (
+        cirq.Simulator(dtype=np.complex128, max_fused_qubits=max_fused_qubits)
+        .simulate(circuit)
+        .final_state_vector
+    )
+    np.testing.assert_allclose(actual, expected, atol=1e-8)
+
+
+def test_fused_simulation_with_measurements():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.measure(b, key='b'),
+        cirq.H(b),
+        cirq.CNOT(b, c),
+        cirq.measure(a, c, key='ac'),
+    )
+    result = cirq.Simulator(seed=1234, max_fused_qubits=2).run(circuit, repetitions=100)
+    assert np.all(result.measurements['b'][:, 0] == result.measurements['ac'][:, 0])
+
+
+def test_fuse_unitary_operations():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.T(a),
+        cirq.CZ(a, b),
+        cirq.X(c),
+        cirq.measure(b),
+        cirq.H(a),
+        cirq.CCZ(a, b, c),
+    )
+    fused = cirq.sim.sparse_simulator._fuse_unitary_operations(circuit, 2)
+    ops = list(fused.all_operations())
+    # H, T and CZ are fused; X stays alone; the measurement closes the fused
+    # group on b, and the three-qubit gate is too wide.
+    assert len(ops) == 5
+    fused_ops = [op for op in ops if isinstance(op.gate, cirq.MatrixGate)]
+    assert len(fused_ops) == 1
+    assert fused_ops[0].qubits == (a, b)
+    np.testing.assert_allclose(
+        cirq.unitary(fused_ops[0]),
+        cirq.unitary(cirq.Circuit(cirq.H(a), cirq.T(a), cirq.CZ(a, b))),
+        atol=1e-8,
+    )
+    assert ops[2:] == [cirq.measure(b), cirq.H(a), cirq.CCZ(a, b, c)]
+
+
+def test_fusion_skipped_with_noise():
+    a = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.H(a), cirq.H(a), cirq.measure(a, key='a'))
+    simulator = cirq.Simulator(noise=cirq.bit_flip(1), max_fused_qubits=2)
+    result = simulator.run(circuit, repetitions=10)
+    np.testing.assert_equal(result.measurements['a'], [[1]] * 10)
+
+
+def test_invalid_max_fused_qubits():
+    with pytest.raises(ValueError, match='max_fused_qubits'):
+        cirq.Simulator(max_fused_qubits=0)
+
+
+@pytest.mark.parametrize('block_qubits', [2, 3, 24])
+def test_memmap_simulation_matches_in_memory(tmpdir, block_qubits):
+    qubits = cirq.LineQubit.range(5)
+    circuit = cirq.testing.random_circuit(qubits, n_moments=15, op_density=0.8, random_state=1234)
+    expected = cirq.Simulator(dtype=np.complex128).simulate(circuit, qubit_order=qubits)
+    with mock.patch('cirq.sim.sparse_simulator._MEMMAP_BLOCK_QUBITS', new=block_qubits):
+        actual = cirq.Simulator(dtype=np.complex128, memmap_dir=str(tmpdir)).simulate(
+            circuit, qubit_order=qubits, initial_state=0
+        )
+    assert isinstance(actual.final_state_vector, np.memmap)
+    np.testing.assert_allclose(actual.final_state_vector, expected.final_state_vector, atol=1e-8)
+    # The backing files are unlinked as soon as they are created.
+    assert not tmpdir.listdir()
+
+
+def test_memmap_simulation_initial_state(tmpdir):
+    a, b = cirq.LineQubit.range(2)
+    simulator = cirq.Simulator(memmap_dir=str(tmpdir))
+    circuit = cirq.Circuit(cirq.X(a), cirq.I(b))
+    result = simulator.simulate(circuit, initial_state=1)
+    np.testing.assert_allclose(result.final_state_vector, [0, 0, 0, 1])
+    result = simulator.simulate(circuit, initial_state=np.array([0, 1, 0, 0]))
+    np.testing.assert_allclose(result.final_state_vector, [0, 0, 0, 1])
+    with pytest.raises(ValueError):
+        _ = simulator.simulate(circuit, initial_state=4)
+
+
+def test_memmap_simulation_with_measurements(tmpdir):
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.H(a),
+        cirq.CNOT(a, b),
+        cirq.measure(b, key='b'),
+        cirq.H(b),
+        cirq.CNOT(b, c),
+        cirq.measure(a, c, key='ac'),
+    )
+    with mock.patch('cirq.sim.sparse_simulator._MEMMAP_BLOCK_QUBITS', new=2):
+        result = cirq.Simulator(seed=1234, memmap_dir=str(tmpdir)).run(circuit, repetitions=100)
+    assert np.all(result.measurements['b'][:, 0] == result.measurements['ac'][:, 0])
+    assert 20 < np.sum(result.measurements['b']) < 80
+
+
+def test_memmap_args_copy(tmpdir):
+    simulator = cirq.Simulator(memmap_dir=str(tmpdir))
+    args = simulator._create_act_on_args(1, cirq.LineQubit.range(2))
+    copied = args.copy()
+    assert isinstance(copied.target_tensor, np.memmap)
+    assert isinstance(copied.available_buffer, np.memmap)
+    assert not np.may_share_memory(copied.target_tensor, args.target_tensor)
+    np.testing.assert_allclose(copied.target_tensor, args.target_tensor)
+
+
+def test_schedule_blocked_operations():
+    a, b, c, d = cirq.LineQubit.range(4)
+    circuit = cirq.Circuit(
+        cirq.H(c),
+        cirq.CNOT(a, b),
+        cirq.CZ(c, d),
+        cirq.CNOT(b, c),
+        cirq.T(d),
+        cirq.X(c),
+        cirq.measure(d, key='d'),
+        cirq.H(c),
+    )
+    scheduled = cirq.sim.sparse_simulator._schedule_blocked_operations(circuit, [c, d])
+    # H, CZ and T on c and d commute with the CNOTs deferred after them, so
+    # they form one group. X on c does not commute with the CNOT on b and c and
+    # starts a new group, which H on c joins past the measurement of d.
+    ops = [
+        op._decompose_() if isinstance(op, cirq.sim.sparse_simulator._BlockedOperations) else op
+        for op in scheduled.all_operations()
+    ]
+    assert ops == [
+        (cirq.H(c), cirq.CZ(c, d), cirq.T(d)),
+        cirq.CNOT(a, b),
+        cirq.CNOT(b, c),
+        cirq.measure(d, key='d'),
+        (cirq.X(c), cirq.H(c)),
+    ]
+    ops = list(scheduled.all_operations())
+    assert ops[0].qubits == (c, d)
+    assert cirq.has_unitary(ops[0])
+    moved = ops[0].with_qubits(a, b)
+    assert moved.qubits == (a, b)
+    assert moved._decompose_() == (cirq.H(a), cirq.CZ(a, b), cirq.T(b))
+    with pytest.raises(ValueError, match='Expected 2 qubits'):
+        _ = ops[0].with_qubits(a)
+    assert 'BlockedOperations' in repr(ops[0])
+
+
+def test_blocked_operations_fall_back_to_decomposition():
+    a, b, c = cirq.LineQubit.range(3)
+    op = cirq.sim.sparse_simulator._BlockedOperations([cirq.H(b), cirq.CNOT(b, c)], [b, c])
+    expected = cirq.final_state_vector(
+        cirq.Circuit(cirq.H(b), cirq.CNOT(b, c)), qubit_order=[c, b, a]
+    )
+    # The block qubits are not the last qubits of the state.
+    actual = cirq.final_state_vector(cirq.Circuit(op), qubit_order=[c, b, a])
+    np.testing.assert_allclose(actual, expected, atol=1e-6)
+    rho = cirq.final_density_matrix(cirq.Circuit(op), qubit_order=[a, b, c])
+    np.testing.assert_allclose(rho[0, 0], 0.5, atol=1e-6)
@@ -13,8 +13,9 @@
 # limitations under the License.
 """Resolves symbolic expressions to unique symbols."""
 
-from typing import overload, Any, Callable, List, Optional, Tuple, Union
+from typing import overload, Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import sympy
 
 from cirq import protocols
@@ -125,6 +126,10 @@ def flatten_with_sweep(
         different meaning also has the string `'x + 1'`, a number is appended to
         the name to avoid collision: `sympy.Symbol('<x + 1>_1')`.
 
+    Each expression is evaluated over the whole sweep at once with NumPy (see
+    `cirq.ExpressionMap.evaluate_sweep`), and the new sweep maps symbols to
+    plain numbers, so resolving the new value at its points avoids sympy.
+
     Args:
         val: The value to copy and substitute parameter expressions with
         flattened symbols.
@@ -342,14 +347,45 @@ class ExpressionMap(dict):
             sweep: The sweep to transform.
         """
         sweep = sweepable.to_sweep(sweep)
-        param_list = []
-        for r in sweep:
-            param_dict = {}
-            for formula, sym in self.items():
-                if isinstance(sym, (sympy.Symbol, str)):
-                    param_dict[str(sym)] = protocols.resolve_parameters(formula, r)
-            param_list.append(param_dict)
-        return sweeps.ListSweep(param_list)
+        values = self.evaluate_sweep(sweep)
+        names = list(values)
+        columns = [values[name].tolist() for name in names]
+        return sweeps.ListSweep([dict(zip(names, point)) for point in zip(*columns)])
+
+    def evaluate_sweep(
+        self, sweep: Union[sweeps.Sweep, List[resolver.ParamResolver]]
+    ) -> Dict[str, np.ndarray]:
+        """Evaluates every expression in this map at all points of a sweep.
+
+        Each expression is compiled once into a vectorized NumPy function and
+        evaluated over whole columns of sweep values, rather than resolved
+        with sympy at every point. Expressions that cannot be evaluated this
+        way, e.g. because the sweep assigns symbolic values or the result is
+        complex, fall back to `cirq.resolve_parameters` at each point.
+
+        Args:
+            sweep: The sweep over the symbols of the expressions.
+
+        Returns:
+            A dictionary from the name of each new symbol to an array with its
+            value at each point of the sweep.
+        """
+        sweep = sweepable.to_sweep(sweep)
+        columns = _sweep_columns(sweep)
+        values = {}
+        resolvers: Optional[List[resolver.ParamResolver]] = None
+        for formula, sym in self.items():
+            if not isinstance(sym, (sympy.Symbol, str)):
+                continue
+            column = None if columns is None else _evaluate_formula(formula, columns, len(sweep))
+            if column is None:
+                if resolvers is None:
+                    resolvers = list(sweep)
+                column = np.array(
+                    [protocols.resolve_parameters(formula, r) for r in resolvers], dtype=object
+                )
+            values[str(sym)] = column
+        return values
 
     def transform_params(
         self, params: resolver.ParamResolverOrSimilarType
@@ -378,6 +414,43 @@ class ExpressionMap(dict):
         return f'cirq.ExpressionMap({super_repr})'
 
 
+def _sweep_columns(sweep: sweeps.Sweep) -> Optional[Dict[str, np.ndarray]]:
+    """Returns the values of each symbol of a sweep as numeric arrays.
+
+    Returns None if some point does not assign every symbol a real number.
+    """
+    try:
+        columns = sweep.to_arrays()
+    except ValueError:
+        return None
+    if any(column.dtype.kind not in 'biuf' for column in columns.values()):
+        return None
+    return columns
+
+
+def _evaluate_formula(
+    formula: sympy.Basic, columns: Dict[str, np.ndarray], length: int
+) -> Optional[np.ndarray]:
+    """Evaluates a formula over columns of symbol values with NumPy.
+
+    Returns None if the formula is not a real function of the columns.
+    """
+    if not isinstance(formula, sympy.Basic):
+        return None
+    symbols = sorted(formula.free_symbols, key=str)
+    if any(symbol.name not in columns for symbol in symbols):
+        return None
+    try:
+        func = sympy.lambdify(symbols, formula, 'numpy')
+        with np.errstate(all='ignore'):
+            result = np.broadcast_to(func(*(columns[symbol.name] for symbol in symbols)), length)
+    except (TypeError, ValueError, NameError, AttributeError):
+        return None
+    if result.dtype.kind not in 'biuf' or not np.all(np.isfinite(result)):
+        return None
+    return result
+
+
 @overload
 def _ensure_not_str(param: Union[sympy.Basic, str]) -> sympy.Basic:
     pass
@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest import mock
+
+import numpy as np
+import pytest
 import sympy
+
 import cirq
 from cirq.study import flatten_expressions
 
@@ -169,6 +174,50 @@ def test_transformed_sweep():
     assert params[1] == (('x0', 1 / 4), ('x1', 1 - 1 / 2))
 
 
+def test_evaluate_sweep():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    expr_map = cirq.ExpressionMap({a: a, a / 4: 'x0', sympy.sin(a) * b + 1: 'x1'})
+    sweep = cirq.Linspace(a, start=0, stop=3, length=4) * cirq.Points('b', [1, 2])
+
+    values = expr_map.evaluate_sweep(sweep)
+    assert list(values) == ['a', 'x0', 'x1']
+    for i, resolver in enumerate(sweep):
+        for formula, sym in expr_map.items():
+            expected = cirq.resolve_parameters(formula, resolver)
+            assert np.isclose(values[str(sym)][i], expected)
+
+
+def test_evaluate_sweep_does_not_call_sympy_per_point():
+    a = sympy.Symbol('a')
+    expr_map = cirq.ExpressionMap({sympy.cos(a) ** 2 - a / 3: 'x'})
+    sweep = cirq.Linspace(a, start=0, stop=1, length=1000)
+    with mock.patch.object(
+        cirq.ParamResolver, 'value_of', side_effect=AssertionError('resolved with sympy')
+    ):
+        values = expr_map.evaluate_sweep(sweep)
+    np.testing.assert_allclose(
+        values['x'], np.cos(np.linspace(0, 1, 1000)) ** 2 - np.linspace(0, 1, 1000) / 3
+    )
+
+
+@pytest.mark.parametrize(
+    'formula, sweep',
+    [
+        # Not every symbol is swept.
+        (sympy.Symbol('a') + sympy.Symbol('b'), cirq.Points('a', [1, 2])),
+        # The sweep assigns symbolic values.
+        (sympy.Symbol('a') / 2, cirq.ListSweep([{'a': 1}, {'a': sympy.Symbol('b')}])),
+        # The points of the sweep assign different symbols.
+        (sympy.Symbol('a') / 2, cirq.ListSweep([{'a': 1}, {'b': 2}])),
+        # The formula has complex values.
+        (sympy.I * sympy.Symbol('a'), cirq.Points('a', [1, 2])),
+    ],
+)
+def test_evaluate_sweep_falls_back_to_resolve_parameters(formula, sweep):
+    values = cirq.ExpressionMap({formula: 'x'}).evaluate_sweep(sweep)
+    assert list(values['x']) == [cirq.resolve_parameters(formula, r) for r in sweep]
+
+
 def test_transformed_sweep_equality():
     a = sympy.Symbol('a')
     sweep = cirq.Linspace('a', start=0, stop=3, length=4)
@@ -28,6 +28,9 @@ from typing import (
 import abc
 import collections
 import itertools
+import numbers
+
+import numpy as np
 import sympy
 
 from cirq._doc import document
@@ -128,27 +131,86 @@ class Sweep(metaclass=abc.ABCMeta):
 
     def __getitem__(self, val):
         n = len(self)
-        if isinstance(val, int):
+        if isinstance(val, (int, np.integer)):
             if val < -n or val >= n:
                 raise IndexError(f'sweep index out of range: {val}')
             if val < 0:
                 val += n
-            return next(itertools.islice(self, val, val + 1))
+            return resolver.ParamResolver(collections.OrderedDict(self._param_tuple_at(int(val))))
         if not isinstance(val, slice):
             raise TypeError(f'Sweep indices must be either int or slices, not {type(val)}')
 
-        inds_map: Dict[int, int] = {
-            sweep_i: slice_i for slice_i, sweep_i in enumerate(range(n)[val])
-        }
-        results = [resolver.ParamResolver()] * len(inds_map)
-        for i, item in enumerate(self):
-            if i in inds_map:
-                results[inds_map[i]] = item
-
-        return ListSweep(results)
+        indices = range(n)[val]
+        if self._has_point_access():
+            points: Iterable[Params] = (self._param_tuple_at(i) for i in indices)
+        elif not indices:
+            points = ()
+        elif indices.step > 0:
+            points = itertools.islice(
+                self.param_tuples(), indices.start, indices.stop, indices.step
+            )
+        else:
+            # Reversed slices read the window they span once, then reorder it.
+            low = indices[-1]
+            window = list(itertools.islice(self.param_tuples(), low, indices[0] + 1))
+            points = (window[i - low] for i in indices)
+        return ListSweep(resolver.ParamResolver(collections.OrderedDict(p)) for p in points)
 
     # pylint: enable=function-redefined
 
+    def chunks(self, chunk_size: int) -> Iterator['Sweep']:
+        """Splits the sweep into consecutive sweeps of at most `chunk_size` points.
+
+        Only the points of the chunk being produced are materialized, so this
+        can be used to shard a long sweep across workers.
+
+        Args:
+            chunk_size: The maximum number of points per chunk.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be positive, got {chunk_size}.')
+        n = len(self)
+        if self._has_point_access():
+            for start in range(0, n, chunk_size):
+                yield self[start : start + chunk_size]
+            return
+        # Without direct access to points, read the points once, in order.
+        points = self.param_tuples()
+        for start in range(0, n, chunk_size):
+            yield ListSweep(
+                resolver.ParamResolver(collections.OrderedDict(p))
+                for p in itertools.islice(points, min(chunk_size, n - start))
+            )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Returns the value of each parameter at every point of the sweep.
+
+        The columns are computed directly from the sweep's description where
+        possible, without creating a `cirq.ParamResolver` per point.
+
+        Returns:
+            A dictionary from the name of each parameter to an array of its
+            values, in sweep order.
+        """
+        names = [_key_name(key) for key in self.keys]
+        points = list(itertools.islice(self.param_tuples(), len(self)))
+        return {name: _as_column([point[i][1] for point in points]) for i, name in enumerate(names)}
+
+    def _param_tuple_at(self, index: int) -> Tuple[Tuple['cirq.TParamKey', 'cirq.TParamVal'], ...]:
+        """Returns the (key, value) pairs of the point at a non-negative index.
+
+        Sweeps that can compute a point directly should override this so that
+        indexing does not iterate over the preceding points.
+        """
+        return tuple(next(itertools.islice(self.param_tuples(), index, None)))
+
+    def _has_point_access(self) -> bool:
+        """Whether `_param_tuple_at` computes a point without iterating."""
+        return type(self)._param_tuple_at is not Sweep._param_tuple_at
+
     @abc.abstractmethod
     def param_tuples(self) -> Iterator[Params]:
         """An iterator over (key, value) pairs assigning Symbol key to value."""
@@ -193,6 +255,12 @@ class _Unit(Sweep):
     def param_tuples(self) -> Iterator[Params]:
         yield ()
 
+    def _param_tuple_at(self, index: int) -> Tuple[Tuple['cirq.TParamKey', 'cirq.TParamVal'], ...]:
+        return ()
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {}
+
     def __repr__(self) -> str:
         return 'cirq.UnitSweep'
 
@@ -246,6 +314,29 @@ class Product(Sweep):
 
         return _gen(self.factors)
 
+    def _has_point_access(self) -> bool:
+        return all(factor._has_point_access() for factor in self.factors)
+
+    def _param_tuple_at(self, index: int) -> Tuple[Tuple['cirq.TParamKey', 'cirq.TParamVal'], ...]:
+        # The last factor varies fastest.
+        params: Tuple[Tuple['cirq.TParamKey', 'cirq.TParamVal'], ...] = ()
+        for factor in reversed(self.factors):
+            index, factor_index = divmod(index, len(factor))
+            params = factor._param_tuple_at(factor_index) + params
+        return params
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        arrays: Dict[str, np.ndarray] = {}
+        lengths = [len(factor) for factor in self.factors]
+        for i, factor in enumerate(self.factors):
+            # Each value repeats once per point of the later factors, and the
+            # whole column repeats once per point of the earlier factors.
+            inner = int(np.prod(lengths[i + 1 :], dtype=np.int64))
+            outer = int(np.prod(lengths[:i], dtype=np.int64))
+            for name, column in factor.to_arrays().items():
+                arrays[name] = np.tile(np.repeat(column, inner), outer)
+        return arrays
+
     def __repr__(self) -> str:
         factors_repr = ', '.join(repr(f) for f in self.factors)
         return f'cirq.Product({factors_repr})'
@@ -302,6 +393,18 @@ class Zip(Sweep):
         for values in zip(*iters):
             yield sum(values, ())
 
+    def _has_point_access(self) -> bool:
+        return all(sweep._has_point_access() for sweep in self.sweeps)
+
+    def _param_tuple_at(self, index: int) -> Tuple[Tuple['cirq.TParamKey', 'cirq.TParamVal'], ...]:
+        return sum((sweep._param_tuple_at(index) for sweep in self.sweeps), ())
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        n = len(self)
+        return {
+            name: column[:n] for sweep in self.sweeps for name, column in sweep.to_arrays().items()
+        }
+
     def __repr__(self) -> str:
         sweeps_repr = ', '.join(repr(s) for s in self.sweeps)
         return f'cirq.Zip({sweeps_repr})'
@@ -340,6 +443,9 @@ class SingleSweep(Sweep):
         for value in self._values():
             yield ((self.key, value),)
 
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        return {_key_name(self.key): _as_column(list(self._values()))}
+
     @abc.abstractmethod
     def _values(self) -> Iterator[float]:
         pass
@@ -361,6 +467,9 @@ class Points(SingleSweep):
     def _values(self) -> Iterator[float]:
         return iter(self.points)
 
+    def _param_tuple_at(self, index: int) -> Tuple[Tuple['cirq.TParamKey', 'cirq.TParamVal'], ...]:
+        return ((self.key, self.points[index]),)
+
     def __repr__(self) -> str:
         return f'cirq.Points({self.key!r}, {self.points!r})'
 
@@ -393,6 +502,18 @@ class Linspace(SingleSweep):
                 p = i / (self.length - 1)
                 yield self.start * (1 - p) + self.stop * p
 
+    def _param_tuple_at(self, index: int) -> Tuple[Tuple['cirq.TParamKey', 'cirq.TParamVal'], ...]:
+        if self.length == 1:
+            return ((self.key, self.start),)
+        p = index / (self.length - 1)
+        return ((self.key, self.start * (1 - p) + self.stop * p),)
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        if self.length == 1:
+            return {_key_name(self.key): _as_column([self.start])}
+        p = np.arange(self.length) / (self.length - 1)
+        return {_key_name(self.key): self.start * (1 - p) + self.stop * p}
+
     def __repr__(self) -> str:
         return (
             f'cirq.Linspace({self.key!r}, start={self.start!r}, '
@@ -440,10 +561,41 @@ class ListSweep(Sweep):
         for r in self.resolver_list:
             yield tuple(_params_without_symbols(r))
 
+    def _param_tuple_at(self, index: int) -> Tuple[Tuple['cirq.TParamKey', 'cirq.TParamVal'], ...]:
+        return tuple(_params_without_symbols(self.resolver_list[index]))
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """See `cirq.Sweep.to_arrays`.
+
+        Raises:
+            ValueError: If the resolvers do not all assign the same parameters.
+        """
+        columns: Dict[str, List['cirq.TParamVal']] = {name: [] for name in self.keys}
+        for r in self.resolver_list:
+            params = dict(_params_without_symbols(r))
+            if params.keys() != columns.keys():
+                raise ValueError(f'Resolvers assign different parameters: {r!r}')
+            for name, value in params.items():
+                columns[name].append(value)
+        return {name: _as_column(column) for name, column in columns.items()}
+
     def __repr__(self) -> str:
         return f'cirq.ListSweep({self.resolver_list!r})'
 
 
+def _key_name(key: 'cirq.TParamKey') -> str:
+    return key.name if isinstance(key, sympy.Symbol) else str(key)
+
+
+def _as_column(values: List['cirq.TParamVal']) -> np.ndarray:
+    """Returns a numeric array of the values, or an object array if some are symbolic."""
+    if all(isinstance(v, numbers.Number) and not isinstance(v, sympy.Basic) for v in values):
+        return np.array(values)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
 def _params_without_symbols(resolver: resolver.ParamResolver) -> Params:
     for sym, val in resolver.param_dict.items():
         if isinstance(sym, sympy.Symbol):
@@ -11,8 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from unittest import mock
+
+import numpy as np
 import pytest
 import sympy
+
 import cirq
 
 
@@ -134,6 +138,103 @@ def test_access_sweep():
     assert sixth_elem == cirq.ParamResolver({'a': 2, 'b': 5})
 
 
+@pytest.mark.parametrize(
+    'sweep',
+    [
+        cirq.UnitSweep,
+        cirq.Points('a', [1, 2, 3]),
+        cirq.Linspace(sympy.Symbol('a'), 0, 1, 4),
+        cirq.Linspace('a', 2, 3, 1),
+        cirq.Points('a', [1, 2]) * cirq.Linspace('b', 0, 1, 3) * cirq.Points('c', [5, 6, 7]),
+        cirq.Points('a', [1, 2, 3]) + cirq.Linspace('b', 0, 1, 2),
+        (cirq.Points('a', [1, 2]) + cirq.Points('b', [3, 4, 5])) * cirq.Points('c', [0, 1]),
+        cirq.ListSweep([{'a': 1, 'b': 2.5}, {'a': 3, 'b': sympy.Symbol('x')}]),
+    ],
+)
+def test_random_access_and_arrays_match_iteration(sweep):
+    resolvers = list(sweep)
+    with mock.patch.object(type(sweep), 'param_tuples', side_effect=AssertionError('iterated')):
+        assert [sweep[i] for i in range(len(sweep))] == resolvers
+        assert [sweep[i] for i in range(-len(sweep), 0)] == resolvers
+        sliced = sweep[::-2]
+        chunks = list(sweep.chunks(2))
+        arrays = sweep.to_arrays()
+    assert list(sliced) == resolvers[::-2]
+    assert [r for chunk in chunks for r in chunk] == resolvers
+    assert list(arrays) == [str(key) for key in sweep.keys]
+    for name, column in arrays.items():
+        assert list(column) == [r.value_of(name) for r in resolvers]
+
+
+def test_to_arrays_columns_are_numeric():
+    sweep = cirq.Linspace('a', 0, 1, 5) * cirq.Points('b', [1, 2])
+    arrays = sweep.to_arrays()
+    assert arrays['a'].dtype == np.float64
+    assert arrays['b'].dtype.kind == 'i'
+    assert cirq.Points('a', [sympy.Symbol('x')]).to_arrays()['a'].dtype == object
+
+
+def test_to_arrays_of_custom_sweep():
+    class Custom(cirq.Sweep):
+        def __eq__(self, other):
+            return NotImplemented  # coverage: ignore
+
+        @property
+        def keys(self):
+            return ['a']
+
+        def __len__(self):
+            return 3
+
+        def param_tuples(self):
+            for i in range(3):
+                yield (('a', i * 2),)
+
+    np.testing.assert_array_equal(Custom().to_arrays()['a'], [0, 2, 4])
+    assert Custom()[2] == cirq.ParamResolver({'a': 4})
+
+
+def test_slices_and_chunks_of_custom_sweep_iterate_once():
+    class Custom(cirq.Sweep):
+        iterations = 0
+
+        def __eq__(self, other):
+            return NotImplemented  # coverage: ignore
+
+        @property
+        def keys(self):
+            return ['a']
+
+        def __len__(self):
+            return 5
+
+        def param_tuples(self):
+            Custom.iterations += 1
+            for i in range(5):
+                yield (('a', i),)
+
+    for sweep in [Custom(), Custom() * cirq.Points('b', [0])]:
+        values = [r.value_of('a') for r in sweep]
+        for val in [slice(1, 5, 2), slice(None, None, -2), slice(4, 1, -1), slice(3, 3)]:
+            Custom.iterations = 0
+            assert [r.value_of('a') for r in sweep[val]] == values[val]
+            assert Custom.iterations == (1 if values[val] else 0)
+        Custom.iterations = 0
+        chunks = [[r.value_of('a') for r in chunk] for chunk in sweep.chunks(2)]
+        assert chunks == [[0, 1], [2, 3], [4]]
+        assert Custom.iterations == 1
+
+
+def test_list_sweep_to_arrays_needs_same_keys():
+    with pytest.raises(ValueError, match='different parameters'):
+        cirq.ListSweep([{'a': 1}, {'b': 2}]).to_arrays()
+
+
+def test_chunks_error():
+    with pytest.raises(ValueError, match='chunk_size'):
+        _ = list(cirq.Points('a', [1, 2]).chunks(0))
+
+
 @pytest.mark.parametrize(
     'r_list',
     [
@@ -1,3 +1,4 @@
+import concurrent.futures
 from typing import (
     Any,
     Callable,
@@ -447,9 +448,14 @@ class PhasedFSimEngineSimulator(cirq.SimulatesIntermediateStateVector[cirq.Spars
         program: cirq.AbstractCircuit,
         params: cirq.Sweepable,
         repetitions: int = 1,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: Optional[int] = None,
     ) -> Iterator[cirq.Result]:
         converted = _convert_to_circuit_with_drift(self, program)
-        yield from self._simulator.run_sweep_iter(converted, params, repetitions)
+        yield from self._simulator.run_sweep_iter(
+            converted, params, repetitions, executor=executor, max_workers=max_workers
+        )
 
     def simulate(
         self,
@@ -147,7 +147,6 @@ def optimized_for_sycamore(
     Returns:
         The optimized circuit.
     """
-    copy = circuit.copy()
     if optimizer_type not in _OPTIMIZER_TYPES:
         raise ValueError(
             f'{optimizer_type} is not an allowed type.  Allowed '
@@ -159,8 +158,7 @@ def optimized_for_sycamore(
         tabulation = _gate_product_tabulation_cached(optimizer_type, tabulation_resolution)
 
     opts = _OPTIMIZER_TYPES[optimizer_type](tolerance=tolerance, tabulation=tabulation)
-    for optimizer in opts:
-        optimizer(copy)
+    copy = cirq.OptimizationPipeline(opts)(circuit)
 
     return cirq.Circuit(
         (op.transform_qubits(qubit_map) for op in copy.all_operations()),